@@ -0,0 +1,125 @@
+# base/attachment_policy.py
+import os
+import gzip
+import shutil
+import tempfile
+from pathlib import Path
+
+import allure
+
+from base.lighthouse_runner import LighthouseRunner
+
+
+class AttachmentPolicy:
+    """
+    Decides how a run's HTML report ends up in allure-results.
+
+    MODE
+      full    – read the report into memory and attach it (old behaviour)
+      path    – allure.attach.file(): allure copies the file, Python never reads it
+      gzip    – attach a gzip-compressed copy (.html.gz, application/gzip)
+      failing – full report (by path) only for failing / abnormal runs,
+                a one-row score summary for every other run
+
+    BUDGET_MB caps the report bytes attached in one session (compressed
+    bytes in gzip mode); once it is spent, runs fall back to the score summary.
+    xdist workers share it through a ledger file – one line per attachment,
+    appended with O_APPEND – named by LH_ATTACH_LEDGER (set by conftest.py);
+    without it the budget is per process. Workers check the ledger before
+    appending, so the reports in flight may overshoot it by a few.
+    """
+
+    MODES = ("full", "path", "gzip", "failing")
+
+    def __init__(self, mode: str = "full", budget_mb: float = None, ledger=None):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown attachment mode: {mode}")
+        self.mode = mode
+        self.budget = int(budget_mb * 1024 * 1024) if budget_mb else None
+        self.ledger = Path(ledger) if ledger else None
+        self.used = 0  # bytes attached by this process
+        self.skipped = 0
+
+    @staticmethod
+    def from_config(cfg: dict):
+        att = cfg.get("ATTACHMENTS", {})
+        return AttachmentPolicy(att.get("MODE", "full"), att.get("BUDGET_MB"), os.environ.get("LH_ATTACH_LEDGER"))
+
+    def spent(self):
+        """Bytes attached in this session – every process's, when they share a ledger."""
+        if self.ledger is None:
+            return self.used
+        try:
+            return sum(int(line) for line in self.ledger.read_text(encoding="utf-8").split())
+        except FileNotFoundError:
+            return 0
+
+    def _fits(self, size: int):
+        return self.budget is None or self.spent() + size <= self.budget
+
+    def _spend(self, size: int):
+        self.used += size
+        if self.ledger is not None and self.budget is not None:
+            # single small O_APPEND write – safe with parallel writers
+            with open(self.ledger, "a", encoding="utf-8") as f:
+                f.write(f"{size}\n")
+
+    @staticmethod
+    def _gzip(html_path):
+        fd, gz_path = tempfile.mkstemp(suffix=".html.gz")
+        with open(html_path, "rb") as src, os.fdopen(fd, "wb") as raw, \
+                gzip.GzipFile(fileobj=raw, mode="wb") as dst:
+            shutil.copyfileobj(src, dst)
+        return gz_path
+
+    @staticmethod
+    def summary_html(run):
+        s = run["scores"]
+        return (
+            f"<p>Run {run['run']}: Performance <b>{s['Performance']}</b> · "
+            f"Accessibility {s['Accessibility']} · BestPractices {s['BestPractices']} · "
+            f"SEO {s['SEO']}</p>"
+        )
+
+    def attach_run(self, run, name: str, important: bool):
+        """important: the run failed or was flagged by detect_abnormal."""
+        wants_full = self.mode != "failing" or important
+        html_path = None
+        if wants_full:
+            # Not rendered yet (stdout pipeline): the JSON's size is close enough for the budget
+            size = os.path.getsize(run["html"] if os.path.exists(run["html"]) else run["json"])
+            # gzip: budgeted on the compressed size, known only once compressed
+            if self.mode == "gzip" or self._fits(size):
+                html_path = LighthouseRunner.ensure_html(run)  # rendered now – only runs that get attached
+                size = os.path.getsize(html_path) if html_path else size
+
+        gz_path = None
+        if html_path is not None and self.mode == "gzip":
+            gz_path = self._gzip(html_path)
+            size = os.path.getsize(gz_path)
+            if not self._fits(size):
+                os.unlink(gz_path)
+                html_path = None
+
+        if html_path is None:
+            if wants_full:
+                self.skipped += 1
+            allure.attach(self.summary_html(run), f"{name} (summary)", allure.attachment_type.HTML)
+            return
+        html_path = str(html_path)
+
+        if self.mode == "full":
+            with open(html_path, "rb") as f:
+                allure.attach(f.read(), name, allure.attachment_type.HTML)
+            self._spend(size)
+
+        elif self.mode == "gzip":
+            try:
+                allure.attach.file(gz_path, name, attachment_type="application/gzip", extension="html.gz")
+            finally:
+                os.unlink(gz_path)
+            self._spend(size)
+
+        else:  # "path" / "failing"
+            allure.attach.file(html_path, name, allure.attachment_type.HTML)
+            self._spend(size)
@@ -1,8 +1,27 @@
 
 import allure
+from base.attachment_policy import AttachmentPolicy
+from base.lighthouse_runner import LighthouseRunner
+from base.lighthouse_session import LighthouseSession
+from base.result_cache import ResultCache
+from utils.artifact_store import ArtifactStore
 from utils.config_reader import ConfigReader
+from utils.report_slimmer import ReportSlimmer
+from utils.replay_store import ReplayStore
+from utils.report_store import ReportStore
+from utils.report_diff import ReportDiff, TOP_ITEMS
+from utils.report_reader import ReportReader
+from utils.history_db import HistoryDB, SCORE_COLUMNS, METRIC_COLUMNS
+from utils.run_result import RunResult, SCORE_KEYS, METRIC_KEYS
+from utils.run_stats import RunStats, OUTLIER_Z
+from utils.run_validation import RunValidator
+from utils.tracing import TRACER
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import time
 import shutil
+import asyncio
+import subprocess
 
 class BaseTest:
     # ------------------------------------------------------
@@ -42,31 +61,310 @@ class BaseTest:
         else:
             allure.dynamic.severity(allure.severity_level.NORMAL)
 
+    # ------------------------------------------------------
+    # Helper: run every page x runs on the worker pool
+    # ------------------------------------------------------
+    def run_pages(self, brand, mode, pages, runs, workers=1, sampler=None, session=None, view="cold"):
+        """
+        Returns ({page_name: run_results}, {page_name: [error, ...]}, RunStats) –
+        the statistics of every page, computed in one pass for all consumers.
+        session: shared LighthouseSession (warm workers); a temporary one is
+        created and closed when omitted.
+        view: "cold" or "warm" (repeat view) – warm reports go to reports_<mode>-warm/
+        """
+        results = {page_name: [] for _, page_name in pages}
+        errors = {}
+        urls = {page_name: url for url, page_name in pages}
+        label = LighthouseRunner.view_label(mode, view)
+
+        # Replay: pages are audited from a local recording – repeatable, so
+        # REPLAY.RUNS each, no adaptive sampling and no live-page cache
+        replay = ReplayStore.from_config(getattr(self, "cfg", {}))
+        if replay is not None:
+            sampler, runs = None, replay.runs
+
+        # Fixed run count, or sampler.min_runs first and then top up only
+        # the pages whose confidence interval is still too wide
+        pending = {page_name: sampler.min_runs if sampler else runs for page_name in results}
+
+        # Unchanged pages (same fingerprint, flags, Lighthouse version) reuse
+        # their cached runs instead of being audited again
+        cache = ResultCache.from_config(getattr(self, "cfg", {})) if replay is None else None
+        cache_keys = {}
+        if cache is not None:
+            with TRACER.span("cache.lookup", brand=brand, mode=mode):
+                with ThreadPoolExecutor(max_workers=8) as pool:
+                    keys = pool.map(lambda p: cache.page_key(urls[p], mode, view), results)
+                    cache_keys = dict(zip(results, keys))
+
+                for page_name, key in cache_keys.items():
+                    cached = key and cache.get(key, lambda i: f"reports_{label}/{brand}/run_{i}")
+                    if cached:
+                        results[page_name] = cached
+                        pending[page_name] = 0
+
+        # Gathered artifacts kept per run – re-audits without a page load (base/reaudit.py)
+        artifacts = ArtifactStore.from_config(getattr(self, "cfg", {}))
+
+        own_session = session is None
+        if own_session:
+            session = LighthouseSession.from_config(getattr(self, "cfg", {}), workers)
+
+        # Slow-host runs each page may still have re-run (HOST_LOAD.RESCHEDULE),
+        # and invalid runs (VALIDATION.RETRIES)
+        reschedules = {page_name: session.governor.reschedule if session.governor else 0 for page_name in results}
+        validator = RunValidator.from_config(getattr(self, "cfg", {}))
+        retries = {page_name: validator.retries for page_name in results}
+
+        try:
+            replay_jobs = {}
+            if replay is not None:
+                replay_jobs = self.prepare_replay(brand, mode, urls, replay, session, errors)
+                pending = {page_name: count for page_name, count in pending.items() if page_name in replay_jobs}
+
+            rejected = {}
+            while any(pending.values()) or any(rejected.values()):
+                jobs = []
+                for page_name in results:
+                    # Rejected runs keep their number – their report files were removed
+                    retry = sorted(rejected.get(page_name, []))
+                    first = max([r["run"] for r in results[page_name]] + retry, default=0) + 1
+                    jobs += [
+                        {
+                            "url": urls[page_name],
+                            "brand": brand,
+                            "mode": mode,
+                            "page_name": page_name,
+                            "run": i,
+                            "view": view,
+                            "report_dir": f"reports_{label}/{brand}/run_{i}",
+                            **({"replay": replay_jobs[page_name]} if page_name in replay_jobs else {}),
+                            **({"flags": ArtifactStore.flags(artifacts.run_dir(label, brand, page_name, i))}
+                               if artifacts else {}),
+                        }
+                        for i in [*retry, *range(first, first + pending.get(page_name, 0))]
+                    ]
+
+                rejected = asyncio.run(self.collect_runs(jobs, results, errors, session, reschedules, retries))
+                rejected = {page_name: runs for page_name, runs in rejected.items() if page_name not in errors}
+
+                # Pages with a failed run are not topped up any further; pages
+                # waiting for a rescheduled run are sampled again once it is in
+                pending = {
+                    page_name: sampler.runs_needed(run_results) if sampler else 0
+                    for page_name, run_results in results.items()
+                    if not self.is_cached(run_results) and page_name not in errors and run_results
+                    and page_name not in rejected
+                }
+
+            if artifacts is not None:
+                for page_name, run_results in results.items():
+                    for r in run_results:
+                        if not r.get("cached"):
+                            artifacts.commit(label, brand, page_name, r["run"], urls[page_name], mode, view,
+                                             r["lighthouse_version"])
+        finally:
+            if own_session:
+                session.close()
+
+        for page_name, run_results in results.items():
+            run_results.sort(key=lambda r: r["run"])
+            if cache_keys.get(page_name) and run_results and not self.is_cached(run_results) \
+                    and page_name not in errors:
+                cache.put(cache_keys[page_name], run_results)
+
+        with TRACER.span("stats", brand=brand, mode=mode):
+            stats = RunStats(results)
+        return results, errors, stats
+
+    def prepare_replay(self, brand, mode, urls, replay, session, errors):
+        """
+        Records the pages that have no (fresh) recording, then returns
+        {page_name: job "replay" entry} for every page that can be replayed.
+        """
+        entries = replay.entries()
+        actions = {page_name: replay.action_for(url, mode, entries) for page_name, url in urls.items()}
+
+        to_record = [page_name for page_name, action in actions.items() if action == "record"]
+        if to_record:
+            recorded = {page_name: [] for page_name in to_record}
+            jobs = [
+                {
+                    "url": urls[page_name],
+                    "brand": brand,
+                    "mode": mode,
+                    "page_name": page_name,
+                    "run": 0,
+                    "report_dir": f"reports_{mode}/{brand}/record",
+                    "replay": {"action": "record", "archive": str(replay.recording_path(urls[page_name], mode))},
+                }
+                for page_name in to_record
+            ]
+            asyncio.run(self.collect_runs(jobs, recorded, errors, session))
+
+            for page_name, run_results in recorded.items():
+                # The recording run itself hit the live site – not used for the verdict
+                for r in run_results:
+                    for path in (r["json"], r["html"]):
+                        Path(path).unlink(missing_ok=True)
+                actions[page_name] = None
+                if not run_results:
+                    continue
+                try:
+                    replay.commit(urls[page_name], mode)
+                except FileNotFoundError as e:
+                    # wpr exited without writing the archive – this page only
+                    errors.setdefault(page_name, []).append(f"recording failed: {e}")
+                    continue
+                actions[page_name] = "replay"
+
+        replay_jobs = {}
+        for page_name, action in actions.items():
+            if action == "replay":
+                replay_jobs[page_name] = {"action": "replay", "archive": str(replay.archive_path(urls[page_name], mode))}
+            elif page_name not in errors:
+                errors[page_name] = [f"no recording for {urls[page_name]} [{mode}] – REPLAY.MODE is '{replay.mode}'"]
+        return replay_jobs
+
+    _session_deadline = None
+
+    def session_deadline(self):
+        # Absolute time.monotonic() deadline shared by every test in this process
+        session_seconds = getattr(self, "cfg", {}).get("TIMEOUTS", {}).get("SESSION_SECONDS")
+        if session_seconds and BaseTest._session_deadline is None:
+            BaseTest._session_deadline = time.monotonic() + session_seconds
+        return BaseTest._session_deadline
+
+    async def collect_runs(self, jobs, results, errors, session, reschedules=None, retries=None):
+        """
+        Appends every valid run to results[page_name]. Returns
+        {page_name: [run, ...]} – runs dropped to be run again: invalid
+        transient / infrastructure runs while retries[page_name] allows, and
+        runs on a too slow host (session.governor) while reschedules[page_name]
+        allows. Page-level invalid runs end up in errors.
+        """
+        timeouts = getattr(self, "cfg", {}).get("TIMEOUTS", {})     # per-run timeout + retries
+        governor = session.governor
+        validator = RunValidator.from_config(getattr(self, "cfg", {}))
+        rejected = {}
+
+        async for res in session.run_many(
+            jobs,
+            timeout=timeouts.get("RUN_SECONDS"),
+            retries=timeouts.get("RETRIES", 0),
+            backoff=timeouts.get("BACKOFF_SECONDS", 2.0),
+            deadline=self.session_deadline(),
+        ):
+            if res["error"] is not None:
+                e = res["error"]
+                reason = f"lighthouse exit code {e.returncode}" if isinstance(e, subprocess.CalledProcessError) else e
+                errors.setdefault(res["page_name"], []).append(f"run {res['run']}: {reason}")
+                continue
+
+            with TRACER.span("parse", brand=res.get("brand"), page=res["page_name"], mode=res["mode"], run=res["run"]):
+                # stdout pipeline: parse the bytes Lighthouse printed, no re-read
+                summary = LighthouseRunner.parse_summary(res["report"] or res["json"], timing=TRACER.enabled)
+                timing = summary.pop("timing", None)
+                run_result = RunResult(
+                    run=res["run"],
+                    json=res["json"],
+                    html=res["html"],
+                    host_load=res.get("host_load"),
+                    **summary,
+                )
+            # Lighthouse's own stages (page load, audit …) from the same read
+            TRACER.record_lhr_stages(res.get("started_us"), timing, brand=res.get("brand"),
+                                     page=res["page_name"], mode=res["mode"], run=res["run"], worker=res["worker"])
+
+            # Invalid run (runtimeError, untrustworthy warning, null score): never a sample
+            invalid = validator.classify(run_result)
+            if invalid:
+                group, reason = invalid
+                if validator.retryable(group) and retries and retries.get(res["page_name"], 0) > 0:
+                    retries[res["page_name"]] -= 1
+                    rejected.setdefault(res["page_name"], []).append(res["run"])
+                    self.discard_run(res)
+                    allure.attach(
+                        f"Run {res['run']} is invalid ({group}) – {reason}. "
+                        f"Re-running it, {retries[res['page_name']]} retries left for this page.",
+                        f"♻️ Invalid run - {res['page_name']} run {res['run']}",
+                        allure.attachment_type.TEXT,
+                    )
+                elif validator.retryable(group):
+                    # Out of retries: the verdict rests on the valid runs left
+                    self.discard_run(res)
+                    allure.attach(
+                        f"Run {res['run']} is invalid ({group}) – {reason}. No retries left, run dropped.",
+                        f"🚫 Invalid run - {res['page_name']} run {res['run']}",
+                        allure.attachment_type.TEXT,
+                    )
+                else:
+                    # Page-level: re-running won't help; report files stay for a look
+                    errors.setdefault(res["page_name"], []).append(f"run {res['run']}: {group} error – {reason}")
+                continue
+
+            # Slow host: the score says more about the machine than the page
+            slow = governor and governor.observe(run_result.benchmark_index, run_result.host_load)
+            if slow and reschedules and reschedules.get(res["page_name"], 0) > 0:
+                reschedules[res["page_name"]] -= 1
+                rejected.setdefault(res["page_name"], []).append(res["run"])
+                self.discard_run(res)
+                allure.attach(
+                    f"Run {res['run']} rejected and rescheduled – {slow}. Worker limit now {governor.limit}.",
+                    f"🐢 Slow host - {res['page_name']} run {res['run']}",
+                    allure.attachment_type.TEXT,
+                )
+                continue
+
+            results[res["page_name"]].append(run_result)
+
+        return rejected
+
+    @staticmethod
+    def discard_run(res):
+        for path in (res["json"], res["html"]):
+            Path(path).unlink(missing_ok=True)
+
+    @staticmethod
+    def is_cached(run_results):
+        return any(r.get("cached") for r in run_results)
+
+    # ------------------------------------------------------
+    # Helper: robust verdict – median over all runs
+    # ------------------------------------------------------
+    def verdict_scores(self, stats, page_name):
+        medians = stats.medians(page_name)
+        return {k: medians[k] for k in SCORE_KEYS}
+
     # ------------------------------------------------------
     # Helper: attach all HTML reports
     # ------------------------------------------------------
-    def attach_all_runs(self, brand, mode, page_name, run_results):
+    _attachment_policy = None
+
+    def get_attachment_policy(self):
+        # One policy per process; BUDGET_MB is shared with the other xdist workers (LH_ATTACH_LEDGER)
+        if BaseTest._attachment_policy is None:
+            BaseTest._attachment_policy = AttachmentPolicy.from_config(getattr(self, "cfg", {}))
+        return BaseTest._attachment_policy
+
+    def attach_all_runs(self, brand, mode, page_name, run_results, is_pass=True, abnormal_runs=()):
+        policy = self.get_attachment_policy()
+
         for r in run_results:
-            with open(r["html"], "rb") as f:
-                allure.attach(
-                    f.read(),
+            with TRACER.span("attach", brand=brand, page=page_name, mode=mode, run=r["run"]):
+                policy.attach_run(
+                    r,
                     f"[RUN {r['run']}] {brand.upper()} {mode.capitalize()} - {page_name}",
-                    allure.attachment_type.HTML
+                    important=not is_pass or r in abnormal_runs,
                 )
 
     # ------------------------------------------------------
     # Helper: detect abnormal drop >20%
     # ------------------------------------------------------
-    def detect_abnormal(self, run_results):
-        perf_values = [r["scores"]["Performance"] for r in run_results]
-        mean_perf = sum(perf_values) / len(perf_values)
-
-        abnormal = [
-            r for r in run_results
-            if abs(r["scores"]["Performance"] - mean_perf) / mean_perf >= 0.20
-        ]
+    def detect_abnormal(self, stats, page_name):
+        mean_perf = stats.summary(page_name)["mean"]["Performance"]
 
-        return mean_perf, abnormal
+        return mean_perf, stats.drops(page_name, "Performance", rel=0.20)
 
     # ------------------------------------------------------
     # Helper: attach abnormal warning
@@ -92,18 +390,41 @@ class BaseTest:
     # ------------------------------------------------------
     # Helper: summary table
     # ------------------------------------------------------
-    def attach_summary_table(self, brand, page_name, mode, run_results, abnormal_runs):
+    SUMMARY_METRICS = ("LCP", "TBT", "CLS")
+
+    @staticmethod
+    def _fmt(value, key):
+        if value is None:
+            return "–"
+        return f"{value:.3f}" if key == "CLS" else f"{value:.0f}" if key in METRIC_KEYS else f"{value:.1f}"
+
+    def attach_summary_table(self, brand, page_name, mode, run_results, abnormal_runs, stats):
+        outliers = stats.outlier_runs(page_name)
+        columns = (*SCORE_KEYS, *self.SUMMARY_METRICS)
+
         rows = ""
         for r in run_results:
-            s = r["scores"]
             highlight = " style='background-color:#ffcccc; font-weight:bold;'" if r in abnormal_runs else ""
+            source = "cache" if r.get("cached") else "live"
+            flag = " ⚑" if r in outliers else ""
+            bench = "–" if r.benchmark_index is None else f"{r.benchmark_index:.0f}"
+            load = "–" if r.host_load is None else f"{r.host_load:.2f}"
             rows += f"""
             <tr{highlight}>
-                <td>{r['run']}</td>
-                <td>{s['Performance']}</td>
-                <td>{s['Accessibility']}</td>
-                <td>{s['BestPractices']}</td>
-                <td>{s['SEO']}</td>
+                <td>{r['run']}{flag}</td>
+                <td>{source}</td>
+                <td>{bench}</td>
+                <td>{load}</td>
+                {''.join(f"<td>{self._fmt(r.value(k), k)}</td>" for k in columns)}
+            </tr>"""
+
+        # median / p75 / p90 / MAD of the same columns
+        summary = stats.summary(page_name)
+        for stat in ("median", "p75", "p90", "mad"):
+            rows += f"""
+            <tr style='background-color:#f0f0f0;'>
+                <td colspan='4'><i>{stat}</i></td>
+                {''.join(f"<td>{self._fmt(summary[stat][k], k)}</td>" for k in columns)}
             </tr>"""
 
         table = f"""
@@ -111,29 +432,188 @@ class BaseTest:
         <table border='1' style='border-collapse:collapse;'>
             <tr>
                 <th>Run</th>
-                <th>Performance</th>
-                <th>Accessibility</th>
-                <th>BestPractices</th>
-                <th>SEO</th>
+                <th>Source</th>
+                <th>Bench index</th>
+                <th>Load/cpu</th>
+                {''.join(f"<th>{k}</th>" for k in columns)}
             </tr>
             {rows}
         </table>
+        <p>⚑ = Performance outlier (modified z-score &gt; {OUTLIER_Z})</p>
         """
 
+        title = f"Summary Table - {brand.upper()} {page_name} [{mode}]"
+        if self.is_cached(run_results):
+            title += " ♻️ cached"
+
         allure.attach(
             table,
-            f"Summary Table - {brand.upper()} {page_name} [{mode}]",
+            title,
+            allure.attachment_type.HTML
+        )
+
+    # ------------------------------------------------------
+    # Helper: run history (SQLite) + regression vs own baseline
+    # ------------------------------------------------------
+    _history_db = None
+
+    def get_history_db(self):
+        history_cfg = getattr(self, "cfg", {}).get("HISTORY", {})
+        if not history_cfg.get("ENABLED", False):
+            return None
+        if BaseTest._history_db is None:
+            BaseTest._history_db = HistoryDB(history_cfg.get("DB", "lighthouse_history.db"))
+        return BaseTest._history_db
+
+    def check_regression(self, brand, mode, page_name, run_results, stats):
+        db = self.get_history_db()
+        # A page's runs all come from the cache or all are live – live pages only
+        if db is None or not run_results or self.is_cached(run_results):
+            return []
+
+        history_cfg = self.cfg["HISTORY"]
+        medians = stats.medians(page_name)
+        current = {col: medians[key] for col, key in {**SCORE_COLUMNS, **METRIC_COLUMNS}.items()}
+
+        with TRACER.span("history.regression", brand=brand, page=page_name, mode=mode):
+            return db.check_regression(
+                brand, page_name, mode, current,
+                rules=history_cfg.get("REGRESSION", {"performance": 10}),
+                days=history_cfg.get("BASELINE_DAYS", 14),
+                min_samples=history_cfg.get("MIN_SAMPLES", 5),
+            )
+
+    def record_history(self, brand, mode, page_name, run_results, is_pass):
+        db = self.get_history_db()
+        if db is None:
+            return
+        with TRACER.span("history.record", brand=brand, page=page_name, mode=mode):
+            for r in run_results:
+                if not r.get("cached"):  # cached runs are already in the history
+                    db.record_run(brand, page_name, mode, r, verdict="passed" if is_pass else "failed")
+
+    def attach_regressions(self, brand, page_name, regressions):
+        if not regressions:
+            return
+
+        allure.attach(
+            "<h3 style='color:red;'>📉 Regression vs history</h3><ul>"
+            + "".join(f"<li>{r}</li>" for r in regressions) + "</ul>",
+            f"📉 REGRESSION — {brand} - {page_name}",
             allure.attachment_type.HTML
         )
 
+    # ------------------------------------------------------
+    # Helper: audit-level diff – what changed vs the baseline
+    # ------------------------------------------------------
+    @staticmethod
+    def median_run(run_results):
+        # The run whose Performance is the median one (lower middle for even counts)
+        ranked = sorted(run_results, key=lambda r: r.value("Performance") or 0)
+        return ranked[(len(ranked) - 1) // 2]
+
+    def baseline_report(self, brand, mode, page_name):
+        """The median passed run of the last BASELINE_RUNS saved ones (bytes or path), or None."""
+        runs = getattr(self, "cfg", {}).get("DIFF", {}).get("BASELINE_RUNS", 5)
+        store = self.get_report_store()
+
+        if store is not None:
+            passed = list(store.entries(mode=mode, brand=brand, page=page_name, verdict="passed"))[-runs:]
+            if not passed:
+                return None
+            passed.sort(key=lambda e: (e.get("scores") or {}).get("Performance") or 0)
+            return store.read_bytes(passed[(len(passed) - 1) // 2]["json"], "json")
+
+        saved = sorted(Path(f"reports_passed/{mode}/{brand}/{page_name}").glob("run_*.json"))[-runs:]
+        if not saved:
+            return None
+        perf = lambda p: ReportReader.read(p, ReportReader.SCORES_SPEC)["categories"]["performance"]["score"] or 0
+        saved.sort(key=perf)
+        return saved[(len(saved) - 1) // 2]
+
+    def attach_audit_diff(self, brand, mode, page_name, run_results, failing):
+        diff_cfg = getattr(self, "cfg", {}).get("DIFF", {})
+        if not diff_cfg.get("ENABLED", False) or not run_results:
+            return None
+        if diff_cfg.get("WHEN", "failing") == "failing" and not failing:
+            return None
+
+        current = self.median_run(run_results)
+        with TRACER.span("diff", brand=brand, page=page_name, mode=mode, run=current["run"]):
+            baseline, against = self.baseline_report(brand, mode, page_name), "baseline"
+            if baseline is None:
+                # No saved passing run yet – explain the spread between this page's runs
+                best = max(run_results, key=lambda r: r.value("Performance") or 0)
+                if best is current:
+                    return None
+                baseline, against = best["json"], f"best run {best['run']}"
+            # Opportunity items cut at the rank a slim report keeps – deeper items would read as "removed"
+            top_items = getattr(self, "cfg", {}).get("REPORTS", {}).get("TOP_OPPORTUNITIES", TOP_ITEMS)
+            diff = ReportDiff.compare(baseline, current["json"], diff_cfg.get("MIN_IMPACT_MS", 1), top_items)
+
+        allure.attach(
+            ReportDiff.to_html(diff, diff_cfg.get("TOP", 10), f"🔍 Run {current['run']} vs {against}"),
+            f"🔍 Audit diff - {brand} - {page_name} [{mode}]",
+            allure.attachment_type.HTML
+        )
+        return diff
+
+    # ------------------------------------------------------
+    # Helper: slim report profile – keep full reports only where they matter
+    # ------------------------------------------------------
+    def slim_reports(self, brand, mode, page_name, run_results, is_pass, abnormal_runs=()):
+        slimmer = ReportSlimmer.from_config(getattr(self, "cfg", {}))
+        if slimmer is None or not is_pass:
+            return 0
+
+        saved = 0
+        for r in run_results:
+            if r in abnormal_runs:
+                continue
+            with TRACER.span("slim", brand=brand, page=page_name, mode=mode, run=r["run"]):
+                saved += slimmer.slim_files(r["json"], r["html"])
+        return saved
+
     # ------------------------------------------------------
     # Helper: save all run reports
     # ------------------------------------------------------
+    _report_store = None
+
+    def get_report_store(self):
+        # One store per process. Pruning rewrites the shared index, so the
+        # controller does it once before the workers start (conftest.py)
+        if BaseTest._report_store is None:
+            BaseTest._report_store = ReportStore.from_config(getattr(self, "cfg", {}))
+        return BaseTest._report_store
+
     def save_all_runs(self, is_pass, mode, brand, page_name, run_results):
+        store = self.get_report_store()
+
+        if store is not None:
+            # Write each artifact once (compressed, de-duplicated), then drop
+            # the scratch copies under reports_<mode>/
+            for r in run_results:
+                with TRACER.span("save", brand=brand, page=page_name, mode=mode, run=r["run"]):
+                    if not r.get("cached"):  # cached runs were archived by the session that audited them
+                        store.add_run(
+                            r["json"], r["html"],
+                            shell=LighthouseRunner.RENDERER.shell(r.lighthouse_version),
+                            verdict="passed" if is_pass else "failed",
+                            mode=mode, brand=brand, page=page_name, run=r["run"],
+                            scores=r["scores"],
+                        )
+                    for path in (r["json"], r["html"]):
+                        Path(path).unlink(missing_ok=True)
+            return
+
         target_root = "reports_passed" if is_pass else "reports_failed"
         final_target = f"{target_root}/{mode}/{brand}/{page_name}"
         Path(final_target).mkdir(parents=True, exist_ok=True)
 
         for r in run_results:
-            shutil.copy(r["json"], f"{final_target}/run_{r['run']}.json")
-            shutil.copy(r["html"], f"{final_target}/run_{r['run']}.html")
+            with TRACER.span("save", brand=brand, page=page_name, mode=mode, run=r["run"]):
+                shutil.copy(r["json"], f"{final_target}/run_{r['run']}.json")
+                if Path(r["html"]).exists():
+                    shutil.copy(r["html"], f"{final_target}/run_{r['run']}.html")
+                else:  # stdout pipeline: rendered straight into place
+                    LighthouseRunner.write_html(r["json"], f"{final_target}/run_{r['run']}.html", r.lighthouse_version)
@@ -0,0 +1,208 @@
+# base/chrome_session.py
+import os
+import json
+import time
+import shutil
+import signal
+import subprocess
+import urllib.request
+from pathlib import Path
+
+import websocket
+
+# Flags shared by every headless Chrome we start (directly or via Lighthouse)
+CHROME_FLAGS = "--headless --no-sandbox --disable-gpu --disable-dev-shm-usage"
+
+
+class ChromeSession:
+    """
+    One long-lived headless Chrome with remote debugging enabled.
+    Lighthouse attaches to it with --port instead of cold-launching a browser
+    per run. Lighthouse resets storage + cache of the audited origin only
+    (--disable-storage-reset within one warm repeat-view job), so after a
+    cold run we also drop the HTTP cache, every cookie and the storage of
+    every origin that set one (third parties, service workers, IndexedDB …)
+    and close any tabs left behind, so runs stay isolated.
+    """
+
+    CHROME_CANDIDATES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser"]
+
+    def __init__(self, port: int, user_data_dir: str, max_runs: int = 20, chrome_path: str = None,
+                 startup_timeout: float = 15.0, extra_flags=()):
+        self.port = port
+        self.extra_flags = [f.replace('"', "") for f in extra_flags]  # argv, no shell quoting
+        self.user_data_dir = str(user_data_dir)
+        self.max_runs = max_runs
+        self.chrome_path = chrome_path or self.find_chrome()
+        self.startup_timeout = startup_timeout
+        self.runs = 0
+        self.restarts = 0
+        self.started = False
+        self.needs_clear = False  # a warm job kept its cache – clear before the next cold one
+        self._dirty_origins = set()
+        self._proc = None
+
+    # ------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------
+    @staticmethod
+    def find_chrome():
+        if os.environ.get("CHROME_PATH"):
+            return os.environ["CHROME_PATH"]
+        for name in ChromeSession.CHROME_CANDIDATES:
+            path = shutil.which(name)
+            if path:
+                return path
+        raise FileNotFoundError("Chrome not found – set CHROME_PATH")
+
+    def start(self):
+        Path(self.user_data_dir).mkdir(parents=True, exist_ok=True)
+
+        cmd = [
+            self.chrome_path,
+            *CHROME_FLAGS.split(),
+            f"--remote-debugging-port={self.port}",
+            f"--user-data-dir={self.user_data_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            *self.extra_flags,
+            "about:blank",
+        ]
+        self.started = True
+        self._proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,   # own process group → kill renderers too
+        )
+        self.runs = 0
+
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self._proc.poll() is not None:
+                break
+            if self.is_alive():
+                return self
+            time.sleep(0.1)
+
+        self.stop()
+        raise RuntimeError(f"Chrome did not open debugging port {self.port}")
+
+    def stop(self):
+        if self._proc is None:
+            return
+        if self._proc.poll() is None:
+            try:
+                os.killpg(self._proc.pid, signal.SIGTERM)
+                self._proc.wait(timeout=5)
+            except (ProcessLookupError, subprocess.TimeoutExpired):
+                try:
+                    os.killpg(self._proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+        self._proc = None
+
+    def restart(self):
+        self.stop()
+        self.restarts += 1
+        return self.start()
+
+    def close(self):
+        self.stop()
+        shutil.rmtree(self.user_data_dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------
+    # Health + isolation
+    # ------------------------------------------------------
+    def _devtools(self, path: str, method: str = "GET"):
+        req = urllib.request.Request(f"http://127.0.0.1:{self.port}{path}", method=method)
+        with urllib.request.urlopen(req, timeout=2) as resp:
+            body = resp.read()
+        return json.loads(body) if body.strip().startswith((b"{", b"[")) else body
+
+    def is_alive(self):
+        if self._proc is None or self._proc.poll() is not None:
+            return False
+        try:
+            self._devtools("/json/version")
+            return True
+        except OSError:
+            return False
+
+    def ensure(self):
+        # (Re)start after a crash, or after max_runs to cap memory growth
+        if not self.is_alive():
+            return self.restart() if self.started else self.start()
+        if self.max_runs and self.runs >= self.max_runs:
+            return self.restart()
+        return self
+
+    def reset(self, clear_storage: bool = True, origins=()):
+        """
+        Closes every page target Lighthouse left open (keeps one blank tab).
+        clear_storage: also clear_browser_data() – False after warm runs.
+        """
+        self.runs += 1
+        try:
+            targets = [t for t in self._devtools("/json/list") if t.get("type") == "page"]
+            if not targets:
+                self._devtools("/json/new?about:blank", method="PUT")
+            for t in targets[1:]:
+                self._devtools(f"/json/close/{t['id']}")
+        except OSError:
+            pass  # ensure() will restart a dead browser before the next run
+        self._dirty_origins.update(origins)
+        if clear_storage:
+            self.clear_browser_data()
+        else:
+            self.needs_clear = True
+
+    def _cdp(self, commands):
+        """Sends [(method, params)] to the first page target; returns the results in order."""
+        target = next((t for t in self._devtools("/json/list") if t.get("type") == "page"), {})
+        if not target.get("webSocketDebuggerUrl"):
+            raise websocket.WebSocketException(f"No page target to attach to on port {self.port}")
+        ws = websocket.create_connection(target["webSocketDebuggerUrl"], timeout=5, suppress_origin=True)
+        results = []
+        try:
+            for i, (method, params) in enumerate(commands, 1):
+                ws.send(json.dumps({"id": i, "method": method, "params": params}))
+                while True:
+                    message = json.loads(ws.recv())
+                    if message.get("id") == i:  # skip events
+                        break
+                results.append(message.get("result", {}))
+        finally:
+            ws.close()
+        return results
+
+    def clear_browser_data(self, origins=()):
+        """
+        Profile-wide reset: HTTP cache, all cookies, and every storage type
+        (local/session storage, IndexedDB, Cache Storage, service workers …)
+        of `origins`, the origins audited since the last clear and each origin
+        that had set a cookie. False when the browser could not be reached –
+        needs_clear stays set.
+        """
+        self.needs_clear = True
+        try:
+            (cookies,) = self._cdp([("Network.getAllCookies", {})])
+            hosts = {c["domain"].lstrip(".") for c in cookies.get("cookies", [])}
+            origins = {*origins, *self._dirty_origins,
+                       *(f"{scheme}://{host}" for host in hosts for scheme in ("https", "http"))}
+            self._cdp([
+                ("Network.clearBrowserCache", {}),
+                ("Network.clearBrowserCookies", {}),
+                *(("Storage.clearDataForOrigin", {"origin": o, "storageTypes": "all"}) for o in sorted(origins)),
+            ])
+        except (OSError, ValueError, websocket.WebSocketException):
+            return False
+        self.needs_clear = False
+        self._dirty_origins.clear()
+        return True
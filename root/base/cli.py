@@ -0,0 +1,169 @@
+# base/cli.py
+"""
+Audit pages straight from the config – no pytest, no Allure.
+
+    cd root && python -m base.cli --mode desktop --brand paved --page "home*"
+    cd root && python -m base.cli --page "*contact*" --runs 1 | jq .scores.Performance
+    cd root && python -m base.cli --list
+
+Prints one JSON line per finished run ({"type": "run", …}) as soon as it is
+done, then one per page ({"type": "page", …}) with the median scores and
+the verdict. Invalid runs (see utils.run_validation) are reported but left
+out of the medians. Exit code 1 when a page misses its Performance
+threshold or produced no valid run.
+"""
+import sys
+import json
+import time
+import asyncio
+import argparse
+import statistics
+from fnmatch import fnmatch
+
+from base.lighthouse_runner import LighthouseRunner
+from base.lighthouse_session import LighthouseSession
+from utils.config_reader import ConfigReader
+from utils.run_result import RunResult, SCORE_KEYS
+from utils.run_validation import RunValidator
+from utils.tracing import TRACER
+
+MODES = ["desktop", "mobile"]
+
+
+def select_pages(modes, brands=None, pages=None, views=None):
+    """[(mode, view, brand, url, page_name)] matching the glob patterns (page_name or URL)."""
+    selected = []
+    for mode in modes:
+        cfg = ConfigReader.load_config(f"config_{mode}.json")
+        for view in views or ["cold"]:
+            if view == "warm" and "THRESHOLDS_WARM" not in cfg:
+                continue
+            for brand, url, page_name in ConfigReader.load_pages(mode):
+                if brands and not any(fnmatch(brand, b) for b in brands):
+                    continue
+                if pages and not any(fnmatch(page_name, p) or fnmatch(url, p) for p in pages):
+                    continue
+                selected.append((mode, view, brand, url, page_name))
+    return selected
+
+
+def threshold(mode, view):
+    cfg = ConfigReader.load_config(f"config_{mode}.json")
+    return cfg["THRESHOLDS_WARM" if view == "warm" else "THRESHOLDS"]["PERFORMANCE"] * 100
+
+
+def median_scores(run_results):
+    # statistics, not RunStats – keeps numpy out of the start-up path
+    medians = {}
+    for k in SCORE_KEYS:
+        values = [r.value(k) for r in run_results if r.value(k) is not None]
+        medians[k] = statistics.median(values) if values else None
+    return medians
+
+
+def emit(record):
+    sys.stdout.write(json.dumps(record, default=str) + "\n")
+    sys.stdout.flush()
+
+
+async def audit(selected, runs, session, out_root, timeouts):
+    """Streams one "run" line per finished run; returns {(mode, view, brand, page): ([RunResult], [error])}."""
+    jobs = [
+        {
+            "url": url,
+            "brand": brand,
+            "mode": mode,
+            "view": view,
+            "page_name": page_name,
+            "run": i,
+            "report_dir": f"{out_root}/{LighthouseRunner.view_label(mode, view)}/{brand}/run_{i}",
+        }
+        for mode, view, brand, url, page_name in selected
+        for i in range(1, runs + 1)
+    ]
+    pages = {(mode, view, brand, page_name): ([], []) for mode, view, brand, _, page_name in selected}
+    governor = session.governor
+
+    async for res in session.run_many(
+        jobs,
+        timeout=timeouts.get("RUN_SECONDS"),
+        retries=timeouts.get("RETRIES", 0),
+        backoff=timeouts.get("BACKOFF_SECONDS", 2.0),
+    ):
+        key = (res["mode"], res["view"], res["brand"], res["page_name"])
+        line = {"type": "run", **{k: res[k] for k in ("mode", "view", "brand", "page_name", "url", "run")}}
+
+        if res["error"] is not None:
+            pages[key][1].append(f"run {res['run']}: {res['error']}")
+            emit({**line, "error": str(res["error"])})
+            continue
+
+        summary = LighthouseRunner.parse_summary(res["report"] or res["json"], timing=TRACER.enabled)
+        TRACER.record_lhr_stages(res.get("started_us"), summary.pop("timing", None), brand=res["brand"],
+                                 page=res["page_name"], mode=res["mode"], run=res["run"], worker=res["worker"])
+        r = RunResult(run=res["run"], json=res["json"], html=res["html"], host_load=res.get("host_load"), **summary)
+        # Invalid runs (runtimeError, null score …) are reported, never counted
+        invalid = RunValidator.classify(r)
+        if invalid:
+            pages[key][1].append(f"run {res['run']}: {invalid[0]} error – {invalid[1]}")
+            emit({**line, **r.to_dict(), "invalid": invalid[0], "error": invalid[1]})
+            continue
+
+        pages[key][0].append(r)
+        slow = governor and governor.observe(r.benchmark_index, r.host_load)
+        emit({**line, **r.to_dict(), "slow_host": slow or None, "invalid": None, "error": None})
+
+    return pages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run Lighthouse on configured pages, JSON lines on stdout")
+    parser.add_argument("--mode", action="append", choices=MODES, help="repeatable (default: all)")
+    parser.add_argument("--brand", action="append", help="brand glob, repeatable (paved, gsa …)")
+    parser.add_argument("--page", action="append", help="page name or URL glob, repeatable")
+    parser.add_argument("--view", action="append", choices=LighthouseRunner.VIEWS, help="default: cold")
+    parser.add_argument("--runs", type=int, default=1, help="runs per page (median decides)")
+    parser.add_argument("--workers", type=int, default=None, help="default: WORKERS of the config")
+    parser.add_argument("--out", default="reports_cli", help="report folder")
+    parser.add_argument("--trace", default=None, help="write a Chrome trace of the pipeline stages here")
+    parser.add_argument("--list", action="store_true", help="print the selected pages and exit")
+    args = parser.parse_args(argv)
+
+    modes = args.mode or MODES
+    selected = select_pages(modes, args.brand, args.page, args.view)
+    if not selected:
+        print("No page matches the selection", file=sys.stderr)
+        return 2
+    if args.list:
+        for mode, view, brand, url, page_name in selected:
+            emit({"type": "page", "mode": mode, "view": view, "brand": brand, "page_name": page_name, "url": url})
+        return 0
+
+    TRACER.enabled = bool(args.trace)
+
+    # One mode after the other, each on a pool built from its own config (WORKERS, CHROME, BACKEND …)
+    start = time.perf_counter()
+    pages = {}
+    for mode in dict.fromkeys(m for m, *_ in selected):
+        cfg = ConfigReader.load_config(f"config_{mode}.json")
+        with LighthouseSession.from_config(cfg, args.workers) as session:
+            pages.update(asyncio.run(audit([s for s in selected if s[0] == mode], max(1, args.runs), session,
+                                           args.out, cfg.get("TIMEOUTS", {}))))
+
+    failed = 0
+    for (mode, view, brand, page_name), (run_results, errors) in pages.items():
+        medians = median_scores(run_results)
+        limit = threshold(mode, view)
+        passed = bool(run_results) and medians["Performance"] is not None and medians["Performance"] >= limit
+        failed += not passed
+        emit({"type": "page", "mode": mode, "view": view, "brand": brand, "page_name": page_name,
+              "runs": len(run_results), "median": medians, "threshold": limit, "passed": passed, "errors": errors})
+
+    if args.trace:
+        TRACER.export_chrome(args.trace)
+    print(f"{len(pages) - failed}/{len(pages)} pages passed in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
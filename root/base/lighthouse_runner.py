@@ -1,35 +1,94 @@
 # base/LighthouseRunner
 import os
-import json
+import time
+import queue
+import asyncio
+import shutil
 import subprocess
 from pathlib import Path
 from glob import glob
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from base.chrome_session import CHROME_FLAGS, ChromeSession
+from base.lighthouse_server import LighthouseServer, LighthouseServerError
+from utils.host_load import HostGovernor
+from utils.report_reader import ReportReader
+from utils.report_renderer import ReportRenderer
+from utils.process_tree import kill_tree
+from utils.tracing import TRACER
+
 
 class LighthouseRunner:
+    # Worker pool defaults – every worker gets BASE_PORT + worker_id
+    BASE_PORT = 9222
+    WORK_ROOT = "reports_workers"
+    # "cli": one `lighthouse` process per run, "server": persistent Node sidecar
+    BACKENDS = ("cli", "server")
+    # "warm": a priming pass loads the page first, then the audited pass keeps
+    # its HTTP cache / service worker / storage (same browser profile)
+    VIEWS = ("cold", "warm")
+    WARM_FLAGS = ["--disable-storage-reset"]
+    ARTIFACT_FLAGS = ("--gather-mode", "--audit-mode", "-G", "-A")
+    # "files": Lighthouse writes <stem>.report.json + .report.html, renamed into place
+    # "stdout": the JSON report is read from Lighthouse's stdout and written once;
+    #           HTML is rendered from it only when something asks for it
+    PIPELINES = ("files", "stdout")
+    RENDERER = ReportRenderer(str(Path(WORK_ROOT) / "report_shell"))
+    _lh_version = None
+
     @staticmethod
-    def run(url: str, mode: str, report_dir: str):
-        os.makedirs(report_dir, exist_ok=True)
+    def lighthouse_version():
+        if LighthouseRunner._lh_version is None:
+            try:
+                out = subprocess.run(["lighthouse", "--version"], capture_output=True, text=True, timeout=30)
+                LighthouseRunner._lh_version = out.stdout.strip() or "unknown"
+            except (OSError, subprocess.TimeoutExpired):
+                LighthouseRunner._lh_version = "unknown"
+        return LighthouseRunner._lh_version
+
+    @staticmethod
+    def view_label(mode: str, view: str = "cold"):
+        # "desktop" / "desktop-warm" – report folders, history, cache keys
+        return mode if view == "cold" else f"{mode}-{view}"
 
-        safe_name = (
+    @staticmethod
+    def safe_name(url: str):
+        return (
             url.replace("https://", "")
             .replace("http://", "")
             .replace("/", "_")
             .rstrip("_")
         )
 
-        json_path = Path(report_dir) / f"{safe_name}_{mode}.json"
-        html_path = Path(report_dir) / f"{safe_name}_{mode}.html"
+    @staticmethod
+    def build_command(url: str, mode: str, output_stem, port=None, user_data_dir=None, extra_flags=(),
+                      chrome_flags=()):
+        extra_chrome_flags = chrome_flags
+        chrome_flags = CHROME_FLAGS
+        if user_data_dir:
+            chrome_flags += f" --user-data-dir={user_data_dir}"
+        for flag in extra_chrome_flags:  # e.g. the replay proxy's --host-resolver-rules
+            chrome_flags += f" {flag}"
 
         # Base command
         base_cmd = [
             "lighthouse", url,
             "--only-categories=performance,accessibility,best-practices,seo",
-            "--chrome-flags=--headless --no-sandbox --disable-gpu --disable-dev-shm-usage",
+            f"--chrome-flags={chrome_flags}",
             "--quiet",
-            "--output=json",
-            "--output=html",
-            f"--output-path={json_path.with_suffix('')}",  # lighthouse will add .report.json/.report.html
         ]
+        if output_stem == "stdout":
+            base_cmd += ["--output=json", "--output-path=stdout"]
+        else:
+            base_cmd += [
+                "--output=json",
+                "--output=html",
+                f"--output-path={output_stem}",  # lighthouse will add .report.json/.report.html
+            ]
+
+        if port:
+            base_cmd.append(f"--port={port}")
 
         if mode == "desktop":
             base_cmd += [
@@ -45,39 +104,523 @@ class LighthouseRunner:
                 "--emulated-form-factor=mobile",
             ]
 
-        # Run once – both outputs at the same time
-        subprocess.run(base_cmd, check=True)
+        # e.g. the slim report profile's --skip-audits
+        base_cmd += list(extra_flags)
+
+        return base_cmd
+
+    @staticmethod
+    def _paths(url: str, mode: str, report_dir: str, work_dir=None):
+        os.makedirs(report_dir, exist_ok=True)
+
+        safe_name = LighthouseRunner.safe_name(url)
+
+        json_path = Path(report_dir) / f"{safe_name}_{mode}.json"
+        html_path = Path(report_dir) / f"{safe_name}_{mode}.html"
+
+        # Parallel workers write into their own folder first, so two jobs
+        # never race on the same <stem>.report.json
+        out_dir = Path(work_dir) if work_dir else Path(report_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        output_stem = out_dir / f"{safe_name}_{mode}"
+
+        return json_path, html_path, output_stem
 
+    @staticmethod
+    def _has_report(output_stem):
+        return Path(f"{output_stem}.report.json").exists()
+
+    @staticmethod
+    def _is_report(report: bytes):
+        return report.lstrip()[:1] == b"{"
+
+    @staticmethod
+    def _use_stdout(pipeline, backend):
+        # Files until the HTML renderer of this Lighthouse version is known (one run
+        # learns it); the server backend always writes files
+        if pipeline not in LighthouseRunner.PIPELINES:
+            raise ValueError(f"Unknown report pipeline: {pipeline}")
+        return (pipeline == "stdout" and backend == "cli"
+                and LighthouseRunner.RENDERER.has_shell(LighthouseRunner.lighthouse_version()))
+
+    @staticmethod
+    def _finish(output_stem, json_path, html_path, report=None, pipeline="files"):
+        """(json_path, html_path, report) – report: the JSON bytes when they came from stdout."""
+        if report is not None:
+            with TRACER.span("write"):
+                Path(json_path).write_bytes(report)  # the only write; no HTML yet
+                Path(html_path).unlink(missing_ok=True)  # an earlier run's HTML is not this run's
+            return json_path, html_path, report
+
+        with TRACER.span("rename"):
+            json_path, html_path = LighthouseRunner._collect_outputs(output_stem, json_path, html_path)
+        if pipeline == "stdout":
+            LighthouseRunner.RENDERER.learn(html_path, LighthouseRunner.lighthouse_version())
+        return json_path, html_path, None
+
+    @staticmethod
+    def write_html(json_path, html_path, version: str = None):
+        """Renders a JSON report into html_path (stdout pipeline). Returns html_path, or None."""
+        report = Path(json_path).read_bytes()
+        version = version or ReportReader.read(report, {"lighthouseVersion": True}).get("lighthouseVersion")
+        html = LighthouseRunner.RENDERER.render(report, version)
+        if html is None:
+            return None
+        Path(html_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(html_path).write_bytes(html)
+        return html_path
+
+    @staticmethod
+    def ensure_html(run):
+        """The run's HTML report path – rendered now if the stdout pipeline skipped it; None if impossible."""
+        if Path(run["html"]).exists():
+            return run["html"]
+        with TRACER.span("render", run=run["run"]):
+            return LighthouseRunner.write_html(run["json"], run["html"], run.lighthouse_version)
+
+    @staticmethod
+    def _clear_outputs(output_stem):
+        # a crashed earlier attempt must not pass for this run's report
+        for ext in ("json", "html"):
+            Path(f"{output_stem}.report.{ext}").unlink(missing_ok=True)
+
+    @staticmethod
+    def _collect_outputs(output_stem, json_path, html_path):
         # Lighthouse always creates:  <stem>.report.json  and  <stem>.report.html
-        final_json = json_path.with_suffix(".report.json")
-        final_html = html_path.with_suffix(".report.html")
+        final_json = Path(f"{output_stem}.report.json")
+        final_html = Path(f"{output_stem}.report.html")
 
         if final_json.exists():
-            final_json.rename(json_path)
+            os.replace(final_json, json_path)
         if final_html.exists():
-            final_html.rename(html_path)
+            os.replace(final_html, html_path)
 
         return json_path, html_path
 
+    @staticmethod
+    def run(url: str, mode: str, report_dir: str, port=None, user_data_dir=None, work_dir=None,
+            backend: str = "cli", server: LighthouseServer = None, extra_flags=(), chrome_flags=(),
+            view: str = "cold", pipeline: str = "files"):
+        """
+        Returns (json_path, html_path, report, started_us) – see _finish();
+        started_us: epoch µs the Lighthouse span began (None with tracing off),
+        where Tracer.record_lhr_stages() places the report's own timings.
+        """
+        if backend not in LighthouseRunner.BACKENDS:
+            raise ValueError(f"Unknown Lighthouse backend: {backend}")
+        if view not in LighthouseRunner.VIEWS:
+            raise ValueError(f"Unknown view: {view}")
+
+        if view == "warm":
+            prime_dir = LighthouseRunner._prime_dir(report_dir, work_dir)
+            with TRACER.span("prime"), TRACER.tags(view="prime"):
+                LighthouseRunner.run(url, mode, prime_dir, port, user_data_dir, work_dir, backend, server,
+                                     LighthouseRunner._prime_flags(extra_flags), chrome_flags, pipeline=pipeline)
+            shutil.rmtree(prime_dir, ignore_errors=True)
+            extra_flags = [*extra_flags, *LighthouseRunner.WARM_FLAGS]
+
+        stdout = LighthouseRunner._use_stdout(pipeline, backend)
+        json_path, html_path, output_stem = LighthouseRunner._paths(url, mode, report_dir, work_dir)
+        base_cmd = LighthouseRunner.build_command(url, mode, "stdout" if stdout else output_stem, port,
+                                                  user_data_dir, extra_flags, chrome_flags)
+
+        # Run once – both outputs at the same time (or the JSON on stdout)
+        report = None
+        with TRACER.span("lighthouse") as started:
+            if backend == "server":
+                if server is None:
+                    raise ValueError("backend='server' needs a LighthouseServer")
+                server.submit(base_cmd[1:])
+            elif stdout:
+                proc = subprocess.run(base_cmd, stdout=subprocess.PIPE)
+                report = proc.stdout
+                # runtimeError: the CLI exits 1 *after* printing the report – keep it for validation
+                if proc.returncode != 0 and not LighthouseRunner._is_report(report):
+                    raise subprocess.CalledProcessError(proc.returncode, base_cmd)
+            else:
+                LighthouseRunner._clear_outputs(output_stem)
+                try:
+                    subprocess.run(base_cmd, check=True)
+                except subprocess.CalledProcessError:
+                    # runtimeError: the CLI exits 1 *after* writing the report – keep it for validation
+                    if not LighthouseRunner._has_report(output_stem):
+                        raise
+
+        return (*LighthouseRunner._finish(output_stem, json_path, html_path, report, pipeline), started)
+
+    @staticmethod
+    def _prime_dir(report_dir, work_dir=None):
+        # the priming pass's report is thrown away
+        return str(Path(work_dir or report_dir) / "prime")
+
+    @staticmethod
+    def _prime_flags(extra_flags):
+        # the priming pass must not gather into / audit from the job's artifact folder
+        return [f for f in extra_flags if not f.startswith(LighthouseRunner.ARTIFACT_FLAGS)]
+
+    # ------------------------------------------------------
+    # Async run: per-run timeout, process-tree kill, retries
+    # ------------------------------------------------------
+    @staticmethod
+    async def _run_async_once(url, mode, report_dir, port, user_data_dir, work_dir, backend, server, timeout,
+                              extra_flags=(), chrome_flags=(), pipeline="files"):
+        stdout = LighthouseRunner._use_stdout(pipeline, backend)
+        json_path, html_path, output_stem = LighthouseRunner._paths(url, mode, report_dir, work_dir)
+        base_cmd = LighthouseRunner.build_command(url, mode, "stdout" if stdout else output_stem, port,
+                                                  user_data_dir, extra_flags, chrome_flags)
+
+        report = None
+        with TRACER.span("lighthouse") as started:
+            if backend == "server":
+                if server is None:
+                    raise ValueError("backend='server' needs a LighthouseServer")
+                try:
+                    await asyncio.wait_for(asyncio.to_thread(server.submit, base_cmd[1:]), timeout)
+                except (asyncio.TimeoutError, asyncio.CancelledError):
+                    server.kill()  # stuck job – next submit() starts a fresh server
+                    raise
+            else:
+                if not stdout:
+                    LighthouseRunner._clear_outputs(output_stem)
+                proc = await asyncio.create_subprocess_exec(
+                    *base_cmd, start_new_session=True, stdout=asyncio.subprocess.PIPE if stdout else None,
+                )
+                try:
+                    # communicate() drains the pipe while waiting – a multi-MB report never blocks it
+                    report, _ = await asyncio.wait_for(proc.communicate(), timeout)
+                except (asyncio.TimeoutError, asyncio.CancelledError):
+                    kill_tree(proc.pid)  # Lighthouse + the Chrome it launched
+                    await proc.wait()
+                    raise
+                # runtimeError: the CLI exits 1 *after* writing the report – keep it for validation
+                has_report = LighthouseRunner._is_report(report) if stdout else LighthouseRunner._has_report(output_stem)
+                if proc.returncode != 0 and not has_report:
+                    raise subprocess.CalledProcessError(proc.returncode, base_cmd)
+
+        return (*LighthouseRunner._finish(output_stem, json_path, html_path, report, pipeline), started)
+
+    @staticmethod
+    async def run_async(url: str, mode: str, report_dir: str, port=None, user_data_dir=None, work_dir=None,
+                        backend: str = "cli", server: LighthouseServer = None,
+                        timeout: float = None, retries: int = 0, backoff: float = 2.0, deadline: float = None,
+                        extra_flags=(), chrome_flags=(), view: str = "cold", pipeline: str = "files"):
+        """
+        Async twin of run(). timeout: seconds per attempt; on expiry the whole
+        Lighthouse/Chrome process tree is killed. Transient failures (timeout,
+        non-zero exit, server error) are retried up to `retries` times with
+        exponential backoff. deadline: absolute time.monotonic() after which
+        no attempt is started or allowed to continue.
+        """
+        if backend not in LighthouseRunner.BACKENDS:
+            raise ValueError(f"Unknown Lighthouse backend: {backend}")
+        if view not in LighthouseRunner.VIEWS:
+            raise ValueError(f"Unknown view: {view}")
+
+        if view == "warm":
+            prime_dir = LighthouseRunner._prime_dir(report_dir, work_dir)
+            with TRACER.span("prime"), TRACER.tags(view="prime"):
+                await LighthouseRunner.run_async(
+                    url, mode, prime_dir, port, user_data_dir, work_dir, backend, server,
+                    timeout, retries, backoff, deadline, LighthouseRunner._prime_flags(extra_flags), chrome_flags,
+                    pipeline=pipeline,
+                )
+            shutil.rmtree(prime_dir, ignore_errors=True)
+            extra_flags = [*extra_flags, *LighthouseRunner.WARM_FLAGS]
+
+        attempt = 0
+        while True:
+            attempt_timeout = timeout
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("Lighthouse session deadline exceeded")
+                attempt_timeout = min(timeout or remaining, remaining)
+
+            try:
+                with TRACER.tags(attempt=attempt + 1):
+                    return await LighthouseRunner._run_async_once(
+                        url, mode, report_dir, port, user_data_dir, work_dir, backend, server, attempt_timeout,
+                        extra_flags, chrome_flags, pipeline,
+                    )
+            except (asyncio.TimeoutError, subprocess.CalledProcessError, LighthouseServerError) as e:
+                if attempt >= retries:
+                    if isinstance(e, asyncio.TimeoutError):
+                        raise TimeoutError(f"Lighthouse timed out after {attempt_timeout:.0f}s: {url}") from e
+                    raise
+                await asyncio.sleep(backoff * 2 ** attempt)
+                attempt += 1
+
+    # ------------------------------------------------------
+    # Worker slots (shared by run_many / run_many_async)
+    # ------------------------------------------------------
+    @staticmethod
+    def make_slots(workers, base_port=None, work_root=None):
+        base_port = base_port or LighthouseRunner.BASE_PORT
+        work_root = Path(work_root or LighthouseRunner.WORK_ROOT)
+
+        # One slot per worker: own debugging port, chrome profile and output dir
+        slots = []
+        for worker_id in range(max(1, int(workers))):
+            worker_dir = work_root / f"worker_{worker_id}"
+            slots.append({
+                "id": worker_id,
+                "port": base_port + worker_id,
+                "user_data_dir": str((worker_dir / "chrome_profile").resolve()),
+                "work_dir": str(worker_dir / "out"),
+                "chrome": None,
+                "server": None,
+                "replay": None,  # WprProxy – set by LighthouseSession when REPLAY is on
+            })
+        return slots
+
+    @staticmethod
+    def _acquire_slot(slot, reuse_chrome, max_runs_per_chrome, backend, replay=None, view="cold"):
+        if replay:
+            if slot["replay"] is None:
+                raise RuntimeError("Replay job on a worker without a replay proxy")
+            with TRACER.span(f"replay.{replay['action']}"):
+                slot["replay"].ensure(replay["action"], replay["archive"])
+
+        if reuse_chrome:
+            if slot["chrome"] is None:
+                slot["chrome"] = ChromeSession(slot["port"], slot["user_data_dir"], max_runs=max_runs_per_chrome,
+                                               extra_flags=LighthouseRunner._chrome_flags(slot))
+            with TRACER.span("chrome.ensure"):
+                slot["chrome"].ensure()
+            if view == "cold" and slot["chrome"].needs_clear:
+                with TRACER.span("chrome.clear"):
+                    slot["chrome"].clear_browser_data()
+
+        if backend == "server" and slot["server"] is None:
+            with TRACER.span("server.start"):
+                slot["server"] = LighthouseServer().start()
+
+    @staticmethod
+    def _release_slot(slot, job=None):
+        with TRACER.span("release"):
+            if slot["chrome"]:
+                # Warm runs keep the cache (--disable-storage-reset); the next cold run clears it
+                job = job or {}
+                url = urlsplit(job.get("url", ""))
+                slot["chrome"].reset(clear_storage=job.get("view", "cold") == "cold",
+                                     origins=[f"{url.scheme}://{url.netloc}"] if url.netloc else ())
+            else:
+                shutil.rmtree(slot["user_data_dir"], ignore_errors=True)
+            if slot["replay"] and slot["replay"].action == "record":
+                slot["replay"].stop()  # writes the archive
+
+    @staticmethod
+    def _chrome_flags(slot):
+        return slot["replay"].chrome_flags() if slot["replay"] else []
+
+    @staticmethod
+    def _peak_load(load_before):
+        # Load average per CPU, worst of run start / end
+        loads = [l for l in (load_before, HostGovernor.host_load()) if l is not None]
+        return max(loads) if loads else None
+
+    @staticmethod
+    def _job_tags(job, slot):
+        return TRACER.tags(brand=job.get("brand"), page=job.get("page_name"), mode=job.get("mode"),
+                           run=job.get("run"), worker=slot["id"])
+
+    @staticmethod
+    def close_slots(slots):
+        for slot in slots:
+            if slot["chrome"]:
+                slot["chrome"].close()
+            if slot["server"]:
+                slot["server"].close()
+            if slot["replay"]:
+                slot["replay"].stop()
+
+    @staticmethod
+    def _result(job, slot, json_path=None, html_path=None, error=None, host_load=None, report=None,
+                started_us=None):
+        return {**job, "worker": slot["id"], "json": json_path, "html": html_path, "error": error,
+                "host_load": host_load, "report": report, "started_us": started_us}
+
+    # ------------------------------------------------------
+    # Run many jobs on a bounded worker pool
+    # ------------------------------------------------------
+    @staticmethod
+    def run_many(jobs, workers: int = 1, base_port: int = None, work_root: str = None,
+                 reuse_chrome: bool = False, max_runs_per_chrome: int = 20, backend: str = "cli", extra_flags=(),
+                 pipeline: str = "files"):
+        """
+        jobs: iterable of dicts with at least "url", "mode", "report_dir";
+        optional "view", "flags" (per-job Lighthouse flags) and "replay".
+        Yields one result per job as soon as it finishes (completion order):
+        the job dict plus "json", "html", "error" (None on success) and
+        "report" (the JSON bytes with pipeline="stdout" – parse from these;
+        "html" is not written until ensure_html() asks for it) and
+        "started_us" (see run()).
+
+        reuse_chrome: every worker keeps one warm Chrome (ChromeSession) and
+        Lighthouse attaches to it, instead of cold-launching per run.
+        backend: "cli" or "server" – with "server" every worker drives its own
+        long-lived Node Lighthouse process.
+        """
+        all_slots = LighthouseRunner.make_slots(workers, base_port, work_root)
+        slots = queue.Queue()
+        for slot in all_slots:
+            slots.put(slot)
+
+        def _run_job(job):
+            slot = slots.get()
+            with LighthouseRunner._job_tags(job, slot):
+                try:
+                    LighthouseRunner._acquire_slot(slot, reuse_chrome, max_runs_per_chrome, backend,
+                                                   job.get("replay"), job.get("view", "cold"))
+                    load_before = HostGovernor.host_load()
+                    json_path, html_path, report, started_us = LighthouseRunner.run(
+                        job["url"], job["mode"], job["report_dir"],
+                        port=slot["port"],
+                        user_data_dir=None if slot["chrome"] else slot["user_data_dir"],
+                        work_dir=slot["work_dir"],
+                        backend=backend,
+                        server=slot["server"],
+                        extra_flags=[*extra_flags, *job.get("flags", ())],
+                        chrome_flags=LighthouseRunner._chrome_flags(slot),
+                        view=job.get("view", "cold"),
+                        pipeline=pipeline,
+                    )
+                    return LighthouseRunner._result(job, slot, json_path, html_path, report=report,
+                                                    host_load=LighthouseRunner._peak_load(load_before),
+                                                    started_us=started_us)
+                except (subprocess.CalledProcessError, OSError, RuntimeError) as e:
+                    return LighthouseRunner._result(job, slot, error=e)
+                finally:
+                    LighthouseRunner._release_slot(slot, job)
+                    slots.put(slot)
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(all_slots)) as pool:
+                futures = [pool.submit(_run_job, job) for job in jobs]
+                for future in as_completed(futures):
+                    yield future.result()
+        finally:
+            LighthouseRunner.close_slots(all_slots)
+
+    @staticmethod
+    async def run_many_async(jobs, workers: int = 1, base_port: int = None, work_root: str = None,
+                             reuse_chrome: bool = False, max_runs_per_chrome: int = 20, backend: str = "cli",
+                             timeout: float = None, retries: int = 0, backoff: float = 2.0,
+                             deadline: float = None, slots=None, extra_flags=(), governor=None,
+                             pipeline: str = "files"):
+        """
+        Async generator version of run_many(): same results, streamed in
+        completion order, with run_async()'s per-run timeout, retries and
+        session deadline. One hung page costs at most its timeout.
+
+        slots: worker slots from make_slots() owned by the caller (e.g. a
+        LighthouseSession) – kept warm and NOT closed when the call ends.
+        governor: HostGovernor – at most governor.limit slots run at once
+        (the caller feeds results back through governor.observe()).
+        """
+        own_slots = slots is None
+        all_slots = LighthouseRunner.make_slots(workers, base_port, work_root) if own_slots else slots
+        slots = asyncio.Queue()
+        for slot in all_slots:
+            slots.put_nowait(slot)
+        busy = 0
+
+        async def _take_slot():
+            # The limit moves while jobs wait, so re-check it instead of a fixed semaphore
+            nonlocal busy
+            while True:
+                slot = await slots.get()
+                if governor is None or busy < governor.limit:
+                    busy += 1
+                    return slot
+                slots.put_nowait(slot)
+                await asyncio.sleep(0.25)
+
+        async def _run_job(job):
+            nonlocal busy
+            slot = await _take_slot()
+            with LighthouseRunner._job_tags(job, slot):
+                try:
+                    await asyncio.to_thread(
+                        LighthouseRunner._acquire_slot, slot, reuse_chrome, max_runs_per_chrome, backend,
+                        job.get("replay"), job.get("view", "cold"),
+                    )
+                    load_before = HostGovernor.host_load()
+                    json_path, html_path, report, started_us = await LighthouseRunner.run_async(
+                        job["url"], job["mode"], job["report_dir"],
+                        port=slot["port"],
+                        user_data_dir=None if slot["chrome"] else slot["user_data_dir"],
+                        work_dir=slot["work_dir"],
+                        backend=backend,
+                        server=slot["server"],
+                        timeout=timeout, retries=retries, backoff=backoff, deadline=deadline,
+                        extra_flags=[*extra_flags, *job.get("flags", ())],
+                        chrome_flags=LighthouseRunner._chrome_flags(slot),
+                        view=job.get("view", "cold"),
+                        pipeline=pipeline,
+                    )
+                    return LighthouseRunner._result(job, slot, json_path, html_path, report=report,
+                                                    host_load=LighthouseRunner._peak_load(load_before),
+                                                    started_us=started_us)
+                except (subprocess.CalledProcessError, OSError, RuntimeError) as e:
+                    return LighthouseRunner._result(job, slot, error=e)
+                finally:
+                    await asyncio.to_thread(LighthouseRunner._release_slot, slot, job)
+                    busy -= 1
+                    slots.put_nowait(slot)
+
+        tasks = [asyncio.create_task(_run_job(job)) for job in jobs]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if own_slots:
+                await asyncio.to_thread(LighthouseRunner.close_slots, all_slots)
+
+    @staticmethod
+    def _score(categories, category_id, default=None):
+        # None when Lighthouse could not score the category (runtimeError, failed metric)
+        score = categories.get(category_id, {}).get("score", default)
+        return None if score is None else score * 100
 
     @staticmethod
     def parse_scores(report_json_path:str):
-        with open(report_json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # Only decode categories.*.score – skips screenshots and audit details
+        data = ReportReader.read(report_json_path, ReportReader.SCORES_SPEC)
 
-        categories = data["categories"]
+        categories = data.get("categories", {})
 
         return {
-        "Performance":       categories["performance"]["score"] * 100,
-        "Accessibility":     categories["accessibility"]["score"] * 100,
-        "BestPractices":     categories.get("best-practices", {}).get("score", 0) * 100,
-        "SEO":               categories["seo"]["score"] * 100,
+        "Performance":       LighthouseRunner._score(categories, "performance"),
+        "Accessibility":     LighthouseRunner._score(categories, "accessibility"),
+        "BestPractices":     LighthouseRunner._score(categories, "best-practices", 0),
+        "SEO":               LighthouseRunner._score(categories, "seo"),
     }
-        # return {
-        #     "Performance": data["categories"]["performance"]["score"] * 100,
-        #     "Accessibility": data["categories"]["accessibility"]["score"] * 100,
-        #     "Best Practices": data["categories"]["best-practices"]["score"] * 100,
-        #     "SEO": data["categories"]["seo"]["score"] * 100,
-        # }
-
-       
+
+    @staticmethod
+    def parse_summary(report_json_path:str, timing: bool = False):
+        # Scores + core metrics + environment in one selective read (path or the report bytes);
+        # timing=True adds "timing" (lhr.timing.entries) – pop it before building a RunResult
+        data = ReportReader.read_summary(report_json_path, timing)
+        categories = data.get("categories", {})
+
+        summary = {
+            "scores": {
+                "Performance":   LighthouseRunner._score(categories, "performance"),
+                "Accessibility": LighthouseRunner._score(categories, "accessibility"),
+                "BestPractices": LighthouseRunner._score(categories, "best-practices", 0),
+                "SEO":           LighthouseRunner._score(categories, "seo"),
+            },
+            "metrics": data["metrics"],
+            "lighthouse_version": data.get("lighthouseVersion"),
+            "benchmark_index": data.get("environment", {}).get("benchmarkIndex"),
+            "fetch_time": data.get("fetchTime"),
+            "runtime_error": data.get("runtimeError"),
+            "run_warnings": data.get("runWarnings") or [],
+        }
+        if timing:
+            summary["timing"] = data.get("timing", {}).get("entries", [])
+        return summary
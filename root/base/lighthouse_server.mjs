@@ -0,0 +1,95 @@
+// base/lighthouse_server.mjs
+// Long-lived Lighthouse sidecar: loads the Lighthouse module graph once, then
+// reads JSON-lines jobs on stdin and answers one JSON line per job on stdout.
+//
+//   job:      {"id": 1, "argv": ["<url>", "--preset=desktop", ...], "return_lhr": false}
+//   response: {"id": 1, "ok": true, "json": "<stem>.report.json", "html": "<stem>.report.html"}
+//
+// "argv" is the same flag list LighthouseRunner.build_command() hands to the
+// CLI; it is parsed with Lighthouse's own CLI flag parser so both backends
+// audit with identical settings.
+import fs from 'node:fs';
+import path from 'node:path';
+import readline from 'node:readline';
+import {createRequire} from 'node:module';
+import {pathToFileURL} from 'node:url';
+
+const LH_ROOT = process.env.LIGHTHOUSE_ROOT;
+if (!LH_ROOT) {
+  process.stderr.write('LIGHTHOUSE_ROOT is not set\n');
+  process.exit(2);
+}
+
+// stdout is the protocol channel – keep stray console.log output off it
+console.log = console.error;
+const send = (msg) => process.stdout.write(JSON.stringify(msg) + '\n');
+
+const lhImport = (rel) => import(pathToFileURL(path.join(LH_ROOT, rel)).href);
+const requireFromLh = createRequire(path.join(LH_ROOT, 'package.json'));
+
+const {default: lighthouse} = await lhImport('core/index.js');
+const {getFlags} = await lhImport('cli/cli-flags.js');
+const chromeLauncher = await import(pathToFileURL(requireFromLh.resolve('chrome-launcher')).href);
+
+const presets = {};
+async function loadPreset(name) {
+  if (!name) return undefined;
+  if (!presets[name]) {
+    presets[name] = (await lhImport(`core/config/${name}-config.js`)).default;
+  }
+  return presets[name];
+}
+
+function chromeFlagList(chromeFlags) {
+  if (Array.isArray(chromeFlags)) return chromeFlags;
+  return (chromeFlags || '').split(/\s+/).filter(Boolean);
+}
+
+async function runJob(job) {
+  const flags = getFlags(job.argv);
+  const url = flags._[0];
+  const config = await loadPreset(flags.preset);
+
+  // chrome-launcher attaches to a Chrome already listening on flags.port
+  // (warm ChromeSession) and only launches a new one when nothing is there
+  const chrome = await chromeLauncher.launch({
+    port: Number(flags.port) || 0,
+    chromeFlags: chromeFlagList(flags.chromeFlags),
+  });
+  flags.port = chrome.port;
+
+  try {
+    const runnerResult = await lighthouse(url, flags, config);
+    if (!runnerResult) throw new Error('Lighthouse returned no result');
+
+    const outputs = Array.isArray(flags.output) ? flags.output : [flags.output];
+    const reports = Array.isArray(runnerResult.report) ? runnerResult.report : [runnerResult.report];
+
+    const response = {id: job.id, ok: true};
+    outputs.forEach((output, i) => {
+      const file = `${flags.outputPath}.report.${output}`;
+      fs.mkdirSync(path.dirname(file), {recursive: true});
+      fs.writeFileSync(file, reports[i]);
+      response[output] = file;
+    });
+    if (job.return_lhr) response.lhr = runnerResult.lhr;
+    return response;
+  } finally {
+    // no-op for a Chrome we only attached to
+    await chrome.kill();
+  }
+}
+
+send({ready: true, version: requireFromLh('./package.json').version});
+
+const rl = readline.createInterface({input: process.stdin, crlfDelay: Infinity});
+for await (const line of rl) {
+  if (!line.trim()) continue;
+  let job;
+  try {
+    job = JSON.parse(line);
+    send(await runJob(job));
+  } catch (err) {
+    send({id: job && job.id, ok: false, error: String(err && err.stack || err)});
+  }
+}
@@ -0,0 +1,121 @@
+# base/lighthouse_server.py
+import os
+import json
+import shutil
+import threading
+import subprocess
+from pathlib import Path
+
+from utils.process_tree import kill_tree
+
+
+class LighthouseServerError(RuntimeError):
+    pass
+
+
+class LighthouseServer:
+    """
+    Python side of lighthouse_server.mjs – one persistent Node process that
+    has Lighthouse loaded. Jobs are processed one at a time, so run_many
+    starts one server per worker.
+    """
+
+    SCRIPT = Path(__file__).with_name("lighthouse_server.mjs")
+
+    def __init__(self, node: str = "node", lighthouse_root: str = None):
+        self.node = node
+        self.lighthouse_root = lighthouse_root
+        self.version = None
+        self._proc = None
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def find_lighthouse_root():
+        if os.environ.get("LIGHTHOUSE_ROOT"):
+            return os.environ["LIGHTHOUSE_ROOT"]
+
+        npm = shutil.which("npm")
+        if npm:
+            npm_root = subprocess.run([npm, "root", "-g"], capture_output=True, text=True).stdout.strip()
+            if (Path(npm_root) / "lighthouse").exists():
+                return str(Path(npm_root) / "lighthouse")
+
+        raise FileNotFoundError("Lighthouse package not found – set LIGHTHOUSE_ROOT")
+
+    # ------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------
+    def start(self):
+        root = self.lighthouse_root or self.find_lighthouse_root()
+        env = {**os.environ, "LIGHTHOUSE_ROOT": root}
+
+        self._proc = subprocess.Popen(
+            [self.node, str(self.SCRIPT)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            env=env,
+        )
+
+        hello = self._read()
+        if not hello.get("ready"):
+            self.close()
+            raise LighthouseServerError(f"Lighthouse server failed to start: {hello}")
+        self.version = hello.get("version")
+        return self
+
+    def is_alive(self):
+        return self._proc is not None and self._proc.poll() is None
+
+    def kill(self):
+        # Hard stop (stuck job): the Node process and any Chrome it launched
+        if self._proc is not None:
+            kill_tree(self._proc.pid)
+            self._proc = None
+
+    def close(self):
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+        self._proc = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------
+    # Protocol
+    # ------------------------------------------------------
+    def _read(self):
+        line = self._proc.stdout.readline()
+        if not line:
+            raise LighthouseServerError("Lighthouse server exited")
+        return json.loads(line)
+
+    def submit(self, argv, return_lhr: bool = False):
+        """
+        argv: CLI-style flags (url first) – see LighthouseRunner.build_command.
+        Returns the server response: {"ok", "json", "html"[, "lhr"]}.
+        """
+        with self._lock:
+            if not self.is_alive():
+                self.start()
+
+            self._next_id += 1
+            job = {"id": self._next_id, "argv": [str(a) for a in argv], "return_lhr": return_lhr}
+            self._proc.stdin.write(json.dumps(job) + "\n")
+            self._proc.stdin.flush()
+
+            response = self._read()
+
+        if not response.get("ok"):
+            raise LighthouseServerError(response.get("error", "unknown error"))
+        return response
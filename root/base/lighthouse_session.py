@@ -0,0 +1,104 @@
+# base/lighthouse_session.py
+import os
+import re
+from pathlib import Path
+
+from base.lighthouse_runner import LighthouseRunner
+from base.wpr_proxy import WprProxy
+from utils.host_load import HostGovernor
+from utils.report_slimmer import ReportSlimmer
+
+
+class LighthouseSession:
+    """
+    Worker slots (debugging port, warm Chrome, Node server) that outlive a
+    single run_many_async() call – created once per pytest session (per
+    xdist worker) and shared by every test item.
+
+    Pool settings (WORKERS, CHROME, BACKEND, REPORTS, REPLAY, HOST_LOAD) are
+    per mode, so a process auditing several modes holds one session per
+    mode – `lane` of `lanes` – each with its own ports and scratch folder.
+    """
+
+    # Debugging ports reserved per session (xdist worker × lane)
+    PORTS_PER_SESSION = 20
+
+    def __init__(self, workers: int = 1, reuse_chrome: bool = False, max_runs_per_chrome: int = 20,
+                 backend: str = "cli", base_port: int = None, work_root: str = None, extra_flags=(),
+                 governor: HostGovernor = None, pipeline: str = "files"):
+        self.reuse_chrome = reuse_chrome
+        self.max_runs_per_chrome = max_runs_per_chrome
+        self.backend = backend
+        self.extra_flags = list(extra_flags)
+        self.pipeline = pipeline
+        self.slots = LighthouseRunner.make_slots(workers, base_port, work_root)
+        # Shared by every test of the session: the worker limit carries over
+        self.governor = governor
+
+    @staticmethod
+    def xdist_index():
+        # "gw3" → 3 ; 0 without xdist
+        m = re.match(r"gw(\d+)", os.environ.get("PYTEST_XDIST_WORKER", ""))
+        return int(m.group(1)) if m else 0
+
+    @staticmethod
+    def from_config(cfg: dict, workers: int = None, lane: int = 0, lanes: int = 1):
+        workers = workers or cfg.get("WORKERS", 1)
+        chrome_cfg = cfg.get("CHROME", {})
+        if workers > LighthouseSession.PORTS_PER_SESSION:
+            raise ValueError(f"WORKERS {workers} > {LighthouseSession.PORTS_PER_SESSION} slots per session")
+
+        # Every xdist process (and every mode's session in it) gets its own
+        # port range and scratch folder
+        index = LighthouseSession.xdist_index()
+        work_root = Path(LighthouseRunner.WORK_ROOT) / f"gw{index}"
+        slimmer = ReportSlimmer.from_config(cfg)
+        session = LighthouseSession(
+            workers=workers,
+            reuse_chrome=chrome_cfg.get("REUSE", False),
+            max_runs_per_chrome=chrome_cfg.get("MAX_RUNS", 20),
+            backend=cfg.get("BACKEND", "cli"),
+            base_port=LighthouseRunner.BASE_PORT + (index * lanes + lane) * LighthouseSession.PORTS_PER_SESSION,
+            work_root=str(work_root / f"lane_{lane}" if lanes > 1 else work_root),
+            extra_flags=slimmer.capture_flags() if slimmer else (),
+            governor=HostGovernor.from_config(cfg, workers),
+            pipeline=cfg.get("REPORTS", {}).get("PIPELINE", "files"),
+        )
+
+        # Replay: one WPR proxy per slot, port pair derived from the slot's
+        # (already xdist-unique) debugging port
+        replay_cfg = cfg.get("REPLAY", {})
+        if replay_cfg.get("MODE", "off") != "off":
+            for slot in session.slots:
+                offset = 2 * (slot["port"] - LighthouseRunner.BASE_PORT)
+                slot["replay"] = WprProxy(
+                    http_port=replay_cfg.get("HTTP_PORT", 8080) + offset,
+                    https_port=replay_cfg.get("HTTP_PORT", 8080) + offset + 1,
+                    wpr_path=replay_cfg.get("WPR_PATH"),
+                    wpr_dir=replay_cfg.get("WPR_DIR"),
+                )
+        return session
+
+    async def run_many(self, jobs, **kwargs):
+        """run_many_async() on this session's slots; kwargs: timeout, retries, backoff, deadline."""
+        async for res in LighthouseRunner.run_many_async(
+            jobs,
+            reuse_chrome=self.reuse_chrome,
+            max_runs_per_chrome=self.max_runs_per_chrome,
+            backend=self.backend,
+            slots=self.slots,
+            extra_flags=self.extra_flags,
+            governor=self.governor,
+            pipeline=self.pipeline,
+            **kwargs,
+        ):
+            yield res
+
+    def close(self):
+        LighthouseRunner.close_slots(self.slots)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
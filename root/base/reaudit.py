@@ -0,0 +1,98 @@
+# base/reaudit.py
+"""
+Regenerate reports from gathered artifacts – no browser, no page load.
+
+    cd root && python -m base.reaudit --store ../artifact_store --out ../reaudit
+    cd root && python -m base.reaudit --mode mobile --page "home*" --lh-flag=--only-categories=performance
+
+Every run indexed in the ArtifactStore is audited again (`lighthouse -A`)
+with the flags the suite would use today (mode preset, REPORTS profile)
+plus any --lh-flag, on a thread pool. One JSON line per re-audited run on
+stdout, scored against the current thresholds – exit code 1 when any run
+misses its threshold or fails to re-audit.
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import subprocess
+from fnmatch import fnmatch
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from base.cli import emit, threshold
+from base.lighthouse_runner import LighthouseRunner
+from utils.artifact_store import ArtifactStore
+from utils.config_reader import ConfigReader
+from utils.report_slimmer import ReportSlimmer
+from utils.run_result import RunResult
+
+
+def select(entries, modes=None, brands=None, pages=None):
+    return [
+        e for e in entries
+        if (not modes or e["mode"] in modes)
+        and (not brands or any(fnmatch(e["brand"], b) for b in brands))
+        and (not pages or any(fnmatch(e["page"], p) or fnmatch(e["url"], p) for p in pages))
+    ]
+
+
+def reaudit_run(entry, store: ArtifactStore, out_root, lh_flags=()):
+    cfg = ConfigReader.load_config(f"config_{entry['mode']}.json")
+    slimmer = ReportSlimmer.from_config(cfg)
+    artifact_dir = (store.root / entry["key"]).resolve()
+
+    flags = [f"--audit-mode={artifact_dir}", *(slimmer.capture_flags() if slimmer else []), *lh_flags]
+    report_dir = Path(out_root) / entry["key"]
+    # Work dir next to the output – parallel re-audits never share a stem
+    json_path, html_path, _, _ = LighthouseRunner.run(entry["url"], entry["mode"], str(report_dir),
+                                                      work_dir=str(report_dir / "out"), extra_flags=flags)
+    shutil.rmtree(report_dir / "out", ignore_errors=True)
+    return RunResult(run=entry["run"], json=json_path, html=html_path, **LighthouseRunner.parse_summary(json_path))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-audit gathered Lighthouse artifacts")
+    parser.add_argument("--store", default="artifact_store")
+    parser.add_argument("--out", default="reaudit")
+    parser.add_argument("--mode", action="append", choices=["desktop", "mobile"])
+    parser.add_argument("--brand", action="append", help="brand glob, repeatable")
+    parser.add_argument("--page", action="append", help="page name or URL glob, repeatable")
+    parser.add_argument("--lh-flag", action="append", default=[], help="extra Lighthouse flag, repeatable")
+    parser.add_argument("--workers", type=int, default=None, help="parallel re-audits (default: CPUs)")
+    args = parser.parse_args(argv)
+
+    store = ArtifactStore(args.store)
+    entries = select(sorted(store.entries().values(), key=lambda e: e["key"]), args.mode, args.brand, args.page)
+    if not entries:
+        print(f"No gathered runs in {store.root} match the selection", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    failed = 0
+    # Audits are CPU-bound Node processes – one per core
+    with ThreadPoolExecutor(max_workers=args.workers or os.cpu_count() or 1) as pool:
+        futures = {pool.submit(reaudit_run, e, store, args.out, args.lh_flag): e for e in entries}
+        for future in as_completed(futures):
+            e = futures[future]
+            line = {"type": "run", "mode": e["mode"], "view": e.get("view", "cold"), "brand": e["brand"],
+                    "page_name": e["page"], "url": e["url"], "run": e["run"], "gathered_at": e["gathered_at"]}
+            try:
+                r = future.result()
+            except (subprocess.CalledProcessError, OSError, ValueError, KeyError) as err:
+                failed += 1
+                emit({**line, "error": str(err)})
+                continue
+
+            limit = threshold(e["mode"], e.get("view", "cold"))
+            passed = r.value("Performance") is not None and r.value("Performance") >= limit
+            failed += not passed
+            emit({**line, **r.to_dict(), "threshold": limit, "passed": passed, "error": None})
+
+    print(f"Re-audited {len(entries)} runs in {time.perf_counter() - start:.1f}s, {failed} failing", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,138 @@
+# base/result_cache.py
+import os
+import re
+import json
+import time
+import shutil
+import hashlib
+from pathlib import Path
+
+import requests
+
+from base.lighthouse_runner import LighthouseRunner
+from utils.report_slimmer import ReportSlimmer
+from utils.run_result import RunResult
+
+# Attributes that change on every response without the page changing
+_VOLATILE = re.compile(rb'\s(?:nonce|data-csrf|csrf-token|data-nonce)="[^"]*"', re.I)
+_SUBRESOURCE = re.compile(rb'<(?:script|link|img|source|iframe)\b[^>]*?\s(?:src|href)="([^"]+)"', re.I)
+
+
+class ResultCache:
+    """
+    Persistent cache of page results, so unchanged pages are not audited again.
+
+    Key = URL + mode + Lighthouse version + Lighthouse flags + page fingerprint.
+    The fingerprint is ETag / Last-Modified when the server sends them,
+    otherwise a hash of the HTML (volatile nonces stripped) and its list of
+    sub-resources. Entries older than TTL_HOURS are never trusted.
+    Set LH_FORCE_RUN=1 to bypass the cache for a full run.
+    """
+
+    def __init__(self, root: str = ".lighthouse_cache", ttl_hours: float = 24, extra_flags=()):
+        self.root = Path(root)
+        self.ttl = ttl_hours * 3600
+        self.extra_flags = list(extra_flags)
+
+    @staticmethod
+    def from_config(cfg: dict):
+        c = cfg.get("CACHE", {})
+        if not c.get("ENABLED", False) or os.environ.get("LH_FORCE_RUN") == "1":
+            return None
+        slimmer = ReportSlimmer.from_config(cfg)
+        return ResultCache(c.get("ROOT", ".lighthouse_cache"), c.get("TTL_HOURS", 24),
+                           extra_flags=slimmer.capture_flags() if slimmer else ())
+
+    # ------------------------------------------------------
+    # Key parts
+    # ------------------------------------------------------
+    @staticmethod
+    def lighthouse_version():
+        return LighthouseRunner.lighthouse_version()
+
+    @staticmethod
+    def fingerprint(url: str, timeout: float = 10):
+        try:
+            head = requests.head(url, allow_redirects=True, timeout=timeout)
+            validators = [head.headers.get(h) for h in ("ETag", "Last-Modified")]
+            if any(validators):
+                return "hdr:" + "|".join(v or "" for v in validators)
+
+            body = requests.get(url, timeout=timeout).content
+        except requests.RequestException:
+            return None
+
+        h = hashlib.sha256(_VOLATILE.sub(b"", body))
+        for src in sorted(set(_SUBRESOURCE.findall(body))):
+            h.update(src)
+        return "html:" + h.hexdigest()
+
+    def page_key(self, url: str, mode: str, view: str = "cold"):
+        fp = self.fingerprint(url)
+        if fp is None:
+            return None  # can't tell whether the page changed → audit it
+
+        # The flags Lighthouse would run with, minus per-run output paths
+        extra_flags = [*self.extra_flags, *(LighthouseRunner.WARM_FLAGS if view == "warm" else [])]
+        flags = [f for f in LighthouseRunner.build_command(url, mode, "-", extra_flags=extra_flags)[2:]
+                 if not f.startswith("--output-path=")]
+        raw = json.dumps([url, mode, self.lighthouse_version(), flags, fp])  # warm differs by its flags
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    # ------------------------------------------------------
+    # Get / put
+    # ------------------------------------------------------
+    def get(self, key: str, report_dir_for):
+        """
+        report_dir_for(run) -> directory the cached reports are restored into.
+        Returns run results marked "cached": True, or None on a miss.
+        """
+        entry_dir = self.root / key
+        meta_path = entry_dir / "entry.json"
+        if not meta_path.exists():
+            return None
+
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if time.time() - meta["created"] > self.ttl:
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return None
+
+        run_results = []
+        for r in meta["runs"]:
+            target = Path(report_dir_for(r["run"]))
+            target.mkdir(parents=True, exist_ok=True)
+            json_path = target / r["json_name"]
+            html_path = target / (r["html_name"] or Path(r["json_name"]).with_suffix(".html").name)
+            shutil.copyfile(entry_dir / r["json_name"], json_path)
+            if r["html_name"]:  # stdout pipeline: no HTML unless it was rendered
+                shutil.copyfile(entry_dir / r["html_name"], html_path)
+            run_results.append(RunResult(
+                **r["result"],
+                json=json_path,
+                html=html_path,
+                cached=True,
+                cached_at=meta["created"],
+            ))
+        return run_results
+
+    def put(self, key: str, run_results):
+        entry_dir = self.root / key
+        tmp_dir = self.root / f"{key}.tmp{os.getpid()}"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+
+        runs = []
+        for r in run_results:
+            json_name = f"run_{r['run']}_{Path(r['json']).name}"
+            html_name = f"run_{r['run']}_{Path(r['html']).name}" if Path(r["html"]).exists() else None
+            shutil.copyfile(r["json"], tmp_dir / json_name)
+            if html_name:
+                shutil.copyfile(r["html"], tmp_dir / html_name)
+            # scores, metrics, … – everything except the report paths
+            result = r.to_dict(paths=False)
+            runs.append({"run": r["run"], "json_name": json_name, "html_name": html_name, "result": result})
+
+        (tmp_dir / "entry.json").write_text(json.dumps({"created": time.time(), "runs": runs}), encoding="utf-8")
+
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        os.replace(tmp_dir, entry_dir)
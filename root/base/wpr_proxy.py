@@ -0,0 +1,112 @@
+# base/wpr_proxy.py
+import os
+import time
+import shutil
+import signal
+import socket
+import subprocess
+from pathlib import Path
+
+
+class WprProxy:
+    """
+    Web Page Replay (catapult/web_page_replay_go) as a local record/replay
+    proxy for one worker slot.
+
+    Chrome is pointed at it with --host-resolver-rules, so *every* host
+    resolves to the proxy: in record mode it fetches from the live site and
+    writes an archive; in replay mode it serves only from the archive and
+    nothing leaves the machine. WPR also injects deterministic.js
+    (fixed Date / Math.random), which removes another source of variance.
+
+    WPR_PATH: the `wpr` binary (default: on PATH)
+    WPR_DIR:  web_page_replay_go checkout – wpr_cert.pem, wpr_key.pem,
+              deterministic.js (default: next to the binary)
+    """
+
+    # SPKI hash of the test certificate shipped with WPR (wpr_cert.pem)
+    DEFAULT_SPKI = "PhrPvGIaAMmd29hj8BCZOq096yj7uMpRNHpn5PDxI6I="
+
+    def __init__(self, http_port: int, https_port: int, wpr_path: str = None, wpr_dir: str = None,
+                 spki: str = None, startup_timeout: float = 15.0):
+        self.http_port = http_port
+        self.https_port = https_port
+        self.wpr_path = wpr_path or os.environ.get("WPR_PATH") or shutil.which("wpr")
+        if not self.wpr_path:
+            raise FileNotFoundError("wpr (Web Page Replay) not found – set WPR_PATH")
+        self.wpr_dir = Path(wpr_dir or os.environ.get("WPR_DIR") or Path(self.wpr_path).resolve().parent)
+        self.spki = spki or self.DEFAULT_SPKI
+        self.startup_timeout = startup_timeout
+        self.action = None
+        self.archive = None
+        self._proc = None
+
+    def chrome_flags(self):
+        rules = (f"MAP *:80 127.0.0.1:{self.http_port},"
+                 f"MAP *:443 127.0.0.1:{self.https_port},"
+                 "EXCLUDE localhost")
+        return [f'--host-resolver-rules="{rules}"', f"--ignore-certificate-errors-spki-list={self.spki}"]
+
+    # ------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------
+    def is_alive(self):
+        return self._proc is not None and self._proc.poll() is None
+
+    def _port_open(self):
+        try:
+            with socket.create_connection(("127.0.0.1", self.http_port), timeout=0.5):
+                return True
+        except OSError:
+            return False
+
+    def start(self, action: str, archive):
+        if action not in ("record", "replay"):
+            raise ValueError(f"Unknown WPR action: {action}")
+        if action == "replay" and not Path(archive).exists():
+            raise FileNotFoundError(f"No recording: {archive}")
+        Path(archive).parent.mkdir(parents=True, exist_ok=True)
+
+        cmd = [
+            self.wpr_path, action,
+            f"--http_port={self.http_port}",
+            f"--https_port={self.https_port}",
+            f"--https_cert_file={self.wpr_dir / 'wpr_cert.pem'}",
+            f"--https_key_file={self.wpr_dir / 'wpr_key.pem'}",
+            f"--inject_scripts={self.wpr_dir / 'deterministic.js'}",
+            str(archive),
+        ]
+        self._proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                      start_new_session=True)
+        self.action, self.archive = action, str(archive)
+
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self._proc.poll() is not None:
+                break
+            if self._port_open():
+                return self
+            time.sleep(0.1)
+
+        self.stop()
+        raise RuntimeError(f"wpr {action} did not start on port {self.http_port}")
+
+    def stop(self):
+        # SIGINT: a recording wpr writes its archive on the way out
+        if self._proc is not None:
+            if self._proc.poll() is None:
+                os.killpg(self._proc.pid, signal.SIGINT)
+                try:
+                    self._proc.wait(timeout=30)
+                except subprocess.TimeoutExpired:
+                    os.killpg(self._proc.pid, signal.SIGKILL)
+                    self._proc.wait()
+            self._proc = None
+        self.action = self.archive = None
+
+    def ensure(self, action: str, archive):
+        """Proxy running in `action` mode on `archive` – restarted only when that changes."""
+        if self.is_alive() and self.action == action and self.archive == str(archive):
+            return self
+        self.stop()
+        return self.start(action, archive)
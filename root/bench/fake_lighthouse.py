@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# bench/fake_lighthouse.py
+"""
+Stand-in for the `lighthouse` CLI – no Chrome, no network.
+
+Accepts the flags LighthouseRunner passes, sleeps for the configured
+latency and writes a canned report shaped like a real one (pretty-printed
+LHR with the audits we read, padded with screenshot-like base64 to the
+configured size, plus an HTML report embedding the same JSON). Honours
+--skip-audits, --disable-full-page-screenshot and --gather-mode /
+--audit-mode (a tiny artifacts.json; audit-only runs skip the "page load").
+
+    FAKE_LH_LATENCY_MS   time "spent auditing" per run    (default 200)
+    FAKE_LH_JITTER_MS    ± uniform jitter on the latency  (default 0)
+    FAKE_LH_REPORT_KB    approximate JSON report size     (default 1500)
+    FAKE_LH_FAIL_RATE    fraction of runs exiting with 1  (default 0)
+    FAKE_LH_SLOW_RATE    fraction of runs on a "slow host" (benchmarkIndex 600, default 0)
+    FAKE_LH_INVALID_RATE fraction of runs with a runtimeError (NO_FCP, null
+                         performance score; report written, exit 1, default 0)
+"""
+import os
+import sys
+import json
+import time
+import random
+
+VERSION = "12.2.1"
+
+METRICS = {
+    "first-contentful-paint": (1200, 0.9),
+    "largest-contentful-paint": (2400, 0.8),
+    "total-blocking-time": (180, 0.8),
+    "cumulative-layout-shift": (0.02, 1),
+    "speed-index": (1600, 0.9),
+    "interactive": (3100, 0.8),
+    "total-byte-weight": (1650000, 0.9),
+}
+
+
+def benchmark_index():
+    return 600 if random.random() < float(os.environ.get("FAKE_LH_SLOW_RATE", 0)) else 1800
+
+
+def build_report(url: str, size_kb: int, latency_ms: float, skip_audits=(), no_full_page=False):
+    rnd = random.Random(f"{url}{time.time_ns()}")
+    score = lambda: round(rnd.uniform(0.6, 1.0), 2)
+
+    audits = {
+        audit_id: {"id": audit_id, "score": s, "numericValue": v * rnd.uniform(0.9, 1.1)}
+        for audit_id, (v, s) in METRICS.items()
+    }
+    lhr = {
+        "lighthouseVersion": VERSION,
+        "requestedUrl": url,
+        "finalUrl": url,
+        "fetchTime": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime()),
+        "runWarnings": [],
+        "environment": {"benchmarkIndex": benchmark_index(), "hostUserAgent": "fake", "networkUserAgent": "fake"},
+        "configSettings": {"formFactor": "desktop", "throttlingMethod": "simulate",
+                           "throttling": {"rttMs": 40, "throughputKbps": 10240, "cpuSlowdownMultiplier": 1}},
+        "categories": {
+            "performance": {"id": "performance", "score": score()},
+            "accessibility": {"id": "accessibility", "score": score()},
+            "best-practices": {"id": "best-practices", "score": score()},
+            "seo": {"id": "seo", "score": score()},
+        },
+        "audits": {
+            "screenshot-thumbnails": {"id": "screenshot-thumbnails", "details": {"type": "filmstrip", "items": []}},
+            **audits,
+        },
+        "fullPageScreenshot": {"screenshot": {"data": ""}},
+        # Same entry names as Lighthouse (ms since process start)
+        "timing": {
+            "entries": [
+                {"name": "lh:runner:gather", "startTime": 30, "duration": latency_ms * 0.8, "entryType": "measure"},
+                {"name": "lh:gather:loadPage-navigation", "startTime": 40, "duration": latency_ms * 0.6,
+                 "entryType": "measure"},
+                {"name": "lh:runner:audit", "startTime": 30 + latency_ms * 0.8, "duration": latency_ms * 0.2,
+                 "entryType": "measure"},
+                {"name": "lh:runner:generate", "startTime": 30 + latency_ms, "duration": 5, "entryType": "measure"},
+            ],
+            "total": latency_ms + 35,
+        },
+    }
+
+    # Real reports are mostly base64 screenshots plus big detail tables –
+    # pad with the same shape (40% filmstrip, 30% full-page screenshot, 30% tables)
+    base = len(json.dumps(lhr, indent=2))
+    padding = max(0, size_kb * 1024 - base)
+    frames = 10
+    lhr["audits"]["screenshot-thumbnails"]["details"]["items"] = [
+        {"timing": i * 300, "data": "data:image/jpeg;base64," + "A" * (padding * 4 // 10 // frames)}
+        for i in range(frames)
+    ]
+    lhr["fullPageScreenshot"]["screenshot"]["data"] = "data:image/webp;base64," + "B" * (padding * 3 // 10)
+
+    rows = max(1, padding * 3 // 10 // 2 // 160)
+    lhr["audits"]["network-requests"] = {
+        "id": "network-requests", "score": None, "scoreDisplayMode": "informative",
+        "details": {"type": "table", "items": [
+            {"url": f"{url}static/chunk-{i}.js", "transferSize": rnd.randint(1000, 90000),
+             "resourceType": "Script", "startTime": i * 3.5, "endTime": i * 3.5 + 40}
+            for i in range(rows)
+        ]},
+    }
+    lhr["audits"]["unused-javascript"] = {
+        "id": "unused-javascript", "score": 0.5, "numericValue": 300, "numericUnit": "millisecond",
+        "details": {"type": "opportunity", "overallSavingsMs": rnd.randint(100, 500), "overallSavingsBytes": 50000,
+                    "items": [
+                        {"url": f"{url}static/chunk-{i}.js", "wastedBytes": rnd.randint(100, 50000),
+                         "totalBytes": 90000, "wastedPercent": rnd.uniform(1, 90)}
+                        for i in range(rows)
+                    ]},
+    }
+    lhr["audits"]["render-blocking-resources"] = {
+        "id": "render-blocking-resources", "score": 0.5, "numericValue": 0, "numericUnit": "millisecond",
+        "details": {"type": "opportunity", "overallSavingsMs": 0, "items": [
+            {"url": f"{url}static/{name}", "totalBytes": rnd.randint(5000, 40000), "wastedMs": rnd.randint(0, 300)}
+            for name in ("main.css", "fonts.css", "vendor.js")
+        ]},
+    }
+    rbr = lhr["audits"]["render-blocking-resources"]
+    rbr["numericValue"] = rbr["details"]["overallSavingsMs"] = max(i["wastedMs"] for i in rbr["details"]["items"])
+
+    # Capture-time switches (the slim profile)
+    for audit_id in skip_audits:
+        lhr["audits"].pop(audit_id, None)
+    if no_full_page:
+        del lhr["fullPageScreenshot"]
+    return lhr
+
+
+def main(args):
+    if "--version" in args:
+        print(VERSION)
+        return 0
+
+    url = next(a for a in args if not a.startswith("-"))
+    out = next((a.split("=", 1)[1] for a in args if a.startswith("--output-path=")), "stdout")
+    outputs = [a.split("=", 1)[1] for a in args if a.startswith("--output=")] or ["html"]
+
+    gather_dir = next((a.split("=", 1)[1] for a in args if a.startswith("--gather-mode=")), None)
+    audit_dir = next((a.split("=", 1)[1] for a in args if a.startswith("--audit-mode=")), None)
+    if audit_dir and not gather_dir and not os.path.exists(os.path.join(audit_dir, "artifacts.json")):
+        print(f"Runtime error encountered: no artifacts in {audit_dir}", file=sys.stderr)
+        return 1
+
+    latency = float(os.environ.get("FAKE_LH_LATENCY_MS", 200))
+    jitter = float(os.environ.get("FAKE_LH_JITTER_MS", 0))
+    if not audit_dir or gather_dir:
+        time.sleep(max(0.0, latency + random.uniform(-jitter, jitter)) / 1000)
+    if gather_dir:
+        os.makedirs(gather_dir, exist_ok=True)
+        with open(os.path.join(gather_dir, "artifacts.json"), "w", encoding="utf-8") as f:
+            json.dump({"URL": {"requestedUrl": url}, "fetchTime": time.time()}, f)
+
+    if random.random() < float(os.environ.get("FAKE_LH_FAIL_RATE", 0)):
+        print("Runtime error encountered: fake failure", file=sys.stderr)
+        return 1
+
+    # Lighthouse writes JSON.stringify(lhr, null, 2)
+    skip_audits = [a for f in args if f.startswith("--skip-audits=") for a in f.split("=", 1)[1].split(",")]
+    lhr = build_report(url, int(os.environ.get("FAKE_LH_REPORT_KB", 1500)), latency,
+                       skip_audits, "--disable-full-page-screenshot" in args)
+    # Like the real CLI: the report is saved, then the run exits 1
+    invalid = random.random() < float(os.environ.get("FAKE_LH_INVALID_RATE", 0))
+    if invalid:
+        lhr["runtimeError"] = {"code": "NO_FCP", "message": "The page did not paint any content."}
+        lhr["categories"]["performance"]["score"] = None
+    report = json.dumps(lhr, indent=2)
+    embedded = report.replace("<", "\\u003c")
+    rendered = {
+        "json": report,
+        "html": "<!doctype html><html><head><title>Lighthouse Report</title></head><body>"
+                f"<script>window.__LIGHTHOUSE_JSON__ = {embedded};</script>"
+                "</body></html>",
+    }
+
+    if out == "stdout":
+        sys.stdout.write(rendered[outputs[0]])
+    else:
+        for ext in outputs:
+            path = f"{out}.report.{ext}" if len(outputs) > 1 else out
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(rendered[ext])
+
+    if invalid:
+        print("Runtime error encountered: The page did not paint any content.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
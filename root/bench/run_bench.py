@@ -0,0 +1,259 @@
+# bench/run_bench.py
+"""
+Offline benchmark of the harness's own overhead – no Chrome, no network.
+
+    cd root && python -m bench.run_bench --pages 10 100 1000 --concurrency 1 4 8
+    cd root && python -m bench.run_bench --compare <commit>
+
+Puts bench/fake_lighthouse.py on PATH as `lighthouse` and pushes every page
+through the same pipeline the tests use, timing each stage:
+
+    lighthouse  LighthouseSession.run_many (spawn, fake audit, renames / stdout)
+    parse       LighthouseRunner.parse_summary → RunResult (from the bytes with --pipeline stdout)
+    stats       RunStats over all pages
+    slim        ReportSlimmer.slim_files (--slim only)
+    attach      AttachmentPolicy.attach_run (no-op allure outside pytest)
+    save        BaseTest.save_all_runs (report store or legacy copy)
+
+"overhead" is the lighthouse stage minus what the fake costs when called
+directly (calibrated once: interpreter start, sleep, report write), i.e.
+what our orchestration adds per run. Results go to
+bench/results/<commit>.json.
+"""
+import os
+import sys
+import json
+import math
+import time
+import shutil
+import asyncio
+import argparse
+import platform
+import tempfile
+import subprocess
+from pathlib import Path
+
+from base.attachment_policy import AttachmentPolicy
+from base.base_test import BaseTest
+from base.lighthouse_runner import LighthouseRunner
+from base.lighthouse_session import LighthouseSession
+from utils.report_slimmer import ReportSlimmer
+from utils.run_result import RunResult
+from utils.run_stats import RunStats
+
+BENCH_DIR = Path(__file__).resolve().parent
+RESULTS_DIR = BENCH_DIR / "results"
+STAGES = ("lighthouse", "parse", "stats", "slim", "attach", "save")
+
+
+def git_commit():
+    try:
+        sha = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR,
+                             capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=BENCH_DIR,
+                               capture_output=True, text=True).stdout.strip()
+        return f"{sha}-dirty" if dirty else sha
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def fake_path(bin_dir: Path):
+    # `lighthouse` → fake_lighthouse.py, first on PATH
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    shim = bin_dir / "lighthouse"
+    shim.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{BENCH_DIR / "fake_lighthouse.py"}" "$@"\n')
+    shim.chmod(0o755)
+    return f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"
+
+
+def calibrate(samples: int = 5):
+    """Wall time of one bare fake_lighthouse call (no harness around it), in seconds."""
+    work = Path(tempfile.mkdtemp(prefix="lh_bench_cal_"))
+    try:
+        start = time.perf_counter()
+        for i in range(samples):
+            subprocess.run(["lighthouse", "https://bench.local/calibrate", "--output=json", "--output=html",
+                            f"--output-path={work / str(i)}"], check=True)
+        return (time.perf_counter() - start) / samples
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+# ------------------------------------------------------
+# One case: N pages x runs at a given concurrency
+# ------------------------------------------------------
+def run_case(pages: int, runs: int, concurrency: int, fake_s: float, attach_mode: str, store: bool,
+             slimmer: ReportSlimmer = None, pipeline: str = "files"):
+    work = Path(tempfile.mkdtemp(prefix="lh_bench_"))
+    cwd = os.getcwd()
+    os.chdir(work)
+    BaseTest._report_store = None  # per-process singleton – fresh store per case
+
+    try:
+        jobs = [
+            {
+                "url": f"https://bench.local/page_{p}",
+                "mode": "desktop",
+                "page_name": f"page_{p}",
+                "run": r,
+                "report_dir": f"reports_desktop/bench/run_{r}",
+            }
+            for p in range(pages)
+            for r in range(1, runs + 1)
+        ]
+        timings = {}
+
+        # lighthouse
+        outputs, errors = [], 0
+        start = time.perf_counter()
+
+        async def collect():
+            nonlocal errors
+            flags = slimmer.capture_flags() if slimmer else ()
+            with LighthouseSession(workers=concurrency, work_root="reports_workers", extra_flags=flags,
+                                   pipeline=pipeline) as session:
+                async for res in session.run_many(jobs):
+                    if res["error"] is not None:
+                        errors += 1
+                    else:
+                        outputs.append(res)
+
+        asyncio.run(collect())
+        timings["lighthouse"] = time.perf_counter() - start
+
+        # parse
+        start = time.perf_counter()
+        results = {}
+        for res in outputs:
+            results.setdefault(res["page_name"], []).append(RunResult(
+                run=res["run"], json=res["json"], html=res["html"],
+                **LighthouseRunner.parse_summary(res["report"] or res["json"]),
+            ))
+        timings["parse"] = time.perf_counter() - start
+
+        # stats
+        start = time.perf_counter()
+        RunStats(results)
+        timings["stats"] = time.perf_counter() - start
+
+        # slim
+        start = time.perf_counter()
+        if slimmer:
+            for run_results in results.values():
+                for r in run_results:
+                    slimmer.slim_files(r["json"], r["html"])
+        timings["slim"] = time.perf_counter() - start
+
+        # attach
+        start = time.perf_counter()
+        policy = AttachmentPolicy(attach_mode)
+        for page_name, run_results in results.items():
+            for r in run_results:
+                policy.attach_run(r, f"[RUN {r['run']}] {page_name}", important=False)
+        timings["attach"] = time.perf_counter() - start
+
+        # save
+        start = time.perf_counter()
+        test = BaseTest()
+        test.cfg = {"REPORT_STORE": {"ENABLED": store, "ROOT": "report_store"}}
+        for page_name, run_results in results.items():
+            test.save_all_runs(True, "desktop", "bench", page_name, run_results)
+        timings["save"] = time.perf_counter() - start
+
+        total = sum(timings.values())
+        ideal = math.ceil(len(jobs) / concurrency) * fake_s
+        return {
+            "pages": pages,
+            "runs": len(jobs),
+            "concurrency": concurrency,
+            "errors": errors,
+            "total_s": round(total, 3),
+            "runs_per_s": round(len(outputs) / total, 2) if total else None,
+            "overhead_ms_per_run": round(max(0.0, timings["lighthouse"] - ideal) * 1000 / max(1, len(jobs)), 2),
+            "stages_s": {k: round(v, 4) for k, v in timings.items()},
+        }
+    finally:
+        os.chdir(cwd)
+        BaseTest._report_store = None
+        shutil.rmtree(work, ignore_errors=True)
+
+
+# ------------------------------------------------------
+# Output
+# ------------------------------------------------------
+def print_table(cases, baseline=None):
+    base = {(c["pages"], c["concurrency"]): c for c in (baseline or {}).get("cases", [])}
+    header = f"{'pages':>6} {'conc':>4} {'runs/s':>8} {'ovh ms':>7} " + " ".join(f"{s:>10}" for s in STAGES)
+    print(header)
+    print("-" * len(header))
+
+    for c in cases:
+        line = (f"{c['pages']:>6} {c['concurrency']:>4} {c['runs_per_s']:>8} {c['overhead_ms_per_run']:>7} "
+                + " ".join(f"{c['stages_s'][s]:>10.3f}" for s in STAGES))
+        print(line)
+
+        prev = base.get((c["pages"], c["concurrency"]))
+        # results saved before a stage existed
+        prev = prev and {**prev, "stages_s": {s: prev["stages_s"].get(s, 0) for s in STAGES}}
+        if prev:
+            delta = lambda new, old: f"{(new - old) / old:+.0%}" if old else "n/a"
+            print(f"{'vs ' + baseline['commit']:>11} {delta(c['runs_per_s'], prev['runs_per_s']):>8} "
+                  f"{delta(c['overhead_ms_per_run'], prev['overhead_ms_per_run']):>7} "
+                  + " ".join(f"{delta(c['stages_s'][s], prev['stages_s'][s]):>10}" for s in STAGES))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark harness overhead with a fake Lighthouse")
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--runs", type=int, default=1, help="runs per page")
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--report-kb", type=int, default=1500)
+    parser.add_argument("--attach-mode", default="path", choices=AttachmentPolicy.MODES)
+    parser.add_argument("--legacy-save", action="store_true", help="copy reports instead of the report store")
+    parser.add_argument("--slim", action="store_true", help="slim report profile (capture flags + post-processing)")
+    parser.add_argument("--pipeline", default="files", choices=LighthouseRunner.PIPELINES,
+                        help="report pipeline (REPORTS.PIPELINE)")
+    parser.add_argument("--out", default=None, help="result file (default bench/results/<commit>.json)")
+    parser.add_argument("--compare", default=None, help="commit (or result file) to compare against")
+    args = parser.parse_args(argv)
+
+    os.environ["PATH"] = fake_path(Path(tempfile.mkdtemp(prefix="lh_bench_bin_")))
+    os.environ["FAKE_LH_LATENCY_MS"] = str(args.latency_ms)
+    os.environ["FAKE_LH_REPORT_KB"] = str(args.report_kb)
+
+    baseline = None
+    if args.compare:
+        compare = Path(args.compare)
+        compare = compare if compare.exists() else RESULTS_DIR / f"{args.compare}.json"
+        baseline = json.loads(compare.read_text(encoding="utf-8"))
+
+    fake_s = calibrate()
+    cases = []
+    for pages in args.pages:
+        for concurrency in args.concurrency:
+            cases.append(run_case(pages, args.runs, concurrency, fake_s,
+                                  args.attach_mode, store=not args.legacy_save,
+                                  slimmer=ReportSlimmer() if args.slim else None, pipeline=args.pipeline))
+
+    commit = git_commit()
+    result = {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+        "host": {"platform": platform.platform(), "python": platform.python_version(), "cpus": os.cpu_count()},
+        "params": {k: v for k, v in vars(args).items() if k not in ("out", "compare")},
+        "fake_ms": round(fake_s * 1000, 2),
+        "cases": cases,
+    }
+
+    out = Path(args.out) if args.out else RESULTS_DIR / f"{commit}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(result, indent=2), encoding="utf-8")
+
+    print(f"fake lighthouse alone: {fake_s * 1000:.1f} ms/run, {os.cpu_count()} cpu(s)\n")
+    print_table(cases, baseline)
+    print(f"\nSaved → {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+# tests/conftest.py
+import os
+import json
+import time
+from pathlib import Path
+
+import allure
+import pytest
+
+from base.lighthouse_runner import LighthouseRunner
+from base.lighthouse_session import LighthouseSession
+from utils.artifact_store import ArtifactStore
+from utils.config_reader import ConfigReader
+from utils.report_store import ReportStore
+from utils.shard_planner import ShardPlanner, item_id
+from utils.tracing import TRACER
+
+MODES = ["desktop", "mobile"]
+DURATIONS_FILE = Path(".lighthouse_durations.json")
+
+_durations = {}  # nodeid -> call duration of this session
+_outcomes = {}  # nodeid -> shard result entry (see write_shard_results)
+_started_at = None
+_trace_file = None  # set by the lighthouse_session fixture when TRACING is on
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("lighthouse")
+    group.addoption(
+        "--lh-mode", action="append", choices=MODES, default=None,
+        help="mode(s) to audit, repeatable (default: all)",
+    )
+    group.addoption(
+        "--lh-force", action="store_true", default=False,
+        help="ignore the result cache and audit every page",
+    )
+    group.addoption(
+        "--num-shards", type=int, default=1,
+        help="split the pages across this many CI nodes (balanced by past duration)",
+    )
+    group.addoption(
+        "--shard-id", type=int, default=0,
+        help="shard run by this node, 0 … num-shards-1",
+    )
+    group.addoption(
+        "--shard-results", default="shard_results",
+        help="directory for this shard's results (input of `utils.shard_planner merge`)",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--lh-force"):
+        os.environ["LH_FORCE_RUN"] = "1"  # read by ResultCache.from_config
+
+    # One attachment budget for the whole session – xdist workers inherit the
+    # ledger path before they start (read by AttachmentPolicy.from_config)
+    if not hasattr(config, "workerinput"):
+        ledger = Path(LighthouseRunner.WORK_ROOT) / f"attach_budget_{os.getpid()}.log"
+        ledger.parent.mkdir(parents=True, exist_ok=True)
+        ledger.write_text("", encoding="utf-8")
+        os.environ["LH_ATTACH_LEDGER"] = str(ledger.resolve())
+
+
+def pytest_sessionstart(session):
+    global _started_at
+    _started_at = time.time()
+
+    # Tracing is per process, not per mode – the selected modes must agree on it
+    tracing = {json.dumps(ConfigReader.load_config(f"config_{mode}.json").get("TRACING", {}), sort_keys=True)
+               for mode in selected_modes(session.config)}
+    if len(tracing) > 1:
+        raise pytest.UsageError(f"TRACING differs between the selected modes {selected_modes(session.config)}")
+
+    if hasattr(session.config, "workerinput"):
+        return  # xdist worker – the controller prunes before the workers start
+
+    # Age out gathered artifacts (MAX_AGE_DAYS) and archived reports (RETENTION_DAYS)
+    # once per session, before any run writes to the stores
+    roots = set()
+    for mode in selected_modes(session.config):
+        cfg = ConfigReader.load_config(f"config_{mode}.json")
+        for store in (ArtifactStore.from_config(cfg), ReportStore.from_config(cfg)):
+            if store is not None and store.root not in roots and store.index_path.exists():
+                roots.add(store.root)
+                store.prune()
+
+
+def selected_modes(config):
+    return config.getoption("--lh-mode") or MODES
+
+
+# ------------------------------------------------------
+# One test item per (mode, brand, page, view)
+# ------------------------------------------------------
+def pytest_generate_tests(metafunc):
+    if "lh_page" not in metafunc.fixturenames:
+        return
+
+    # VIEWS: "cold" (fresh profile) and/or "warm" (repeat view, primed cache)
+    params = [
+        (mode, brand, url, page_name, view)
+        for mode in selected_modes(metafunc.config)
+        for view in ConfigReader.load_config(f"config_{mode}.json").get("VIEWS", ["cold"])
+        for brand, url, page_name in ConfigReader.load_pages(mode)
+    ]
+    metafunc.parametrize(
+        "lh_page", params,
+        ids=[item_id(mode, brand, page_name, view) for mode, brand, _, page_name, view in params],
+    )
+
+
+# ------------------------------------------------------
+# Slowest pages first (durations of previous sessions)
+# ------------------------------------------------------
+def load_durations():
+    try:
+        return json.loads(DURATIONS_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def item_shard_id(item):
+    return item.callspec.id if hasattr(item, "callspec") else item.nodeid
+
+
+def pytest_collection_modifyitems(session, config, items):
+    durations = load_durations()
+
+    # This node's share of the pages – every node computes the same plan
+    num_shards = config.getoption("--num-shards")
+    if num_shards > 1:
+        planner = ShardPlanner(num_shards, durations)
+        mine = planner.select([item_shard_id(item) for item in items], config.getoption("--shard-id"))
+        deselected = [item for item in items if item_shard_id(item) not in mine]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if item_shard_id(item) in mine]
+
+    # Unknown pages count as slow so they start early too; stable sort keeps config order on ties
+    default = max(durations.values(), default=0)
+    items.sort(key=lambda item: -durations.get(item.nodeid, default))
+
+
+def pytest_runtest_logreport(report):
+    # Runs on the controller under xdist too (reports are forwarded)
+    if report.when == "call":
+        _durations[report.nodeid] = round(report.duration, 2)
+
+    # Per-page outcome for the shard merge; a failing setup counts as error
+    if report.when == "call" or report.failed:
+        outcome = "error" if report.when != "call" else report.outcome
+        entry = _outcomes.setdefault(report.nodeid, {"nodeid": report.nodeid})
+        if entry.get("outcome") in (None, "passed"):
+            entry["outcome"] = outcome
+        entry["duration"] = round(report.duration, 2) if report.when == "call" else entry.get("duration")
+        entry["finished_at"] = time.time()
+        entry.update(dict(report.user_properties))
+
+
+def write_shard_results(config):
+    out = Path(config.getoption("--shard-results"))
+    out.mkdir(parents=True, exist_ok=True)
+    shard_id = config.getoption("--shard-id")
+    finished_at = time.time()
+    data = {
+        "shard_id": shard_id,
+        "num_shards": config.getoption("--num-shards"),
+        "started_at": _started_at,
+        "finished_at": finished_at,
+        "wall_s": round(finished_at - _started_at, 2) if _started_at else None,
+        "items": list(_outcomes.values()),
+    }
+    (out / f"shard_{shard_id}.json").write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    # Every process (xdist worker) writes its own trace – the files merge by
+    # concatenating traceEvents, timestamps are epoch µs
+    if _trace_file and TRACER.spans:
+        worker = os.environ.get("PYTEST_XDIST_WORKER")
+        path = Path(_trace_file)
+        TRACER.export_chrome(path.with_name(f"{path.stem}.{worker}{path.suffix}") if worker else path)
+
+    if hasattr(session.config, "workerinput"):
+        return  # xdist worker – the controller writes the file
+    ledger = os.environ.pop("LH_ATTACH_LEDGER", None)
+    if ledger:
+        Path(ledger).unlink(missing_ok=True)
+    if session.config.getoption("--num-shards") > 1:
+        # Sharded: the durations file stays as the plan saw it (other shards
+        # may still be planning from it) – `shard_planner merge --durations`
+        # folds every shard's durations in once all are done
+        write_shard_results(session.config)
+    elif _durations:
+        DURATIONS_FILE.write_text(json.dumps({**load_durations(), **_durations}, indent=2), encoding="utf-8")
+
+
+# ------------------------------------------------------
+# Session-wide runner: warm Chrome / Node server per worker
+# ------------------------------------------------------
+@pytest.fixture(scope="session")
+def lighthouse_session(request):
+    """lighthouse_session(mode) → that mode's LighthouseSession, created on first use from its own config."""
+    global _trace_file
+    modes = selected_modes(request.config)
+    cfg = ConfigReader.load_config(f"config_{modes[0]}.json")
+    TRACER.configure(cfg)  # TRACING is the same for every selected mode (pytest_sessionstart)
+    if TRACER.enabled:
+        _trace_file = cfg.get("TRACING", {}).get("EXPORT")
+
+    sessions = {}
+
+    def get(mode):
+        if mode not in sessions:
+            cfg = ConfigReader.load_config(f"config_{mode}.json")
+            sessions[mode] = LighthouseSession.from_config(cfg, lane=modes.index(mode), lanes=len(modes))
+        return sessions[mode]
+
+    yield get
+    for session in sessions.values():
+        session.close()
+
+    # Per-stage summary of this session (this xdist worker)
+    if TRACER.enabled and TRACER.spans:
+        allure.attach(TRACER.summary_html(), "⏱️ Pipeline stage timings", allure.attachment_type.HTML)
@@ -0,0 +1,89 @@
+# tests/test_performance_lighthouse
+import allure
+import pytest
+import pytest_check as check
+from base.base_test import BaseTest
+from base.lighthouse_runner import LighthouseRunner
+from utils.config_reader import ConfigReader
+from utils.sampling import AdaptiveSampler
+
+
+class TestPerformanceLighthouse(BaseTest):
+    # One item per (mode, brand, page, view) – built from config_<mode>.json
+    # at collection time in conftest.py (select modes with --lh-mode)
+    RUNS_PER_PAGE = 3 # ==> run 3 times (when SAMPLING is disabled)
+
+    # ======================================================
+    # MAIN TEST
+    # ======================================================
+    def test_performance_lighthouse(self, lh_page, lighthouse_session, record_property):
+        mode, brand, url, page_name, view = lh_page
+
+        self.cfg = ConfigReader.load_config(f"config_{mode}.json")
+        # "desktop" or "desktop-warm": warm runs keep their own reports, history and cache
+        label = LighthouseRunner.view_label(mode, view)
+        allure.dynamic.title(f"{brand.upper()} {page_name} [{label}]")
+
+        # --------------------------
+        # Run Lighthouse n times – runs share this mode's warm workers
+        # --------------------------
+        all_results, errors, stats = self.run_pages(
+            brand, mode, [(url, page_name)], self.RUNS_PER_PAGE,
+            sampler=AdaptiveSampler.from_config(self.cfg),
+            session=lighthouse_session(mode),
+            view=view,
+        )
+        run_results = all_results[page_name]
+
+        # Timed out / crashed runs fail this page only
+        if page_name in errors:
+            check.is_true(
+                False,
+                f"💥 {brand.upper()} {page_name} Lighthouse error — " + "; ".join(errors[page_name])
+            )
+        if not run_results:
+            pytest.fail(f"{brand.upper()} {page_name} [{label}] produced no valid Lighthouse run")
+
+        # Detect abnormal drops
+        mean_perf, abnormal_runs = self.detect_abnormal(stats, page_name)
+
+        # Evaluate pass/fail on the median of all runs
+        final_scores = self.verdict_scores(stats, page_name)
+        threshold = self.cfg["THRESHOLDS_WARM" if view == "warm" else "THRESHOLDS"]["PERFORMANCE"] * 100
+        is_pass = final_scores["Performance"] >= threshold
+
+        # Compare against this page's own history, then record the runs
+        regressions = self.check_regression(brand, label, page_name, run_results, stats)
+        self.record_history(brand, label, page_name, run_results, is_pass)
+
+        # Slim profile: passing, normal runs drop heavy details before attach/save
+        self.slim_reports(brand, label, page_name, run_results, is_pass, abnormal_runs)
+
+        # Attach run HTML (per ATTACHMENTS policy)
+        self.attach_all_runs(brand, label, page_name, run_results, is_pass, abnormal_runs)
+        self.attach_abnormal_warning(brand, page_name, mean_perf, abnormal_runs)
+
+        self.attach_regressions(brand, page_name, regressions)
+        self.attach_audit_diff(brand, label, page_name, run_results, failing=not is_pass or bool(regressions))
+
+        # Summary table
+        self.attach_summary_table(brand, page_name, label, run_results, abnormal_runs, stats)
+
+        # Save all runs
+        self.save_all_runs(is_pass, label, brand, page_name, run_results)
+
+        # Picked up by the shard merge (conftest → shard_results/)
+        record_property("scores", final_scores)
+        record_property("threshold", threshold)
+        record_property("regressions", regressions)
+
+        # Soft assertion—doesn't stop next tests
+        check.is_true(
+            is_pass,
+            f"❌ {brand.upper()} {page_name} FAILED — "
+            f"Performance {final_scores['Performance']} < {threshold}"
+        )
+        check.is_true(
+            not regressions,
+            f"📉 {brand.upper()} {page_name} REGRESSED — " + "; ".join(regressions)
+        )
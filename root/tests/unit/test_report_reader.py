@@ -0,0 +1,84 @@
+# tests/unit/test_report_reader
+import json
+import random
+
+import pytest
+
+from bench.fake_lighthouse import build_report
+from utils.report_reader import ReportReader
+
+TIMING_SPEC = {**ReportReader.SUMMARY_SPEC, "timing": {"entries": True}}
+
+
+def select(value, spec):
+    # What ReportReader.read should return, computed from the fully parsed report
+    if spec is True or not isinstance(value, dict):
+        return value
+    return {k: select(value[k], sub) for k, sub in spec.items() if sub and k in value}
+
+
+def dumps(lhr, style):
+    if style == "pretty":  # how Lighthouse writes reports
+        return json.dumps(lhr, indent=2).encode()
+    if style == "compact":
+        return json.dumps(lhr, separators=(",", ":")).encode()
+    return json.dumps(lhr).encode()
+
+
+@pytest.fixture
+def lhr():
+    random.seed(3)
+    report = build_report("https://example.com/?q=\"}]", size_kb=64, latency_ms=0)
+    # strings that look like JSON structure, and a wanted key repeated deeper down
+    report["runWarnings"] = ['Page "x" has { and [ in it\n', "\\", "ünïcode ✓"]
+    report["audits"]["speed-index"]["details"] = {"categories": {"performance": {"score": 0}}}
+    return report
+
+
+@pytest.mark.parametrize("style", ["pretty", "compact", "spaced"])
+@pytest.mark.parametrize("spec", [ReportReader.SUMMARY_SPEC, ReportReader.SCORES_SPEC, TIMING_SPEC],
+                         ids=["summary", "scores", "timing"])
+def test_read_matches_json_loads(lhr, style, spec):
+    buf = dumps(lhr, style)
+    assert ReportReader.read(buf, spec) == select(json.loads(buf), spec)
+
+
+@pytest.mark.parametrize("style", ["pretty", "compact"])
+def test_read_from_file(lhr, style, tmp_path):
+    path = tmp_path / "report.json"
+    path.write_bytes(dumps(lhr, style))
+    assert ReportReader.read(path, ReportReader.SUMMARY_SPEC) == select(lhr, ReportReader.SUMMARY_SPEC)
+
+
+@pytest.mark.parametrize("style", ["pretty", "compact"])
+def test_read_summary(lhr, style):
+    summary = ReportReader.read_summary(dumps(lhr, style), timing=True)
+    assert summary["timing"] == {"entries": lhr["timing"]["entries"]}
+    assert summary["metrics"] == {
+        name: lhr["audits"][audit_id]["numericValue"] for name, audit_id in ReportReader.METRIC_AUDITS.items()
+    }
+
+
+@pytest.mark.parametrize("style", ["pretty", "compact"])
+def test_missing_keys(lhr, style):
+    # --skip-audits / a failed run: absent audits and null scores
+    random.seed(3)
+    lhr = build_report("https://example.com/", size_kb=8, latency_ms=0, skip_audits=["largest-contentful-paint"])
+    lhr["categories"]["performance"]["score"] = None
+    lhr["runtimeError"] = {"code": "NO_FCP", "message": "No first contentful paint"}
+    buf = dumps(lhr, style)
+
+    summary = ReportReader.read_summary(buf)
+    assert ReportReader.read(buf, ReportReader.SUMMARY_SPEC) == select(lhr, ReportReader.SUMMARY_SPEC)
+    assert summary["metrics"]["LCP"] is None
+    assert summary["categories"]["performance"] == {"score": None}
+    assert summary["runtimeError"]["code"] == "NO_FCP"
+
+
+def test_not_a_report(tmp_path):
+    with pytest.raises(ValueError):
+        ReportReader.read(b"[1, 2]", ReportReader.SUMMARY_SPEC)
+    empty = tmp_path / "empty.json"
+    empty.write_bytes(b"")
+    with pytest.raises(ValueError):
+        ReportReader.read(empty, ReportReader.SUMMARY_SPEC)
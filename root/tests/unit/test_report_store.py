@@ -0,0 +1,92 @@
+# tests/unit/test_report_store
+import os
+import json
+import time
+import random
+
+import pytest
+
+from bench.fake_lighthouse import build_report
+from utils.report_store import ReportStore, GC_GRACE_SECONDS, HTML_JSON_MARKER, HTML_JSON_END
+
+
+def write_report(directory, name, seed):
+    random.seed(seed)
+    report = json.dumps(build_report(f"https://example.com/{name}", size_kb=16, latency_ms=0), indent=2)
+    embedded = report.replace("<", "\\u003c")
+    json_path, html_path = directory / f"{name}.report.json", directory / f"{name}.report.html"
+    json_path.write_text(report, encoding="utf-8")
+    html_path.write_text("<html><body><script>window.__LIGHTHOUSE_JSON__ = "
+                         f"{embedded};</script></body></html>", encoding="utf-8")
+    return json_path, html_path
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ReportStore(tmp_path / "store")
+
+
+def blobs(store):
+    return sorted(p.name for p in store.objects.glob("*/*.gz"))
+
+
+def test_dedup(store, tmp_path):
+    a = write_report(tmp_path, "a", seed=1)
+    b = write_report(tmp_path, "b", seed=2)
+
+    first = store.add_run(*a, page="home", run=1)
+    again = store.add_run(*a, page="home", run=2)
+    other = store.add_run(*b, page="home", run=3)
+
+    assert first["json"] == again["json"] != other["json"]
+    # one renderer shell for every run, one JSON blob per distinct report
+    assert first["html"] == other["html"]
+    assert len(blobs(store)) == 3
+    assert [e["run"] for e in store.entries(page="home")] == [1, 2, 3]
+
+
+def test_export_round_trip(store, tmp_path):
+    json_path, html_path = write_report(tmp_path, "a", seed=1)
+    entry = store.add_run(json_path, html_path, page="home", run=1)
+
+    json_out, html_out = store.export(entry, tmp_path / "out")
+    assert json_out.read_bytes() == json_path.read_bytes()
+    html = html_out.read_bytes()
+    start = html.index(HTML_JSON_MARKER) + len(HTML_JSON_MARKER)
+    lhr = json.loads(html[start:html.index(HTML_JSON_END, start)])
+    assert lhr == json.loads(json_path.read_text(encoding="utf-8"))
+
+
+def test_prune(store, tmp_path):
+    old = store.add_run(*write_report(tmp_path, "old", seed=1), page="home", run=1)
+    new = store.add_run(*write_report(tmp_path, "new", seed=2), page="home", run=2)
+
+    # backdate the first entry and its blobs past the grace window
+    lines = store.index_path.read_text(encoding="utf-8").splitlines()
+    entry = {**json.loads(lines[0]), "ts": time.time() - 30 * 86400}
+    store.index_path.write_text(json.dumps(entry) + "\n" + lines[1] + "\n", encoding="utf-8")
+    stale = time.time() - GC_GRACE_SECONDS - 60
+    os.utime(store.blob_path(old["json"], "json"), (stale, stale))
+
+    assert store.prune() == 0  # no retention configured
+    assert store.prune(retention_days=14) == 1
+    assert [e["run"] for e in store.entries()] == [2]
+    assert not store.blob_path(old["json"], "json").exists()
+    # the shared shell is still referenced by the kept run
+    assert store.blob_path(new["html"], "shell.html").exists()
+
+
+def test_prune_keeps_fresh_unreferenced_blobs(store, tmp_path):
+    store.add_run(*write_report(tmp_path, "a", seed=1), page="home", run=1)
+    # a run still being archived: blob written, index line not yet
+    digest = store.put_bytes(b"{}", "json")
+    assert store.prune(retention_days=14) == 0
+    assert store.blob_path(digest, "json").exists()
+
+
+def test_from_config(tmp_path):
+    assert ReportStore.from_config({}) is None
+    store = ReportStore.from_config({"REPORT_STORE": {"ENABLED": True, "ROOT": str(tmp_path / "s"),
+                                                      "RETENTION_DAYS": 7}})
+    assert store.retention_days == 7
+    assert store.objects.is_dir()
@@ -0,0 +1,98 @@
+# tests/unit/test_run_stats
+import numpy as np
+import pytest
+
+from utils.run_result import RunResult, SCORE_KEYS, METRIC_KEYS, VALUE_KEYS
+from utils.run_stats import RunStats
+
+
+def make_runs(rng, count, missing=()):
+    runs = []
+    for run in range(1, count + 1):
+        scores = {k: float(rng.integers(40, 100)) for k in SCORE_KEYS}
+        metrics = {k: float(rng.uniform(50, 5000)) for k in METRIC_KEYS if k not in missing}
+        runs.append(RunResult(run, scores=scores, metrics=metrics))
+    return runs
+
+
+def column(runs, key):
+    return np.array([np.nan if r.value(key) is None else r.value(key) for r in runs])
+
+
+@pytest.fixture
+def results():
+    rng = np.random.default_rng(7)
+    # uneven run counts → NaN padding; "sparse" never reports CLS / TTI
+    return {
+        "home": make_runs(rng, 5),
+        "plp": make_runs(rng, 2),
+        "pdp": make_runs(rng, 7),
+        "single": make_runs(rng, 1),
+        "sparse": make_runs(rng, 4, missing=("CLS", "TTI")),
+    }
+
+
+@pytest.mark.parametrize("stat,p", [("median", 50), ("p75", 75), ("p90", 90)])
+def test_percentiles_match_numpy(results, stat, p):
+    stats = RunStats(results)
+    for page, runs in results.items():
+        got = stats.summary(page)[stat]
+        for key in VALUE_KEYS:
+            values = column(runs, key)
+            if np.isnan(values).all():
+                assert got[key] is None
+            else:
+                assert got[key] == pytest.approx(np.percentile(values, p)), (page, key)
+
+
+def test_mean_and_mad_match_numpy(results):
+    stats = RunStats(results)
+    for page, runs in results.items():
+        summary = stats.summary(page)
+        for key in ("Performance", "LCP", "TotalByteWeight"):
+            values = column(runs, key)
+            assert summary["mean"][key] == pytest.approx(values.mean())
+            mad = np.percentile(np.abs(values - np.percentile(values, 50)), 50)
+            assert summary["mad"][key] == pytest.approx(mad)
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_private_percentiles_match_nanpercentile():
+    rng = np.random.default_rng(11)
+    values = rng.uniform(0, 100, size=(6, 9, 4))
+    values[rng.random(values.shape) < 0.3] = np.nan
+    values[2, :, 1] = np.nan  # an all-NaN column
+
+    ps = (10, 50, 75, 90, 100)
+    expected = np.nanpercentile(values, ps, axis=1)
+    for got, want in zip(RunStats._percentiles(values, ps), expected):
+        np.testing.assert_allclose(got, want)
+
+
+def test_empty():
+    stats = RunStats({"home": []})
+    assert stats.medians("home") == {k: None for k in VALUE_KEYS}
+    assert stats.outlier_runs("home") == []
+
+
+def test_outlier_runs():
+    scores = [90, 91, 89, 90, 92, 40]
+    runs = [RunResult(i, scores={"Performance": s}) for i, s in enumerate(scores, 1)]
+    stats = RunStats({"home": runs})
+    assert [r.run for r in stats.outlier_runs("home")] == [6]
+
+
+def test_identical_runs_never_flag():
+    runs = [RunResult(i, scores={"Performance": 90}) for i in range(1, 4)]
+    assert RunStats({"home": runs}).outlier_runs("home") == []
+
+
+def test_drops():
+    runs = [RunResult(i, scores={"Performance": s}) for i, s in enumerate([80, 82, 50], 1)]
+    # mean 70.67: 50 is 29% below, 80 / 82 within 20%
+    assert [r.run for r in RunStats({"home": runs}).drops("home")] == [3]
+
+
+def test_unknown_key():
+    with pytest.raises(ValueError):
+        RunStats({"home": []}).outlier_runs("home", key="FID")
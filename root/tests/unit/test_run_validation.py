@@ -0,0 +1,55 @@
+# tests/unit/test_run_validation
+import pytest
+
+from utils.run_result import RunResult
+from utils.run_validation import RunValidator, TRANSIENT, INFRASTRUCTURE, PAGE
+
+SCORES = {"Performance": 90, "Accessibility": 95, "BestPractices": 100, "SEO": 92}
+
+
+def run(scores=SCORES, **kwargs):
+    return RunResult(1, scores=scores, **kwargs)
+
+
+def test_valid_run():
+    assert RunValidator.classify(run()) is None
+    assert RunValidator.classify(run(run_warnings=["The page redirected to https://example.com/"])) is None
+
+
+@pytest.mark.parametrize("code,group", [
+    ("NO_FCP", TRANSIENT),
+    ("PROTOCOL_TIMEOUT", INFRASTRUCTURE),
+    ("ERRORED_DOCUMENT_REQUEST", PAGE),
+    ("SOMETHING_NEW", TRANSIENT),
+])
+def test_runtime_error(code, group):
+    result = RunValidator.classify(run(runtime_error={"code": code, "message": "boom"}))
+    assert result == (group, f"{code}: boom")
+
+
+def test_runtime_error_wins_over_null_scores():
+    result = RunValidator.classify(run(scores={}, runtime_error={"code": "NO_FCP"}))
+    assert result == (TRANSIENT, "NO_FCP")
+
+
+def test_run_warning():
+    warning = "Your page loaded too slowly to finish within the time limit. Results may be incomplete."
+    assert RunValidator.classify(run(run_warnings=[warning])) == (TRANSIENT, f"warning: {warning}")
+    cpu = "The tested device appears to have a slower CPU than Lighthouse expects."
+    assert RunValidator.classify(run(run_warnings=[cpu]))[0] == INFRASTRUCTURE
+
+
+def test_null_score():
+    scores = {**SCORES, "Performance": None, "SEO": None}
+    assert RunValidator.classify(run(scores=scores)) == (TRANSIENT, "null score: Performance, SEO")
+
+
+def test_retryable():
+    assert RunValidator.retryable(TRANSIENT)
+    assert RunValidator.retryable(INFRASTRUCTURE)
+    assert not RunValidator.retryable(PAGE)
+
+
+def test_from_config():
+    assert RunValidator.from_config({}).retries == 2
+    assert RunValidator.from_config({"VALIDATION": {"RETRIES": 0}}).retries == 0
@@ -0,0 +1,68 @@
+# tests/unit/test_sampling
+import math
+import statistics
+
+import pytest
+
+from utils.run_result import RunResult
+from utils.sampling import AdaptiveSampler, t_critical
+
+
+def runs(performance=(), lcp=()):
+    lcp = list(lcp) + [None] * (len(performance) - len(lcp))
+    return [RunResult(i, scores={"Performance": p}, metrics={"LCP": l})
+            for i, (p, l) in enumerate(zip(performance, lcp), 1)]
+
+
+def test_t_critical():
+    assert t_critical(0) == math.inf
+    assert t_critical(4) == 2.776
+    assert t_critical(11) == 2.228  # nearest tabulated df below
+    assert t_critical(45) == 1.96
+
+
+def test_half_width():
+    values = [90, 92, 94]
+    assert AdaptiveSampler.half_width(values) == pytest.approx(4.303 * statistics.stdev(values) / math.sqrt(3))
+    assert AdaptiveSampler.half_width([90]) == math.inf
+
+
+def test_min_runs_first():
+    sampler = AdaptiveSampler(min_runs=3, max_runs=6)
+    assert sampler.runs_needed([]) == 3
+    assert sampler.runs_needed(runs([90])) == 2
+
+
+def test_stable_page_stops():
+    assert AdaptiveSampler(min_runs=3, max_runs=6).runs_needed(runs([90, 90, 91])) == 0
+
+
+def test_noisy_page_gets_batch_up_to_max():
+    sampler = AdaptiveSampler(min_runs=2, max_runs=6, ci_half_width=3.0)
+    # sd 10 → (12.706·10/3)² runs – capped at max_runs
+    assert sampler.runs_needed(runs([80, 94.14])) == 4
+    assert sampler.runs_needed(runs([80, 95, 70, 99, 60, 90])) == 0
+
+
+def test_estimate_below_max():
+    sampler = AdaptiveSampler(min_runs=3, max_runs=20, ci_half_width=3.0)
+    values = [88, 92, 90]  # sd 2, n ≈ (4.303·2/3)² = 8.2 → 9
+    assert sampler.runs_needed(runs(values)) == 6
+
+
+def test_per_metric_width_and_missing_values():
+    sampler = AdaptiveSampler(min_runs=2, max_runs=6, ci_half_width={"Performance": 3.0, "LCP": 100.0},
+                              metrics=("Performance", "LCP"))
+    assert sampler.target("LCP") == 100.0
+    assert sampler.target("TBT") == 3.0
+    # LCP only in one run → one more run to learn anything about it
+    assert sampler.runs_needed(runs([90, 90, 90], lcp=[2400])) == 1
+
+
+def test_from_config():
+    assert AdaptiveSampler.from_config({}) is None
+    sampler = AdaptiveSampler.from_config({"SAMPLING": {"ENABLED": True, "MIN_RUNS": 1, "MAX_RUNS": 1,
+                                                        "METRICS": ["LCP"]}})
+    assert (sampler.min_runs, sampler.max_runs, sampler.metrics) == (2, 2, ["LCP"])
+    with pytest.raises(ValueError):
+        AdaptiveSampler.from_config({"SAMPLING": {"ENABLED": True, "METRICS": ["FID"]}})
@@ -0,0 +1,93 @@
+# tests/unit/test_shard_planner
+import json
+
+import pytest
+
+from utils.shard_planner import ShardPlanner, item_id, merge, merged_durations
+
+ITEMS = [item_id(mode, brand, page, view)
+         for mode in ("desktop", "mobile")
+         for brand in ("paved", "gravel")
+         for page in ("home", "plp", "pdp", "cart")
+         for view in ("cold", "warm")]
+
+
+def durations(items):
+    # nodeid-keyed like .test_durations; a few items left unknown
+    return {f"root/tests/test_x.py::Test::test[{i}]": 10.0 + n % 7 for n, i in enumerate(items[:-5])}
+
+
+@pytest.mark.parametrize("num_shards", [1, 2, 3, 4, 7, len(ITEMS), len(ITEMS) + 3])
+def test_plan_covers_every_item_once(num_shards):
+    planner = ShardPlanner(num_shards, durations(ITEMS))
+    shards = planner.plan(ITEMS)
+
+    assert len(shards) == num_shards
+    flat = [i for shard in shards for i in shard]
+    assert sorted(flat) == sorted(ITEMS)
+    # select() partitions the items the same way
+    selected = [planner.select(ITEMS, s) for s in range(num_shards)]
+    assert set().union(*selected) == set(ITEMS)
+    assert sum(len(s) for s in selected) == len(ITEMS)
+
+
+def test_plan_ignores_duplicates():
+    shards = ShardPlanner(3).plan(ITEMS + ITEMS[:4])
+    assert sorted(i for shard in shards for i in shard) == sorted(ITEMS)
+
+
+def test_plan_is_deterministic():
+    known = durations(ITEMS)
+    assert ShardPlanner(4, known).plan(ITEMS) == ShardPlanner(4, known).plan(list(reversed(ITEMS)))
+
+
+def test_plan_balances():
+    planner = ShardPlanner(2, {"a": 7.0, "b": 5.0, "c": 4.0, "d": 3.0, "e": 1.0})
+    shards = planner.plan("abcde")
+    assert planner.loads(shards) == [10.0, 10.0]
+    # each shard runs its slowest item first
+    assert [shard[0] for shard in shards] == ["a", "b"]
+
+
+def test_unknown_items_weigh_as_slowest():
+    planner = ShardPlanner(2, {"a": 2.0, "b": 8.0})
+    assert planner.weight("new") == 8.0
+
+
+def test_test_id():
+    assert ShardPlanner.test_id("root/tests/test_x.py::Test::test[desktop-paved-home]") == "desktop-paved-home"
+    assert ShardPlanner.test_id("desktop-paved-home") == "desktop-paved-home"
+
+
+def test_invalid_shards():
+    with pytest.raises(ValueError):
+        ShardPlanner(0)
+    with pytest.raises(ValueError):
+        ShardPlanner(2).select(ITEMS, 2)
+
+
+def write_shard(path, shard_id, wall_s, items):
+    path.write_text(json.dumps({"shard_id": shard_id, "num_shards": 2, "wall_s": wall_s, "items": items}))
+    return path
+
+
+def test_merge(tmp_path):
+    a = write_shard(tmp_path / "shard_0.json", 0, 30.0, [
+        {"nodeid": "t[home]", "outcome": "passed", "duration": 12.0, "finished_at": 10},
+        {"nodeid": "t[plp]", "outcome": "failed", "duration": 9.0, "finished_at": 20},
+    ])
+    # re-run job: t[plp] passed later on shard 1
+    b = write_shard(tmp_path / "shard_1.json", 1, 10.0, [
+        {"nodeid": "t[plp]", "outcome": "passed", "duration": 8.0, "finished_at": 50},
+        {"nodeid": "t[pdp]", "outcome": "passed", "duration": None, "finished_at": 30},
+    ])
+
+    merged = merge([b, a])
+    assert merged["total"] == 3
+    assert merged["outcomes"] == {"passed": 3}
+    assert merged["passed"] is True
+    assert merged["imbalance"] == 1.5
+    assert [s["shard_id"] for s in merged["shards"]] == [0, 1]
+    assert {p["nodeid"]: p["shard_id"] for p in merged["pages"]} == {"t[home]": 0, "t[plp]": 1, "t[pdp]": 1}
+
+    assert merged_durations([a, b], base={"t[cart]": 5.0}) == {"t[cart]": 5.0, "t[home]": 12.0, "t[plp]": 8.0}
@@ -0,0 +1,130 @@
+# utils/artifact_store.py
+"""
+Gathered Lighthouse artifacts (trace, devtools log, page artifacts) per run,
+so reports can be regenerated without loading the page again (`-A`).
+
+    artifact_store/
+        desktop/paved/homepage/run_1/artifacts.json, defaultPass.trace.json …
+        desktop-warm/…
+        index.jsonl                  ← one line per gathered run (last one wins)
+
+    cd root && python -m utils.artifact_store list  ../artifact_store
+    cd root && python -m utils.artifact_store prune ../artifact_store --days 14
+    cd root && python -m base.reaudit …          ← re-audit from the store
+"""
+import os
+import json
+import time
+import shutil
+import argparse
+from pathlib import Path
+
+
+class ArtifactStore:
+    """
+    Runs write their artifacts straight into run_dir() (Lighthouse's
+    --gather-mode / --audit-mode on the same folder: gather, save, audit).
+    commit() indexes a finished run; entries() is what re-audits iterate.
+    """
+
+    def __init__(self, root: str = "artifact_store", max_age_days: float = 14):
+        self.root = Path(root)
+        self.max_age = max_age_days * 86400 if max_age_days else None
+        self.index_path = self.root / "index.jsonl"
+
+    @staticmethod
+    def from_config(cfg: dict):
+        a = cfg.get("ARTIFACTS", {})
+        if not a.get("ENABLED", False):
+            return None
+        return ArtifactStore(a.get("ROOT", "artifact_store"), a.get("MAX_AGE_DAYS", 14))
+
+    @staticmethod
+    def flags(artifact_dir):
+        # -GA=<dir>: gather + save artifacts, then audit from them
+        artifact_dir = Path(artifact_dir).resolve()
+        return [f"--gather-mode={artifact_dir}", f"--audit-mode={artifact_dir}"]
+
+    # ------------------------------------------------------
+    # Paths / index
+    # ------------------------------------------------------
+    @staticmethod
+    def key(label: str, brand: str, page: str, run: int):
+        # label = mode or mode-view ("desktop-warm")
+        return f"{label}/{brand}/{page}/run_{run}"
+
+    def run_dir(self, label: str, brand: str, page: str, run: int):
+        return self.root / self.key(label, brand, page, run)
+
+    def commit(self, label: str, brand: str, page: str, run: int, url: str, mode: str, view: str = "cold",
+               lighthouse_version: str = None):
+        run_dir = self.run_dir(label, brand, page, run)
+        if not (run_dir / "artifacts.json").exists():
+            return None  # Lighthouse wrote nothing (e.g. an older CLI without -G)
+
+        entry = {"key": self.key(label, brand, page, run), "url": url, "mode": mode, "view": view,
+                 "brand": brand, "page": page, "run": run, "gathered_at": time.time(),
+                 "lighthouse_version": lighthouse_version,
+                 "size": sum(f.stat().st_size for f in run_dir.iterdir() if f.is_file())}
+        # single small O_APPEND write – safe with parallel writers
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        return entry
+
+    def entries(self):
+        latest = {}
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        latest[entry["key"]] = entry
+        except FileNotFoundError:
+            pass
+        return {k: e for k, e in latest.items() if (self.root / k / "artifacts.json").exists()}
+
+    def prune(self, days: float = None):
+        """Drop runs gathered more than `days` (default MAX_AGE_DAYS) ago and compact the index."""
+        max_age = days * 86400 if days is not None else self.max_age
+        if max_age is None:
+            return 0
+
+        cutoff = time.time() - max_age
+        kept, removed = [], 0
+        for entry in self.entries().values():
+            if entry["gathered_at"] >= cutoff:
+                kept.append(entry)
+                continue
+            shutil.rmtree(self.root / entry["key"], ignore_errors=True)
+            removed += 1
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_suffix(".tmp")
+        tmp.write_text("".join(json.dumps(e) + "\n" for e in kept), encoding="utf-8")
+        os.replace(tmp, self.index_path)
+        return removed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gathered Lighthouse artifacts")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    ls = sub.add_parser("list")
+    ls.add_argument("root", nargs="?", default="artifact_store")
+
+    pr = sub.add_parser("prune")
+    pr.add_argument("root", nargs="?", default="artifact_store")
+    pr.add_argument("--days", type=float, default=14)
+    args = parser.parse_args(argv)
+
+    store = ArtifactStore(args.root)
+    if args.cmd == "list":
+        for entry in sorted(store.entries().values(), key=lambda e: e["key"]):
+            age_h = (time.time() - entry["gathered_at"]) / 3600
+            print(f"{entry['key']:<60} {entry['size'] / 1024 / 1024:>8.1f} MB  {age_h:>6.1f} h")
+    else:
+        print(f"Removed {store.prune(args.days)} runs")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,12 @@ from pathlib import Path
 class ConfigReader:
     _cache = {}
 
+    # brand -> page list key in config_*.json
+    BRAND_KEYS = {
+        "paved": "PAVED_PAGES",
+        "gsa": "GSA_PAGES",
+    }
+
     @staticmethod
     def load_config(file_name: str = "testsetting.json"):
         if file_name in ConfigReader._cache:
@@ -25,3 +31,12 @@ class ConfigReader:
         ConfigReader._cache[file_name] = data
         return data
 
+    @staticmethod
+    def load_pages(mode: str):
+        # [(brand, url, page_name)] for config_<mode>.json
+        cfg = ConfigReader.load_config(f"config_{mode}.json")
+        return [
+            (brand, url, page_name)
+            for brand, key in ConfigReader.BRAND_KEYS.items()
+            for url, page_name in cfg.get(key, [])
+        ]
@@ -0,0 +1,170 @@
+# utils/history_db.py
+import time
+import math
+import sqlite3
+import statistics
+from pathlib import Path
+
+# Column per value we keep for every run. Category scores are 0–100,
+# metrics are Lighthouse numericValues (ms, unitless CLS, bytes).
+SCORE_COLUMNS = {
+    "performance": "Performance",
+    "accessibility": "Accessibility",
+    "best_practices": "BestPractices",
+    "seo": "SEO",
+}
+METRIC_COLUMNS = {
+    "fcp": "FCP",
+    "lcp": "LCP",
+    "tbt": "TBT",
+    "cls": "CLS",
+    "speed_index": "SpeedIndex",
+    "tti": "TTI",
+    "total_byte_weight": "TotalByteWeight",
+}
+VALUE_COLUMNS = {**SCORE_COLUMNS, **METRIC_COLUMNS}
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    id              INTEGER PRIMARY KEY,
+    brand           TEXT NOT NULL,
+    page            TEXT NOT NULL,
+    mode            TEXT NOT NULL,
+    run             INTEGER NOT NULL,
+    ts              REAL NOT NULL,
+    lh_version      TEXT,
+    benchmark_index REAL,
+    host_load       REAL,
+    verdict         TEXT,
+    {", ".join(f"{c} REAL" for c in VALUE_COLUMNS)}
+);
+CREATE INDEX IF NOT EXISTS idx_runs_page ON runs (brand, page, mode, ts);
+CREATE INDEX IF NOT EXISTS idx_runs_ts ON runs (ts);
+"""
+
+
+def percentile(values, p: float):
+    # Linear interpolation between closest ranks (numpy's default)
+    values = sorted(values)
+    if not values:
+        return None
+    k = (len(values) - 1) * p / 100
+    lo, hi = math.floor(k), math.ceil(k)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+class HistoryDB:
+    """
+    Embedded SQLite history of every Lighthouse run, indexed by
+    brand/page/mode/timestamp, for baselines, trends and regression checks.
+    """
+
+    def __init__(self, path: str = "lighthouse_history.db"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")  # parallel writers (xdist)
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        # Databases created before a column existed
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(runs)")}
+        if "host_load" not in columns:
+            with self.conn:
+                self.conn.execute("ALTER TABLE runs ADD COLUMN host_load REAL")
+
+    def close(self):
+        self.conn.close()
+
+    @staticmethod
+    def _column(metric: str):
+        if metric not in VALUE_COLUMNS:
+            raise ValueError(f"Unknown metric: {metric} (one of {', '.join(VALUE_COLUMNS)})")
+        return metric
+
+    # ------------------------------------------------------
+    # Write
+    # ------------------------------------------------------
+    def record_run(self, brand, page, mode, run_result, verdict=None, ts=None):
+        scores = run_result.get("scores", {})
+        metrics = run_result.get("metrics", {})
+        values = {c: scores.get(k) for c, k in SCORE_COLUMNS.items()}
+        values.update({c: metrics.get(k) for c, k in METRIC_COLUMNS.items()})
+
+        columns = ["brand", "page", "mode", "run", "ts", "lh_version", "benchmark_index", "host_load", "verdict",
+                   *values]
+        row = [brand, page, mode, run_result["run"], ts or time.time(),
+               run_result.get("lighthouse_version"), run_result.get("benchmark_index"), run_result.get("host_load"),
+               verdict, *values.values()]
+
+        with self.conn:
+            self.conn.execute(
+                f"INSERT INTO runs ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                row,
+            )
+
+    # ------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------
+    def values(self, brand, page, mode, metric="performance", days=14, until=None, lh_version=None):
+        column = self._column(metric)
+        until = until or time.time()
+        sql = (f"SELECT {column} FROM runs WHERE brand=? AND page=? AND mode=? "
+               f"AND ts >= ? AND ts < ? AND {column} IS NOT NULL")
+        params = [brand, page, mode, until - days * 86400, until]
+        if lh_version:
+            sql += " AND lh_version=?"
+            params.append(lh_version)
+        return [v for (v,) in self.conn.execute(sql + " ORDER BY ts", params)]
+
+    def baseline(self, brand, page, mode, metric="performance", days=14, until=None):
+        values = self.values(brand, page, mode, metric, days, until)
+        return statistics.median(values) if values else None
+
+    def percentiles(self, brand, page, mode, metric="performance", days=14, ps=(50, 75, 90)):
+        values = self.values(brand, page, mode, metric, days)
+        return {p: percentile(values, p) for p in ps}
+
+    def rolling_median(self, brand, page, mode, metric="performance", days=14, window_days=3):
+        """[(day, median of the window ending that day)] for the last `days` days."""
+        column = self._column(metric)
+        since = time.time() - (days + window_days) * 86400
+        rows = self.conn.execute(
+            f"SELECT ts, {column} FROM runs WHERE brand=? AND page=? AND mode=? AND ts >= ? "
+            f"AND {column} IS NOT NULL ORDER BY ts",
+            (brand, page, mode, since),
+        ).fetchall()
+
+        out = []
+        today = math.floor(time.time() / 86400)
+        for day in range(today - days + 1, today + 1):
+            lo, hi = (day - window_days + 1) * 86400, (day + 1) * 86400
+            window = [v for ts, v in rows if lo <= ts < hi]
+            if window:
+                out.append((time.strftime("%Y-%m-%d", time.gmtime(day * 86400)), statistics.median(window)))
+        return out
+
+    def check_regression(self, brand, page, mode, current: dict, rules: dict, days=14, min_samples=5):
+        """
+        current: {metric: value} for this session (e.g. the page median).
+        rules:   {metric: allowed change} – category scores: max drop in
+                 points; timing/size metrics: max relative increase (0.2 = +20%).
+        Returns a list of human-readable regressions (empty = OK).
+        """
+        regressions = []
+        for metric, allowed in rules.items():
+            value = current.get(metric)
+            history = self.values(brand, page, mode, metric, days)
+            if value is None or len(history) < min_samples:
+                continue
+
+            base = statistics.median(history)
+            if metric in SCORE_COLUMNS:
+                if base - value > allowed:
+                    regressions.append(f"{metric} {value:.1f} vs baseline {base:.1f} (-{base - value:.1f} > {allowed})")
+            elif base and (value - base) / base > allowed:
+                regressions.append(
+                    f"{metric} {value:.0f} vs baseline {base:.0f} (+{(value - base) / base:.0%} > {allowed:.0%})"
+                )
+        return regressions
@@ -0,0 +1,72 @@
+# utils/host_load.py
+import os
+
+
+class HostGovernor:
+    """
+    Keeps Lighthouse runs on a host that is fast enough to trust.
+
+    Two signals per run:
+      benchmark_index – Lighthouse's own CPU microbenchmark taken at the start
+                        of the run (lhr.environment.benchmarkIndex, higher =
+                        faster)
+      host_load       – 1-minute load average per CPU, sampled around the run
+
+    A run below MIN_BENCHMARK_INDEX or above MAX_LOAD_PER_CPU is "slow": the
+    caller throws it away and schedules it again (RESCHEDULE times per page
+    at most), and the worker limit drops by one. After RECOVER_AFTER good
+    runs in a row the limit goes back up by one, up to the session's WORKERS.
+    """
+
+    def __init__(self, min_benchmark_index: float = None, max_load_per_cpu: float = None,
+                 reschedule: int = 2, recover_after: int = 3, min_workers: int = 1, max_workers: int = 1):
+        self.min_benchmark_index = min_benchmark_index
+        self.max_load_per_cpu = max_load_per_cpu
+        self.reschedule = reschedule
+        self.recover_after = recover_after
+        self.min_workers = max(1, min_workers)
+        self.max_workers = max(self.min_workers, max_workers)
+        self.limit = self.max_workers
+        self._good = 0
+
+    @staticmethod
+    def from_config(cfg: dict, workers: int = 1):
+        h = cfg.get("HOST_LOAD", {})
+        if not h.get("ENABLED", False):
+            return None
+        return HostGovernor(
+            min_benchmark_index=h.get("MIN_BENCHMARK_INDEX"),
+            max_load_per_cpu=h.get("MAX_LOAD_PER_CPU"),
+            reschedule=h.get("RESCHEDULE", 2),
+            recover_after=h.get("RECOVER_AFTER", 3),
+            min_workers=h.get("MIN_WORKERS", 1),
+            max_workers=workers,
+        )
+
+    @staticmethod
+    def host_load():
+        # None where os.getloadavg() does not exist (Windows)
+        try:
+            return round(os.getloadavg()[0] / (os.cpu_count() or 1), 2)
+        except (AttributeError, OSError):
+            return None
+
+    def slow_reason(self, benchmark_index=None, host_load=None):
+        if self.min_benchmark_index and benchmark_index is not None and benchmark_index < self.min_benchmark_index:
+            return f"benchmarkIndex {benchmark_index:.0f} < {self.min_benchmark_index}"
+        if self.max_load_per_cpu and host_load is not None and host_load > self.max_load_per_cpu:
+            return f"host load {host_load:.2f}/cpu > {self.max_load_per_cpu}"
+        return None
+
+    def observe(self, benchmark_index=None, host_load=None):
+        """Feeds one finished run back; returns why it was slow, or None. Adjusts the worker limit."""
+        reason = self.slow_reason(benchmark_index, host_load)
+        if reason:
+            self._good = 0
+            self.limit = max(self.min_workers, self.limit - 1)
+        else:
+            self._good += 1
+            if self._good >= self.recover_after and self.limit < self.max_workers:
+                self._good = 0
+                self.limit += 1
+        return reason
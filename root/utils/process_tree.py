@@ -0,0 +1,50 @@
+# utils/process_tree.py
+import os
+import signal
+from pathlib import Path
+
+
+def descendants(pid: int):
+    """All child pids of pid (recursive), read from /proc – Linux only."""
+    children = {}
+    for stat in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            # "<pid> (<comm>) <state> <ppid> ..." – comm may contain spaces
+            fields = stat.read_text().rsplit(")", 1)[1].split()
+            children.setdefault(int(fields[1]), []).append(int(stat.parent.name))
+        except (OSError, IndexError, ValueError):
+            continue
+
+    found, stack = [], [pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            found.append(child)
+            stack.append(child)
+    return found
+
+
+def kill_tree(pid: int, sig=signal.SIGKILL):
+    """
+    Kill pid and everything it spawned. chrome-launcher starts Chrome
+    detached (own process group), so killing Lighthouse's group alone
+    would leave Chrome running – walk the tree and kill each group.
+    """
+    pids = [pid, *descendants(pid)]
+    groups = set()
+    for p in pids:
+        try:
+            groups.add(os.getpgid(p))
+        except ProcessLookupError:
+            pass
+
+    own_group = os.getpgid(0)
+    for g in groups - {own_group}:
+        try:
+            os.killpg(g, sig)
+        except ProcessLookupError:
+            pass
+    for p in pids:
+        try:
+            os.kill(p, sig)
+        except ProcessLookupError:
+            pass
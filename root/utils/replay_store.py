@@ -0,0 +1,151 @@
+# utils/replay_store.py
+"""
+Per-page network recordings (Web Page Replay archives) for replay mode.
+
+    replay_store/
+        desktop/www.paveddigital.com_about-us.wprgo
+        mobile/…
+        index.jsonl                  ← one line per recording (last one wins)
+
+    cd root && python -m utils.replay_store list  ../replay_store
+    cd root && python -m utils.replay_store prune ../replay_store --days 7
+"""
+import os
+import json
+import time
+import argparse
+from pathlib import Path
+
+
+class ReplayStore:
+    """
+    MODE
+      off     – live network (default)
+      record  – re-record every page, then audit from the fresh recording
+      replay  – audit from existing recordings only; pages without one fail
+                (no outside network needed)
+      auto    – replay when a recording younger than MAX_AGE_DAYS exists,
+                record it first otherwise
+    """
+
+    MODES = ("off", "record", "replay", "auto")
+
+    def __init__(self, root: str = "replay_store", mode: str = "auto", max_age_days: float = 7, runs: int = 1):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown replay mode: {mode}")
+        self.root = Path(root)
+        self.mode = mode
+        self.max_age = max_age_days * 86400 if max_age_days else None
+        self.runs = runs
+        self.index_path = self.root / "index.jsonl"
+
+    @staticmethod
+    def from_config(cfg: dict):
+        r = cfg.get("REPLAY", {})
+        if r.get("MODE", "off") == "off":
+            return None
+        return ReplayStore(r.get("STORE", "replay_store"), r["MODE"], r.get("MAX_AGE_DAYS", 7), r.get("RUNS", 1))
+
+    # ------------------------------------------------------
+    # Paths
+    # ------------------------------------------------------
+    @staticmethod
+    def key(url: str, mode: str):
+        # same naming as LighthouseRunner.safe_name (no base import from utils)
+        safe = url.replace("https://", "").replace("http://", "").replace("/", "_").rstrip("_")
+        return f"{mode}/{safe}"
+
+    def archive_path(self, url: str, mode: str):
+        return self.root / f"{self.key(url, mode)}.wprgo"
+
+    def recording_path(self, url: str, mode: str):
+        # written by a recording proxy, renamed into place by commit()
+        return self.root / f"{self.key(url, mode)}.wprgo.recording"
+
+    # ------------------------------------------------------
+    # Index
+    # ------------------------------------------------------
+    def entries(self):
+        latest = {}
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        latest[entry["key"]] = entry
+        except FileNotFoundError:
+            pass
+        return latest
+
+    def is_fresh(self, url: str, mode: str, entries=None):
+        entry = (entries if entries is not None else self.entries()).get(self.key(url, mode))
+        if entry is None or not self.archive_path(url, mode).exists():
+            return False
+        return self.max_age is None or time.time() - entry["recorded_at"] <= self.max_age
+
+    def action_for(self, url: str, mode: str, entries=None):
+        """"record", "replay" or None (replay-only mode and nothing recorded)."""
+        if self.mode == "record":
+            return "record"
+        if self.is_fresh(url, mode, entries) or (self.mode == "replay" and self.archive_path(url, mode).exists()):
+            return "replay"
+        return "record" if self.mode == "auto" else None
+
+    def commit(self, url: str, mode: str):
+        recording = self.recording_path(url, mode)
+        if not recording.exists() or recording.stat().st_size == 0:
+            raise FileNotFoundError(f"Recording missing for {url} [{mode}]")
+
+        archive = self.archive_path(url, mode)
+        os.replace(recording, archive)
+        entry = {"key": self.key(url, mode), "url": url, "mode": mode,
+                 "recorded_at": time.time(), "size": archive.stat().st_size}
+        # single small O_APPEND write – safe with parallel writers
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        return archive
+
+    def prune(self, days: float = None):
+        """Drop recordings older than `days` (default MAX_AGE_DAYS) and compact the index."""
+        max_age = days * 86400 if days is not None else self.max_age
+        if max_age is None:
+            return 0
+
+        cutoff = time.time() - max_age
+        kept, removed = [], 0
+        for entry in self.entries().values():
+            if entry["recorded_at"] >= cutoff:
+                kept.append(entry)
+                continue
+            (self.root / f"{entry['key']}.wprgo").unlink(missing_ok=True)
+            removed += 1
+
+        tmp = self.index_path.with_suffix(".tmp")
+        tmp.write_text("".join(json.dumps(e) + "\n" for e in kept), encoding="utf-8")
+        os.replace(tmp, self.index_path)
+        return removed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Web Page Replay recordings")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    ls = sub.add_parser("list")
+    ls.add_argument("root", nargs="?", default="replay_store")
+
+    pr = sub.add_parser("prune")
+    pr.add_argument("root", nargs="?", default="replay_store")
+    pr.add_argument("--days", type=float, default=7)
+    args = parser.parse_args(argv)
+
+    store = ReplayStore(args.root)
+    if args.cmd == "list":
+        for entry in sorted(store.entries().values(), key=lambda e: e["key"]):
+            age_h = (time.time() - entry["recorded_at"]) / 3600
+            print(f"{entry['key']:<60} {entry['size'] / 1024:>8.0f} KB  {age_h:>6.1f} h")
+    else:
+        print(f"Removed {store.prune(args.days)} recordings")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+# utils/report_diff.py
+"""
+Audit-level diff of two Lighthouse reports (LHR).
+
+    cd root && python -m utils.report_diff base.json current.json --top 15
+    cd root && python -m utils.report_diff base.json current.json --html diff.html
+
+Explains a score change in terms of what the page loaded: metric deltas,
+opportunity savings (unused JS / CSS, render-blocking resources …) and
+per-resource transfer size / request changes, ranked by estimated impact
+in milliseconds.
+"""
+import sys
+import html
+import argparse
+
+from utils.report_reader import ReportReader
+
+# Lighthouse "opportunity" audits (details.type == "opportunity")
+OPPORTUNITY_AUDITS = (
+    "render-blocking-resources", "unused-javascript", "unused-css-rules", "unminified-javascript",
+    "unminified-css", "legacy-javascript", "duplicated-javascript", "uses-text-compression",
+    "uses-optimized-images", "modern-image-formats", "uses-responsive-images", "offscreen-images",
+    "efficient-animated-content", "server-response-time", "redirects", "uses-rel-preconnect",
+    "prioritize-lcp-image",
+)
+
+DIFF_SPEC = {
+    "requestedUrl": True,
+    "fetchTime": True,
+    "configSettings": {"formFactor": True, "throttlingMethod": True, "throttling": True},
+    "audits": {
+        **{a: {"numericValue": True} for a in ReportReader.METRIC_AUDITS.values()},
+        **{a: {"details": True} for a in OPPORTUNITY_AUDITS},
+        "network-requests": {"details": True},
+    },
+}
+
+# Opportunity items compared per audit – pass REPORTS.TOP_OPPORTUNITIES, the
+# top-N a slim report keeps, so both sides are cut at the same rank
+TOP_ITEMS = 5
+
+# Lighthouse's simulated throughput (desktop / mobile presets), for reports without configSettings
+DEFAULT_THROUGHPUT_KBPS = {"desktop": 10240, "mobile": 1638.4}
+
+
+class ReportDiff:
+    """
+    digest() reduces a report to the few numbers the diff needs (read with
+    ReportReader – screenshots and unrelated audits are never decoded);
+    compare() diffs two digests.
+
+    Estimated impact of a change, in ms:
+      opportunity – change of Lighthouse's own overallSavingsMs (or of the
+                    wasted bytes at the run's throughput when it has none)
+      resource    – change of transfer size at the run's throughput
+    """
+
+    # ------------------------------------------------------
+    # Digest
+    # ------------------------------------------------------
+    @staticmethod
+    def digest(source, top_items: int = TOP_ITEMS):
+        """source: path to a report, the report as bytes, or a digest already."""
+        if isinstance(source, dict) and "resources" in source:
+            return source
+        lhr = ReportReader.read(source, DIFF_SPEC)
+        audits = lhr.get("audits", {})
+
+        opportunities = {}
+        for audit_id in OPPORTUNITY_AUDITS:
+            details = audits.get(audit_id, {}).get("details") or {}
+            if details.get("type") != "opportunity":
+                continue
+            # Biggest savings first (ReportSlimmer's order), so full and slim reports compare alike
+            items = sorted(
+                (i for i in details.get("items", []) if isinstance(i.get("url"), str)),
+                key=lambda i: (i.get("wastedMs") or 0, i.get("wastedBytes") or 0),
+                reverse=True,
+            )
+            opportunities[audit_id] = {
+                "ms": details.get("overallSavingsMs") or 0,
+                "bytes": details.get("overallSavingsBytes") or 0,
+                "items": {i["url"]: (i.get("wastedBytes") or 0, i.get("wastedMs") or 0) for i in items[:top_items]},
+            }
+
+        resources = {}
+        for item in (audits.get("network-requests", {}).get("details") or {}).get("items", []):
+            url = item.get("url")
+            if isinstance(url, str) and not url.startswith("data:"):
+                size, _ = resources.get(url, (0, None))
+                resources[url] = (size + (item.get("transferSize") or 0), item.get("resourceType") or "Other")
+
+        return {
+            "url": lhr.get("requestedUrl"),
+            "fetchTime": lhr.get("fetchTime"),
+            "throughput_kbps": ReportDiff.throughput(lhr.get("configSettings") or {}),
+            "metrics": {
+                name: audits.get(audit_id, {}).get("numericValue")
+                for name, audit_id in ReportReader.METRIC_AUDITS.items()
+            },
+            "opportunities": opportunities,
+            "resources": resources,
+        }
+
+    @staticmethod
+    def throughput(settings: dict):
+        throttling = settings.get("throttling") or {}
+        if settings.get("throttlingMethod") == "devtools" and throttling.get("downloadThroughputKbps"):
+            return throttling["downloadThroughputKbps"]
+        return throttling.get("throughputKbps") or DEFAULT_THROUGHPUT_KBPS.get(settings.get("formFactor"), 10240)
+
+    # ------------------------------------------------------
+    # Diff
+    # ------------------------------------------------------
+    @staticmethod
+    def compare(base, current, min_impact_ms: float = 1.0, top_items: int = TOP_ITEMS):
+        base, current = ReportDiff.digest(base, top_items), ReportDiff.digest(current, top_items)
+        kbps = current["throughput_kbps"]
+        bytes_ms = lambda n: n * 8 / kbps
+
+        metrics = []
+        for name, value in current["metrics"].items():
+            before = base["metrics"].get(name)
+            if value is None or before is None:
+                continue
+            metrics.append({"metric": name, "base": before, "current": value, "delta": value - before,
+                            "pct": (value - before) / before * 100 if before else None})
+
+        changes = []
+        for audit_id in sorted(set(base["opportunities"]) | set(current["opportunities"])):
+            b = base["opportunities"].get(audit_id, {"ms": 0, "bytes": 0, "items": {}})
+            c = current["opportunities"].get(audit_id, {"ms": 0, "bytes": 0, "items": {}})
+            delta_ms, delta_bytes = c["ms"] - b["ms"], c["bytes"] - b["bytes"]
+            items = []
+            for url in set(b["items"]) | set(c["items"]):
+                (b_bytes, b_ms), (c_bytes, c_ms) = b["items"].get(url, (0, 0)), c["items"].get(url, (0, 0))
+                if c_bytes != b_bytes or c_ms != b_ms:
+                    items.append((url, c_bytes - b_bytes, c_ms - b_ms))
+            items.sort(key=lambda i: -abs(i[2] or bytes_ms(i[1])))
+            changes.append({
+                "kind": "opportunity", "id": audit_id, "delta_bytes": delta_bytes, "delta_ms": delta_ms,
+                "impact_ms": delta_ms if (b["ms"] or c["ms"]) else bytes_ms(delta_bytes),
+                "items": items[:3],
+            })
+
+        # Resource side only when both reports list their requests (older slim reports don't)
+        compared = bool(base["resources"] and current["resources"])
+        urls = set(base["resources"]) | set(current["resources"]) if compared else set()
+        by_type = {}
+        for url in urls:
+            before, b_type = base["resources"].get(url, (None, None))
+            after, c_type = current["resources"].get(url, (None, None))
+            delta = (after or 0) - (before or 0)
+            t = by_type.setdefault(c_type or b_type, [0, 0])
+            t[0] += (after is not None) - (before is not None)
+            t[1] += delta
+            if not delta and after is not None and before is not None:
+                continue
+            changes.append({
+                "kind": "added" if before is None else "removed" if after is None else "resource",
+                "id": url, "type": c_type or b_type, "delta_bytes": delta, "delta_ms": None,
+                "impact_ms": bytes_ms(delta),
+            })
+
+        # Biggest regressions first, improvements last
+        changes = [c for c in changes if abs(c["impact_ms"]) >= min_impact_ms]
+        changes.sort(key=lambda c: -c["impact_ms"])
+
+        return {
+            "base": {"url": base["url"], "fetchTime": base["fetchTime"]},
+            "current": {"url": current["url"], "fetchTime": current["fetchTime"]},
+            "throughput_kbps": kbps,
+            "metrics": metrics,
+            "changes": changes,
+            "requests": None if not compared else {
+                "base": len(base["resources"]),
+                "current": len(current["resources"]),
+                "bytes": sum(s for s, _ in current["resources"].values())
+                         - sum(s for s, _ in base["resources"].values()),
+                "by_type": {t: v for t, v in sorted(by_type.items()) if v != [0, 0]},
+            },
+        }
+
+    # ------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------
+    @staticmethod
+    def _metric(value, name):
+        if name == "CLS":
+            return f"{value:+.3f}"
+        if name == "TotalByteWeight":
+            return ReportDiff._kb(value)
+        return f"{value:+.0f} ms"
+
+    @staticmethod
+    def _kb(n):
+        return f"{n / 1024:+.1f} KB"
+
+    @staticmethod
+    def _label(change):
+        if change["kind"] == "opportunity":
+            return change["id"]
+        return {"added": "+ ", "removed": "− ", "resource": "Δ "}[change["kind"]] + change["id"]
+
+    @staticmethod
+    def to_text(diff, top: int = 10):
+        req = diff["requests"]
+        lines = [f"{m['metric']:<16} {ReportDiff._metric(m['delta'], m['metric']):>12}" for m in diff["metrics"]]
+        if req:
+            lines.append(f"{'Requests':<16} {req['current'] - req['base']:>+12}  ({ReportDiff._kb(req['bytes'])})")
+        lines.append("")
+        for c in diff["changes"][:top]:
+            lines.append(f"{c['impact_ms']:>+9.0f} ms  {ReportDiff._kb(c['delta_bytes']):>12}  {ReportDiff._label(c)}")
+            lines += [f"{ms:>+12.0f} ms  {ReportDiff._kb(b):>12}    {url}" for url, b, ms in c.get("items", ())]
+        if len(diff["changes"]) > top:
+            lines.append(f"… {len(diff['changes']) - top} smaller changes")
+        return "\n".join(lines)
+
+    @staticmethod
+    def to_html(diff, top: int = 10, title: str = "Audit diff"):
+        color = lambda v: "red" if v > 0 else "green" if v < 0 else "inherit"
+        metric_rows = "".join(
+            f"<tr><td>{m['metric']}</td>"
+            f"<td style='color:{color(m['delta'])};'>{ReportDiff._metric(m['delta'], m['metric'])}"
+            + (f" ({m['pct']:+.0f}%)" if m["pct"] is not None else "") + "</td></tr>"
+            for m in diff["metrics"]
+        )
+        change_rows = "".join(
+            f"<tr><td style='color:{color(c['impact_ms'])};'>{c['impact_ms']:+.0f} ms</td>"
+            f"<td>{ReportDiff._kb(c['delta_bytes'])}</td>"
+            f"<td>{html.escape(ReportDiff._label(c))}"
+            + "".join(f"<br><small>{ms:+.0f} ms · {ReportDiff._kb(b)} · {html.escape(url)}</small>"
+                      for url, b, ms in c.get("items", ()))
+            + "</td></tr>"
+            for c in diff["changes"][:top]
+        )
+        req = diff["requests"]
+        if req:
+            by_type = " · ".join(f"{t} {n:+d} ({ReportDiff._kb(b)})" for t, (n, b) in req["by_type"].items())
+            requests = f"Requests {req['base']} → {req['current']} ({ReportDiff._kb(req['bytes'])})" \
+                       + (f": {by_type}" if by_type else "")
+        else:
+            requests = "Requests: not listed in both reports"
+
+        return f"""
+        <h3>{html.escape(title)}</h3>
+        <p>Baseline {html.escape(str(diff['base']['fetchTime']))} → current {html.escape(str(diff['current']['fetchTime']))}</p>
+        <table border='1' style='border-collapse:collapse;'>
+            <tr><th>Metric</th><th>Δ</th></tr>
+            {metric_rows}
+        </table>
+        <p>{html.escape(requests)}</p>
+        <table border='1' style='border-collapse:collapse;'>
+            <tr><th>Est. impact</th><th>Bytes</th><th>Change</th></tr>
+            {change_rows}
+        </table>
+        <p>Impact at {diff['throughput_kbps']:.0f} Kbps; top {min(top, len(diff['changes']))} of {len(diff['changes'])} changes.</p>
+        """
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Audit-level diff of two Lighthouse JSON reports")
+    parser.add_argument("base")
+    parser.add_argument("current")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--html", default=None, help="also write the HTML diff here")
+    parser.add_argument("--top-items", type=int, default=TOP_ITEMS,
+                        help="opportunity items compared per audit (REPORTS.TOP_OPPORTUNITIES of slim reports)")
+    args = parser.parse_args(argv)
+
+    diff = ReportDiff.compare(args.base, args.current, top_items=args.top_items)
+    print(ReportDiff.to_text(diff, args.top))
+    if args.html:
+        with open(args.html, "w", encoding="utf-8") as f:
+            f.write(ReportDiff.to_html(diff, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
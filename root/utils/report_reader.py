@@ -0,0 +1,191 @@
+# utils/report_reader.py
+import re
+import json
+import mmap
+from pathlib import Path
+
+# JSON string (unrolled-loop form – stays linear on multi-MB base64 blobs)
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+# While skipping a container: consume everything up to the next bracket that
+# is not inside a string, in one C-level match (one Python step per bracket)
+_TO_BRACKET = re.compile(rb'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*[{}\[\]]')
+_SCALAR = re.compile(rb'[^,}\]\s]+')
+_WS = re.compile(rb'\s*')
+
+
+class ReportReader:
+    """
+    Selective reader for Lighthouse JSON reports (LHR).
+
+    Reports are 1–5 MB, mostly screenshots and audit details, while we only
+    need a handful of numbers. The reader memory-maps the file, walks the
+    top-level object and only decodes the keys named in a *spec*; everything
+    else is skipped with C-level regex scans and never turned into Python
+    objects.
+
+    A spec is a nested dict: True = decode the whole value, dict = descend
+    into that object and keep only the listed keys.
+
+    Lighthouse writes reports with JSON.stringify(lhr, null, 2), so a key at
+    depth d always starts a line indented by 2*d spaces (newlines inside
+    strings are escaped). For such reports every wanted key is found with a
+    single regex search instead of walking the preceding values.
+    """
+
+    CATEGORIES = ["performance", "accessibility", "best-practices", "seo"]
+
+    METRIC_AUDITS = {
+        "FCP": "first-contentful-paint",
+        "LCP": "largest-contentful-paint",
+        "TBT": "total-blocking-time",
+        "CLS": "cumulative-layout-shift",
+        "SpeedIndex": "speed-index",
+        "TTI": "interactive",
+        "TotalByteWeight": "total-byte-weight",
+    }
+
+    SCORES_SPEC = {
+        "categories": {c: {"score": True} for c in CATEGORIES},
+    }
+
+    SUMMARY_SPEC = {
+        "lighthouseVersion": True,
+        "requestedUrl": True,
+        "fetchTime": True,
+        "runtimeError": True,
+        "runWarnings": True,
+        "environment": True,
+        "categories": {c: {"score": True} for c in CATEGORIES},
+        "audits": {a: {"score": True, "numericValue": True} for a in METRIC_AUDITS.values()},
+    }
+
+    # ------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------
+    @staticmethod
+    def read(source, spec: dict):
+        """source: path to a report, or the report as bytes."""
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return ReportReader._extract(bytes(source), spec)
+
+        with open(source, "rb") as f:
+            if Path(source).stat().st_size == 0:
+                raise ValueError(f"Empty Lighthouse report: {source}")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                return ReportReader._extract(buf, spec)
+
+    @staticmethod
+    def read_summary(source, timing: bool = False):
+        """timing: also read lhr.timing.entries (near the end of the report – only when tracing)."""
+        spec = {**ReportReader.SUMMARY_SPEC, "timing": {"entries": True}} if timing else ReportReader.SUMMARY_SPEC
+        data = ReportReader.read(source, spec)
+        audits = data.get("audits", {})
+        data["metrics"] = {
+            name: audits.get(audit_id, {}).get("numericValue")
+            for name, audit_id in ReportReader.METRIC_AUDITS.items()
+        }
+        return data
+
+    # ------------------------------------------------------
+    # Scanner
+    # ------------------------------------------------------
+    @staticmethod
+    def _extract(buf, spec):
+        pos = _WS.match(buf, 0).end()
+        if buf[pos:pos + 1] != b"{":
+            raise ValueError("Lighthouse report is not a JSON object")
+
+        if buf[pos:pos + 5] == b'{\n  "':
+            return ReportReader._indented(buf, pos, len(buf), spec, 1)
+
+        result, _ = ReportReader._object(buf, pos, spec, stop_early=True)
+        return result
+
+    @staticmethod
+    def _indented(buf, start, end, spec, depth):
+        # Pretty-printed fast path: look each wanted key up directly
+        indent = b" " * (2 * depth)
+        closing = re.compile(rb"\n" + indent + rb"[}\]]")
+        result = {}
+
+        for key, sub in spec.items():
+            if not sub:
+                continue
+            m = re.compile(rb"\n" + indent + re.escape(json.dumps(key).encode()) + rb": ").search(buf, start, end)
+            if not m:
+                continue
+
+            pos = m.end()
+            if buf[pos:pos + 2] in (b"{\n", b"[\n"):
+                value_end = closing.search(buf, pos, end).end()
+            else:
+                value_end = ReportReader._skip(buf, pos)
+
+            if isinstance(sub, dict) and buf[pos:pos + 2] == b"{\n":
+                result[key] = ReportReader._indented(buf, pos, value_end, sub, depth + 1)
+            else:
+                result[key] = json.loads(buf[pos:value_end])
+
+        return result
+
+    @staticmethod
+    def _object(buf, pos, spec, stop_early=False):
+        # buf[pos] == "{" – returns (selected keys, position after "}")
+        result = {}
+        wanted = len(spec)
+        pos += 1
+
+        while True:
+            pos = _WS.match(buf, pos).end()
+            if buf[pos:pos + 1] == b"}":
+                return result, pos + 1
+
+            m = _STRING.match(buf, pos)
+            if not m:
+                raise ValueError(f"Malformed JSON at byte {pos}")
+            key = json.loads(m.group())
+            pos = _WS.match(buf, m.end()).end() + 1  # skip ":"
+            pos = _WS.match(buf, pos).end()
+
+            sub = spec.get(key)
+            if isinstance(sub, dict) and buf[pos:pos + 1] == b"{":
+                result[key], pos = ReportReader._object(buf, pos, sub)
+            elif sub:
+                end = ReportReader._skip(buf, pos)
+                result[key] = json.loads(buf[pos:end])
+                pos = end
+            else:
+                pos = ReportReader._skip(buf, pos)
+
+            # Top level: nothing left to find → don't scan the rest
+            if stop_early and len(result) == wanted:
+                return result, pos
+
+            pos = _WS.match(buf, pos).end()
+            if buf[pos:pos + 1] == b",":
+                pos += 1
+
+    @staticmethod
+    def _skip(buf, pos):
+        # Returns the position right after the JSON value starting at pos
+        first = buf[pos:pos + 1]
+
+        if first == b'"':
+            return _STRING.match(buf, pos).end()
+
+        if first in (b"{", b"["):
+            depth = 0
+            match = _TO_BRACKET.match
+            while True:
+                m = match(buf, pos)
+                if not m:
+                    raise ValueError("Unterminated JSON container")
+                pos = m.end()
+                if buf[pos - 1] in b"{[":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        return pos
+
+        return _SCALAR.match(buf, pos).end()
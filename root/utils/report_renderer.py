@@ -0,0 +1,62 @@
+# utils/report_renderer.py
+"""
+Lighthouse HTML reports rendered from the JSON report, without a second
+Lighthouse output.
+
+An HTML report is the Lighthouse renderer – identical for every run of one
+Lighthouse version – with the LHR inlined (see ReportStore.html_shell). The
+renderer "shell" is learned once per version from an HTML report Lighthouse
+wrote itself:
+
+    reports_workers/report_shell/12.2.1.html
+"""
+import os
+import tempfile
+from pathlib import Path
+
+from utils.report_store import ReportStore, HTML_PLACEHOLDER
+
+
+class ReportRenderer:
+    def __init__(self, root: str = "reports_workers/report_shell"):
+        self.root = Path(root)
+        self._shells = {}
+
+    def shell_path(self, version: str):
+        return self.root / f"{version}.html"
+
+    def has_shell(self, version: str):
+        return version in self._shells or self.shell_path(version).exists()
+
+    def shell(self, version: str):
+        if version not in self._shells:
+            try:
+                self._shells[version] = self.shell_path(version).read_bytes()
+            except FileNotFoundError:
+                return None
+        return self._shells[version]
+
+    def learn(self, html_path, version: str):
+        """Keeps the renderer of a Lighthouse-written HTML report, once per version."""
+        if not version or self.has_shell(version) or not Path(html_path).exists():
+            return False
+        shell = ReportStore.html_shell(Path(html_path).read_bytes())
+        if HTML_PLACEHOLDER not in shell:
+            return False
+
+        # Parallel workers may learn the same version – identical content, atomic replace
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(shell)
+        os.replace(tmp, self.shell_path(version))
+        self._shells[version] = shell
+        return True
+
+    def render(self, report_json: bytes, version: str):
+        """HTML report bytes, or None when no shell is known for this version."""
+        shell = self.shell(version)
+        if shell is None:
+            return None
+        # Pretty-printed JSON is a valid JS literal – only "<" must not end the <script>
+        return shell.replace(HTML_PLACEHOLDER, report_json.replace(b"<", b"\\u003c"), 1)
@@ -0,0 +1,112 @@
+# utils/report_slimmer.py
+import json
+from pathlib import Path
+
+from utils.report_store import ReportStore
+
+# Audits whose whole payload is base64 images – skipped at capture time
+SCREENSHOT_AUDITS = ["screenshot-thumbnails", "final-screenshot"]
+
+# Top-level LHR keys kept in a slim report (enough for ReportReader, the
+# history and the Lighthouse HTML renderer)
+KEEP_TOP_LEVEL = (
+    "lighthouseVersion", "requestedUrl", "mainDocumentUrl", "finalDisplayedUrl", "finalUrl", "fetchTime",
+    "gatherMode", "runtimeError", "runWarnings", "userAgent", "environment", "configSettings",
+    "audits", "categories", "categoryGroups", "timing", "i18n", "entities",
+)
+KEEP_AUDIT_KEYS = (
+    "id", "title", "description", "score", "scoreDisplayMode", "numericValue", "numericUnit",
+    "displayValue", "explanation", "errorMessage", "warnings", "metricSavings",
+)
+# Small detail types that are worth keeping whole
+KEEP_DETAIL_TYPES = ("debugdata",)
+# Tables kept with a few columns only – the per-resource side of utils.report_diff
+KEEP_TABLE_COLUMNS = {"network-requests": ("url", "transferSize", "resourceType")}
+
+
+class ReportSlimmer:
+    """
+    "slim" report profile (REPORTS.PROFILE):
+
+    - capture: screenshot audits are skipped through Lighthouse flags, so
+      they are never computed, serialised or written;
+    - store: passing, normal runs are rewritten to scores + metrics + the
+      top-N opportunity items per audit + a url/size/type request list.
+      Failing / abnormal runs keep the full report.
+    """
+
+    def __init__(self, skip_audits=None, top_opportunities: int = 5):
+        self.skip_audits = list(SCREENSHOT_AUDITS if skip_audits is None else skip_audits)
+        self.top_opportunities = top_opportunities
+
+    @staticmethod
+    def from_config(cfg: dict):
+        r = cfg.get("REPORTS", {})
+        if r.get("PROFILE", "full") != "slim":
+            return None
+        return ReportSlimmer(r.get("SKIP_AUDITS"), r.get("TOP_OPPORTUNITIES", 5))
+
+    def capture_flags(self):
+        # fullPageScreenshot is not an audit – it has its own switch
+        flags = ["--disable-full-page-screenshot"]
+        if self.skip_audits:
+            flags.append(f"--skip-audits={','.join(self.skip_audits)}")
+        return flags
+
+    # ------------------------------------------------------
+    # Post-processing
+    # ------------------------------------------------------
+    def _details(self, details: dict, audit_id: str = None):
+        if details.get("type") in KEEP_DETAIL_TYPES:
+            return details
+        if audit_id in KEEP_TABLE_COLUMNS:
+            columns = KEEP_TABLE_COLUMNS[audit_id]
+            return {"type": details.get("type"),
+                    "headings": [h for h in details.get("headings", []) if h.get("key") in columns],
+                    "items": [{k: i[k] for k in columns if k in i} for i in details.get("items", [])]}
+        if details.get("type") != "opportunity":
+            return None
+
+        # Biggest savings first – same order the HTML report shows
+        items = sorted(
+            details.get("items", []),
+            key=lambda i: (i.get("wastedMs") or 0, i.get("wastedBytes") or 0),
+            reverse=True,
+        )
+        slim = {k: v for k, v in details.items() if k not in ("items", "debugData")}
+        slim["items"] = items[:self.top_opportunities]
+        return slim
+
+    def slim_lhr(self, lhr: dict):
+        slim = {k: lhr[k] for k in KEEP_TOP_LEVEL if k in lhr}
+        audits = {}
+        for audit_id, audit in lhr.get("audits", {}).items():
+            if audit_id in self.skip_audits:
+                continue
+            kept = {k: audit[k] for k in KEEP_AUDIT_KEYS if k in audit}
+            details = audit.get("details") and self._details(audit["details"], audit_id)
+            if details:
+                kept["details"] = details
+            audits[audit_id] = kept
+        slim["audits"] = audits
+        return slim
+
+    def slim_files(self, json_path, html_path=None):
+        """Rewrite a run's report files in place. Returns bytes saved."""
+        json_path = Path(json_path)
+        before = json_path.stat().st_size
+        lhr = json.loads(json_path.read_bytes())
+
+        # Same layout as Lighthouse (JSON.stringify(lhr, null, 2)) – keeps ReportReader's fast path
+        report = json.dumps(self.slim_lhr(lhr), indent=2, ensure_ascii=False).encode("utf-8")
+        json_path.write_bytes(report)
+        saved = before - len(report)
+
+        if html_path and Path(html_path).exists():
+            html_path = Path(html_path)
+            before = html_path.stat().st_size
+            html = ReportStore.inline_json(ReportStore.html_shell(html_path.read_bytes()), report)
+            html_path.write_bytes(html)
+            saved += before - len(html)
+
+        return saved
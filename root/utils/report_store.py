@@ -0,0 +1,225 @@
+# utils/report_store.py
+"""
+Content-addressed, gzip-compressed store for Lighthouse reports.
+
+    report_store/
+        objects/ab/ab12…ef.json.gz     ← one blob per distinct content
+        index.jsonl                    ← one line per archived run
+
+Every artifact is written once. The HTML report is the Lighthouse renderer
+plus the full LHR inlined as `window.__LIGHTHOUSE_JSON__ = {...};` – we keep
+only the renderer shell (identical for every run of one Lighthouse version,
+so it de-duplicates to a single blob) and rebuild the HTML from the JSON
+blob on export.
+
+    cd root && python -m utils.report_store export ../report_store out/ --page homepage
+    cd root && python -m utils.report_store prune  ../report_store            ← RETENTION_DAYS of the config
+    cd root && python -m utils.report_store prune  ../report_store --days 14
+"""
+import os
+import json
+import gzip
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
+from pathlib import Path
+
+from utils.config_reader import ConfigReader
+
+HTML_JSON_MARKER = b"window.__LIGHTHOUSE_JSON__ = "
+HTML_JSON_END = b";</script>"
+HTML_PLACEHOLDER = b"%%LIGHTHOUSE_JSON%%"
+
+# Blobs younger than this are never garbage-collected: a run still being
+# archived has written its blobs but not yet its index line
+GC_GRACE_SECONDS = 3600
+
+
+class ReportStore:
+    def __init__(self, root: str = "report_store", retention_days: int = None):
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.index_path = self.root / "index.jsonl"
+        self.retention_days = retention_days
+        self.objects.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def from_config(cfg: dict):
+        s = cfg.get("REPORT_STORE", {})
+        if not s.get("ENABLED", False):
+            return None
+        return ReportStore(s.get("ROOT", "report_store"), retention_days=s.get("RETENTION_DAYS"))
+
+    # ------------------------------------------------------
+    # Blobs
+    # ------------------------------------------------------
+    def blob_path(self, digest: str, ext: str):
+        return self.objects / digest[:2] / f"{digest}.{ext}.gz"
+
+    def put_bytes(self, data: bytes, ext: str):
+        digest = hashlib.sha256(data).hexdigest()
+        target = self.blob_path(digest, ext)
+        if target.exists():
+            os.utime(target)  # already stored – dedup; fresh mtime keeps it out of a concurrent GC
+            return digest
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as gz:
+            gz.write(data)
+        os.replace(tmp, target)
+        return digest
+
+    def put_file(self, path, ext: str = None):
+        ext = ext or Path(path).suffix.lstrip(".")
+        data = Path(path).read_bytes()
+        if ext == "html":
+            return self.put_bytes(self.html_shell(data), "shell.html")
+        return self.put_bytes(data, ext)
+
+    def read_bytes(self, digest: str, ext: str):
+        with gzip.open(self.blob_path(digest, ext), "rb") as f:
+            return f.read()
+
+    def open(self, digest: str, ext: str):
+        return gzip.open(self.blob_path(digest, ext), "rb")
+
+    # ------------------------------------------------------
+    # HTML <-> shell + JSON
+    # ------------------------------------------------------
+    @staticmethod
+    def html_shell(html: bytes):
+        start = html.find(HTML_JSON_MARKER)
+        if start < 0:
+            return html  # not a Lighthouse report – keep as is
+        start += len(HTML_JSON_MARKER)
+        end = html.find(HTML_JSON_END, start)
+        return html[:start] + HTML_PLACEHOLDER + html[end:]
+
+    @staticmethod
+    def inline_json(shell: bytes, report_json: bytes):
+        if HTML_PLACEHOLDER not in shell:
+            return shell
+        lhr = json.loads(report_json)
+        inlined = json.dumps(lhr, separators=(",", ":")).replace("<", "\\u003c").encode()
+        return shell.replace(HTML_PLACEHOLDER, inlined, 1)
+
+    def read_html(self, entry: dict):
+        shell = self.read_bytes(entry["html"], "shell.html")
+        return self.inline_json(shell, self.read_bytes(entry["json"], "json"))
+
+    # ------------------------------------------------------
+    # Index
+    # ------------------------------------------------------
+    def add_run(self, json_path, html_path, shell: bytes = None, **meta):
+        """shell: renderer shell to store when no HTML was written (stdout pipeline) – export rebuilds it."""
+        if html_path and Path(html_path).exists():
+            html = self.put_file(html_path, "html")
+        else:
+            html = self.put_bytes(shell, "shell.html") if shell else None
+        entry = {
+            **meta,
+            "ts": time.time(),
+            "json": self.put_file(json_path, "json"),
+            "html": html,
+        }
+        line = json.dumps(entry, default=str) + "\n"
+        # single small O_APPEND write – safe with parallel writers
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(line)
+        return entry
+
+    def entries(self, **filters):
+        if not self.index_path.exists():
+            return
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if all(entry.get(k) == v for k, v in filters.items() if v is not None):
+                    yield entry
+
+    def export(self, entry: dict, target_dir):
+        target = Path(target_dir)
+        target.mkdir(parents=True, exist_ok=True)
+        stem = target / f"run_{entry.get('run', entry['json'][:12])}"
+
+        json_out = stem.with_suffix(".json")
+        with self.open(entry["json"], "json") as src, open(json_out, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+
+        html_out = None
+        if entry.get("html"):
+            html_out = stem.with_suffix(".html")
+            html_out.write_bytes(self.read_html(entry))
+
+        return json_out, html_out
+
+    # ------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------
+    def prune(self, retention_days: int = None):
+        """Not safe while a test run is archiving into the same store – run it between sessions."""
+        days = retention_days if retention_days is not None else self.retention_days
+        if not days or not self.index_path.exists():
+            return 0
+
+        cutoff = time.time() - days * 86400
+        kept = [e for e in self.entries() if e.get("ts", 0) >= cutoff]
+
+        tmp = self.index_path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(e, default=str) + "\n" for e in kept)
+        os.replace(tmp, self.index_path)
+
+        # Garbage-collect blobs nobody references any more
+        live = {e[k] for e in kept for k in ("json", "html") if e.get(k)}
+        grace = time.time() - GC_GRACE_SECONDS
+        removed = 0
+        for blob in self.objects.glob("*/*.gz"):
+            if blob.name.split(".", 1)[0] not in live and blob.stat().st_mtime < grace:
+                blob.unlink()
+                removed += 1
+        return removed
+
+    def disk_usage(self):
+        return sum(p.stat().st_size for p in self.objects.glob("*/*.gz"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lighthouse report store")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    exp = sub.add_parser("export", help="materialize archived runs as .json/.html")
+    exp.add_argument("store")
+    exp.add_argument("target")
+    for key in ("mode", "brand", "page", "verdict"):
+        exp.add_argument(f"--{key}")
+
+    prn = sub.add_parser("prune", help="drop runs older than --days and unreferenced blobs")
+    prn.add_argument("store")
+    prn.add_argument("--days", type=int, default=None, help="default: REPORT_STORE.RETENTION_DAYS of --config")
+    prn.add_argument("--config", default="config_desktop.json")
+
+    args = parser.parse_args(argv)
+    store = ReportStore(args.store)
+
+    if args.cmd == "export":
+        count = 0
+        for e in store.entries(mode=args.mode, brand=args.brand, page=args.page, verdict=args.verdict):
+            store.export(e, Path(args.target) / e["verdict"] / e["mode"] / e["brand"] / e["page"])
+            count += 1
+        print(f"Exported {count} runs → {args.target}")
+    else:
+        days = args.days or ConfigReader.load_config(args.config).get("REPORT_STORE", {}).get("RETENTION_DAYS")
+        if not days:
+            parser.error(f"no --days and no REPORT_STORE.RETENTION_DAYS in {args.config}")
+        removed = store.prune(days)
+        print(f"Removed {removed} blobs, {store.disk_usage() / 1e6:.1f} MB left")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# utils/rescore.py
+"""
+Re-score the archived Lighthouse reports against the current thresholds.
+
+    cd root && python -m utils.rescore .. --out rescore.csv
+
+Reads every archived run – the legacy copies under
+<archive_root>/reports_passed|reports_failed/<mode>/<brand>/<page>/run_*.json
+and the runs indexed in <archive_root>/report_store – extracts scores + core
+metrics on a process pool and writes one compact CSV.
+"""
+import os
+import csv
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.config_reader import ConfigReader
+from utils.report_reader import ReportReader
+from utils.report_store import ReportStore
+
+ARCHIVE_DIRS = ("reports_passed", "reports_failed")
+STORE_DIR = "report_store"
+
+COLUMNS = [
+    "mode", "brand", "page", "run", "archived_as",
+    "Performance", "Accessibility", "BestPractices", "SEO",
+    *ReportReader.METRIC_AUDITS.keys(),
+    "benchmarkIndex", "lighthouseVersion", "passed", "path",
+]
+
+
+def find_reports(archive_root):
+    # One task dict per archived run: metadata + where to read the JSON from
+    root = Path(archive_root)
+    for archive in ARCHIVE_DIRS:
+        for path in sorted((root / archive).glob("*/*/*/run_*.json")):
+            page_dir = path.parent
+            yield {
+                "mode": page_dir.parent.parent.name,
+                "brand": page_dir.parent.name,
+                "page": page_dir.name,
+                "run": path.stem.replace("run_", ""),
+                "archived_as": archive,
+                "path": str(path),
+            }
+
+    store_root = root / STORE_DIR
+    if (store_root / "index.jsonl").exists():
+        store = ReportStore(store_root)
+        for entry in store.entries():
+            yield {
+                "mode": entry["mode"],
+                "brand": entry["brand"],
+                "page": entry["page"],
+                "run": entry["run"],
+                "archived_as": f"{STORE_DIR}:{entry['verdict']}",
+                "path": str(store.blob_path(entry["json"], "json")),
+                "store": str(store_root),
+                "digest": entry["json"],
+            }
+
+
+def load_thresholds(modes):
+    # {mode: Performance threshold in %} – same rule as the test verdict;
+    # "desktop-warm" (repeat view) uses THRESHOLDS_WARM of config_desktop.json
+    thresholds = {}
+    for mode in modes:
+        base, _, view = mode.partition("-")
+        try:
+            cfg = ConfigReader.load_config(f"config_{base}.json")
+        except FileNotFoundError:
+            continue
+        t = cfg.get("THRESHOLDS_WARM") if view == "warm" else cfg["THRESHOLDS"]
+        if t:
+            thresholds[mode] = t["PERFORMANCE"] * 100
+    return thresholds
+
+
+def score_report(args):
+    task, threshold = args
+    row = {k: task[k] for k in ("mode", "brand", "page", "run", "archived_as", "path")}
+
+    try:
+        if "digest" in task:
+            source = ReportStore(task["store"]).read_bytes(task["digest"], "json")
+        else:
+            source = task["path"]
+        data = ReportReader.read_summary(source)
+    except (OSError, ValueError) as e:
+        row["passed"] = f"error: {e}"
+        return row
+
+    categories = data.get("categories", {})
+    for name, cat in zip(["Performance", "Accessibility", "BestPractices", "SEO"], ReportReader.CATEGORIES):
+        score = categories.get(cat, {}).get("score")
+        row[name] = None if score is None else score * 100
+
+    row.update(data["metrics"])
+    row["benchmarkIndex"] = data.get("environment", {}).get("benchmarkIndex")
+    row["lighthouseVersion"] = data.get("lighthouseVersion")
+
+    if threshold is not None and row["Performance"] is not None:
+        row["passed"] = row["Performance"] >= threshold
+
+    return row
+
+
+def rescore(archive_root, out_path="rescore.csv", workers=None, thresholds=None):
+    reports = list(find_reports(archive_root))
+    modes = {t["mode"] for t in reports}
+    thresholds = thresholds if thresholds is not None else load_thresholds(modes)
+
+    tasks = [(t, thresholds.get(t["mode"])) for t in reports]
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers) as pool, \
+            open(out_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        chunksize = max(1, len(tasks) // (workers * 4))
+        for row in pool.map(score_report, tasks, chunksize=chunksize):
+            writer.writerow(row)
+
+    return out_path, len(tasks)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-score archived Lighthouse reports")
+    parser.add_argument("archive_root", nargs="?", default=".")
+    parser.add_argument("--out", default="rescore.csv")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    out_path, count = rescore(args.archive_root, args.out, args.workers)
+    print(f"Re-scored {count} reports → {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# utils/run_result.py
+import math
+from array import array
+
+from utils.report_reader import ReportReader
+
+SCORE_KEYS = ("Performance", "Accessibility", "BestPractices", "SEO")
+METRIC_KEYS = tuple(ReportReader.METRIC_AUDITS)
+VALUE_KEYS = SCORE_KEYS + METRIC_KEYS
+
+_NAN = float("nan")
+
+
+class RunResult:
+    """
+    One Lighthouse run: report paths, environment and every number we keep
+    (category scores 0–100 + raw metric numericValues) packed in one
+    array('d') – NaN = missing. RunStats reads the arrays without copying.
+
+    Still answers r["scores"], r["metrics"], r.get("cached") … like the old
+    run dicts, so thresholds, history, cache and attachments work unchanged.
+    """
+
+    __slots__ = ("run", "json", "html", "values", "lighthouse_version", "benchmark_index", "host_load",
+                 "fetch_time", "runtime_error", "run_warnings", "cached", "cached_at")
+
+    def __init__(self, run: int, json=None, html=None, scores: dict = None, metrics: dict = None,
+                 lighthouse_version: str = None, benchmark_index: float = None, fetch_time: str = None,
+                 cached: bool = False, cached_at: float = None, host_load: float = None,
+                 runtime_error: dict = None, run_warnings=None):
+        self.run = run
+        self.json = json
+        self.html = html
+        self.lighthouse_version = lighthouse_version
+        self.benchmark_index = benchmark_index
+        self.host_load = host_load  # load average per CPU during the run
+        self.fetch_time = fetch_time
+        self.runtime_error = runtime_error  # lhr.runtimeError {code, message} – see RunValidator
+        self.run_warnings = list(run_warnings or [])
+        self.cached = cached
+        self.cached_at = cached_at
+
+        scores, metrics = scores or {}, metrics or {}
+        self.values = array("d", (
+            _NAN if v is None else v
+            for v in [*(scores.get(k) for k in SCORE_KEYS), *(metrics.get(k) for k in METRIC_KEYS)]
+        ))
+
+    # ------------------------------------------------------
+    # Values
+    # ------------------------------------------------------
+    def value(self, key: str):
+        v = self.values[VALUE_KEYS.index(key)]
+        return None if math.isnan(v) else v
+
+    @property
+    def scores(self):
+        return {k: self.value(k) for k in SCORE_KEYS}
+
+    @property
+    def metrics(self):
+        return {k: self.value(k) for k in METRIC_KEYS}
+
+    # ------------------------------------------------------
+    # Dict compatibility
+    # ------------------------------------------------------
+    def __getitem__(self, key):
+        if key in self.__slots__ or key in ("scores", "metrics"):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self, paths: bool = True):
+        d = {
+            "run": self.run,
+            "scores": self.scores,
+            "metrics": self.metrics,
+            "lighthouse_version": self.lighthouse_version,
+            "benchmark_index": self.benchmark_index,
+            "host_load": self.host_load,
+            "fetch_time": self.fetch_time,
+            "runtime_error": self.runtime_error,
+            "run_warnings": self.run_warnings,
+        }
+        if paths:
+            d.update(json=str(self.json), html=str(self.html))
+        return d
+
+    def __repr__(self):
+        return f"RunResult(run={self.run}, scores={self.scores})"
@@ -0,0 +1,110 @@
+# utils/run_stats.py
+import warnings
+
+import numpy as np
+
+from utils.run_result import VALUE_KEYS
+
+# Modified z-score cut-off (Iglewicz & Hoaglin): 0.6745·|x − median| / MAD
+OUTLIER_Z = 3.5
+
+
+class RunStats:
+    """
+    Per-page statistics for every value in VALUE_KEYS, computed in one
+    vectorised pass over all pages and runs.
+
+    Runs are packed into a (pages, max_runs, values) array padded with NaN,
+    so median / p75 / p90 / MAD / outlier flags are a handful of numpy calls
+    however many pages there are.
+    """
+
+    def __init__(self, results_by_page: dict):
+        """results_by_page: {page_name: [RunResult, ...]}"""
+        self.pages = list(results_by_page)
+        self.runs = [list(results_by_page[p]) for p in self.pages]
+        self._index = {p: i for i, p in enumerate(self.pages)}
+
+        counts = np.array([len(r) for r in self.runs], dtype=np.intp)
+        width = len(VALUE_KEYS)
+        self.values = np.full((len(self.pages), max(counts, default=0), width), np.nan)
+
+        if counts.sum():
+            # One flat buffer of every run's array('d'), scattered into place
+            flat = np.frombuffer(b"".join(r.values.tobytes() for runs in self.runs for r in runs))
+            page_idx = np.repeat(np.arange(len(self.pages)), counts)
+            run_idx = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            self.values[page_idx, run_idx] = flat.reshape(-1, width)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN columns (missing metrics)
+            self.mean = np.nanmean(self.values, axis=1)
+            self.median, self.p75, self.p90 = self._percentiles(self.values, (50, 75, 90))
+            deviation = np.abs(self.values - self.median[:, None, :])
+            (self.mad,) = self._percentiles(deviation, (50,))
+
+            # NaN padding and MAD = 0 (identical runs) never flag
+            z = 0.6745 * deviation / self.mad[:, None, :]
+            self.outliers = np.nan_to_num(z, nan=0.0, posinf=0.0) > OUTLIER_Z
+
+    @staticmethod
+    def _percentiles(values, ps):
+        """
+        nanpercentile over axis 1 (linear interpolation). np.nanpercentile
+        falls back to a Python loop per (page, value) column – sorting once
+        (NaN last) and indexing by each column's valid count stays vectorised.
+        """
+        ordered = np.sort(values, axis=1)
+        counts = (~np.isnan(values)).sum(axis=1)
+        out = []
+        for p in ps:
+            k = np.maximum(counts - 1, 0) * (p / 100)
+            lo, hi = np.floor(k).astype(np.intp), np.ceil(k).astype(np.intp)
+            if ordered.shape[1] == 0:
+                out.append(np.full(counts.shape, np.nan))
+                continue
+            low = np.take_along_axis(ordered, lo[:, None, :], axis=1)[:, 0, :]
+            high = np.take_along_axis(ordered, hi[:, None, :], axis=1)[:, 0, :]
+            out.append(np.where(counts > 0, low + (high - low) * (k - lo), np.nan))
+        return out
+
+    @staticmethod
+    def _column(key: str):
+        if key not in VALUE_KEYS:
+            raise ValueError(f"Unknown value: {key} (one of {', '.join(VALUE_KEYS)})")
+        return VALUE_KEYS.index(key)
+
+    @staticmethod
+    def _as_dict(row):
+        return {k: None if np.isnan(v) else float(v) for k, v in zip(VALUE_KEYS, row)}
+
+    # ------------------------------------------------------
+    # Per page
+    # ------------------------------------------------------
+    def medians(self, page_name):
+        return self._as_dict(self.median[self._index[page_name]])
+
+    def summary(self, page_name):
+        """{stat: {value_key: number or None}} – mean, median, p75, p90, mad."""
+        i = self._index[page_name]
+        return {
+            "mean": self._as_dict(self.mean[i]),
+            "median": self._as_dict(self.median[i]),
+            "p75": self._as_dict(self.p75[i]),
+            "p90": self._as_dict(self.p90[i]),
+            "mad": self._as_dict(self.mad[i]),
+        }
+
+    def outlier_runs(self, page_name, key="Performance"):
+        i, col = self._index[page_name], self._column(key)
+        flags = self.outliers[i, :len(self.runs[i]), col]
+        return [r for r, flag in zip(self.runs[i], flags) if flag]
+
+    def drops(self, page_name, key="Performance", rel=0.20):
+        """Runs at least `rel` away from the page mean – the old detect_abnormal rule."""
+        i, col = self._index[page_name], self._column(key)
+        mean = self.mean[i, col]
+        values = self.values[i, :len(self.runs[i]), col]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            flags = np.abs(values - mean) / mean >= rel
+        return [r for r, flag in zip(self.runs[i], flags) if flag]
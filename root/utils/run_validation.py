@@ -0,0 +1,88 @@
+# utils/run_validation.py
+import re
+
+from utils.run_result import SCORE_KEYS
+
+# What a failed run says about where the problem is:
+#   transient       – the page / network hiccuped, another run will likely be fine
+#   infrastructure  – our browser, host or harness failed, another run will likely be fine
+#   page            – the page itself is broken for Lighthouse, re-running won't help
+TRANSIENT, INFRASTRUCTURE, PAGE = "transient", "infrastructure", "page"
+
+# lhr.runtimeError.code (Lighthouse's LighthouseError ids)
+RUNTIME_ERRORS = {
+    "NO_FCP": TRANSIENT,
+    "NO_LCP": TRANSIENT,
+    "PAGE_HUNG": TRANSIENT,
+    "FAILED_DOCUMENT_REQUEST": TRANSIENT,
+    "NO_RESOURCE_REQUEST": TRANSIENT,
+    "NO_DOCUMENT_REQUEST": TRANSIENT,
+
+    "PROTOCOL_TIMEOUT": INFRASTRUCTURE,
+    "CRI_TIMEOUT": INFRASTRUCTURE,
+    "TARGET_CRASHED": INFRASTRUCTURE,
+    "NO_SCREENSHOTS": INFRASTRUCTURE,
+    "NO_TRACING_STARTED": INFRASTRUCTURE,
+    "NO_NAVSTART": INFRASTRUCTURE,
+    "NO_DCL": INFRASTRUCTURE,
+    "TRACING_ALREADY_STARTED": INFRASTRUCTURE,
+    "PARSING_PROBLEM": INFRASTRUCTURE,
+    "READ_FAILED": INFRASTRUCTURE,
+    "MISSING_REQUIRED_ARTIFACT": INFRASTRUCTURE,
+    "ERRORED_REQUIRED_ARTIFACT": INFRASTRUCTURE,
+
+    "DNS_FAILURE": PAGE,
+    "INVALID_URL": PAGE,
+    "NOT_HTML": PAGE,
+    "ERRORED_DOCUMENT_REQUEST": PAGE,   # 4xx / 5xx main document
+    "INSECURE_DOCUMENT_REQUEST": PAGE,
+    "CHROME_INTERSTITIAL_ERROR": PAGE,
+}
+
+# lhr.runWarnings that make an otherwise complete run untrustworthy
+RUN_WARNINGS = [
+    (re.compile(r"loaded too slowly to finish within the time limit", re.I), TRANSIENT),
+    (re.compile(r"slower CPU than Lighthouse expects", re.I), INFRASTRUCTURE),
+    (re.compile(r"Chrome extensions negatively affected", re.I), INFRASTRUCTURE),
+]
+
+
+class RunValidator:
+    """
+    Decides whether a finished run is a valid sample.
+
+    A run is invalid when Lighthouse reports a runtimeError, when one of
+    RUN_WARNINGS fires, or when a category score is null. Invalid runs never
+    reach statistics or the verdict; transient / infrastructure ones are run
+    again while the page's RETRIES budget lasts, page-level ones fail the
+    page straight away.
+    """
+
+    def __init__(self, retries: int = 2):
+        self.retries = retries
+
+    @staticmethod
+    def from_config(cfg: dict):
+        return RunValidator(cfg.get("VALIDATION", {}).get("RETRIES", 2))
+
+    @staticmethod
+    def classify(run_result):
+        """(group, reason) for an invalid run, None for a valid one."""
+        error = run_result.runtime_error
+        if error and error.get("code"):
+            code = error["code"]
+            return RUNTIME_ERRORS.get(code, TRANSIENT), f"{code}: {error.get('message', '')}".rstrip(": ")
+
+        for warning in run_result.run_warnings or ():
+            for pattern, group in RUN_WARNINGS:
+                if pattern.search(warning):
+                    return group, f"warning: {warning}"
+
+        missing = [k for k in SCORE_KEYS if run_result.value(k) is None]
+        if missing:
+            return TRANSIENT, f"null score: {', '.join(missing)}"
+        return None
+
+    @staticmethod
+    def retryable(group: str):
+        return group in (TRANSIENT, INFRASTRUCTURE)
@@ -0,0 +1,95 @@
+# utils/sampling.py
+import math
+import statistics
+
+from utils.run_result import VALUE_KEYS
+
+# Two-sided 95% Student-t critical values by degrees of freedom
+T_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 30: 2.042,
+}
+
+
+def t_critical(df: int):
+    if df <= 0:
+        return math.inf
+    if df in T_95:
+        return T_95[df]
+    # nearest tabulated df below (conservative), normal beyond 30
+    lower = [k for k in T_95 if k < df]
+    return T_95[max(lower)] if df < 30 else 1.96
+
+
+class AdaptiveSampler:
+    """
+    Decides how many Lighthouse runs a page needs.
+
+    A page keeps getting runs until the 95% confidence interval of every
+    watched metric (a score or a raw metric of RunResult.value()) is at most
+    ±ci_half_width, or max_runs is reached. Stable pages stop at min_runs;
+    the run budget goes to the noisy ones.
+
+    ci_half_width: one width for every metric, or {metric: width} – LCP / TBT
+    are in ms, CLS unitless, scores 0–100.
+    """
+
+    def __init__(self, min_runs: int = 2, max_runs: int = 6, ci_half_width: float = 3.0,
+                 metrics=("Performance",)):
+        self.min_runs = max(2, min_runs)
+        self.max_runs = max(self.min_runs, max_runs)
+        self.ci_half_width = ci_half_width
+        self.metrics = list(metrics)
+
+    @staticmethod
+    def from_config(cfg: dict):
+        s = cfg.get("SAMPLING", {})
+        if not s.get("ENABLED", False):
+            return None
+        unknown = [m for m in s.get("METRICS", []) if m not in VALUE_KEYS]
+        if unknown:
+            raise ValueError(f"Unknown SAMPLING.METRICS {unknown}, expected any of {list(VALUE_KEYS)}")
+        return AdaptiveSampler(
+            min_runs=s.get("MIN_RUNS", 2),
+            max_runs=s.get("MAX_RUNS", 6),
+            ci_half_width=s.get("CI_HALF_WIDTH", 3.0),
+            metrics=s.get("METRICS", ["Performance"]),
+        )
+
+    @staticmethod
+    def half_width(values):
+        n = len(values)
+        if n < 2:
+            return math.inf
+        return t_critical(n - 1) * statistics.stdev(values) / math.sqrt(n)
+
+    def target(self, metric: str):
+        if isinstance(self.ci_half_width, dict):
+            return self.ci_half_width.get(metric, 3.0)
+        return self.ci_half_width
+
+    def runs_needed(self, run_results):
+        """How many more runs to schedule for this page (0 = converged)."""
+        n = len(run_results)
+        if n < self.min_runs:
+            return self.min_runs - n
+        if n >= self.max_runs:
+            return 0
+
+        needed = n
+        for metric in self.metrics:
+            # Runs without the metric (no LCP element …) carry no information about it
+            values = [v for v in (r.value(metric) for r in run_results) if v is not None]
+            target = self.target(metric)
+            if self.half_width(values) <= target:
+                continue
+            if len(values) < 2:
+                needed = max(needed, n + 1)
+                continue
+            # n ≈ (t·s / target)² – schedule the estimate in one batch so
+            # parallel workers stay busy, at least one more run
+            sd = statistics.stdev(values)
+            estimate = math.ceil((t_critical(len(values) - 1) * sd / target) ** 2)
+            needed = max(needed, estimate, n + 1)
+
+        return min(needed, self.max_runs) - n
@@ -0,0 +1,169 @@
+# utils/shard_planner.py
+"""
+Splits the (mode, brand, page) test items across CI nodes so that every
+shard needs about the same wall time, and merges the shards' results.
+
+    pytest root/tests --shard-id 0 --num-shards 3        ← one node
+    cd root && python -m utils.shard_planner plan  --num-shards 3 --durations ../.lighthouse_durations.json
+    cd root && python -m utils.shard_planner merge ../shard_results/*.json --out ../lighthouse_summary.json
+"""
+import json
+import glob
+import heapq
+import argparse
+from pathlib import Path
+
+
+class ShardPlanner:
+    """
+    Longest-processing-time first: items sorted by past duration (slowest
+    first), each one goes to the shard with the least work so far.
+
+    Deterministic: the plan depends only on the item list and the durations
+    file, so every node computes the same plan and picks its own shard.
+    Ties break on the item id, then the lowest shard index. Items never seen
+    before weigh as much as the slowest known one.
+
+    A page's runs stay on one shard – the verdict, outlier detection and
+    history need all of them together.
+    """
+
+    def __init__(self, num_shards: int, durations: dict = None):
+        if num_shards < 1:
+            raise ValueError(f"num_shards must be >= 1, got {num_shards}")
+        self.num_shards = num_shards
+        # durations are keyed by pytest nodeid – the plan only uses the item
+        # id, so it does not depend on the directory pytest was started from
+        self.durations = {self.test_id(k): v for k, v in (durations or {}).items()}
+        self.default = max(self.durations.values(), default=1.0)
+
+    @staticmethod
+    def test_id(nodeid: str):
+        # "root/tests/test_x.py::Test::test[desktop-paved-home]" → "desktop-paved-home"
+        return nodeid.rpartition("[")[2].rstrip("]") if nodeid.endswith("]") else nodeid
+
+    @staticmethod
+    def load_durations(path):
+        try:
+            return json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def weight(self, item_id: str):
+        return self.durations.get(item_id, self.default)
+
+    def plan(self, item_ids):
+        """[[item_id, …] per shard], each shard in its own run order (slowest first)."""
+        shards = [[] for _ in range(self.num_shards)]
+        heap = [(0.0, i) for i in range(self.num_shards)]
+        for item_id in sorted(set(item_ids), key=lambda i: (-self.weight(i), i)):
+            load, shard = heapq.heappop(heap)
+            shards[shard].append(item_id)
+            heapq.heappush(heap, (load + self.weight(item_id), shard))
+        return shards
+
+    def loads(self, shards):
+        return [round(sum(self.weight(i) for i in shard), 2) for shard in shards]
+
+    def select(self, item_ids, shard_id: int):
+        if not 0 <= shard_id < self.num_shards:
+            raise ValueError(f"shard_id must be in [0, {self.num_shards}), got {shard_id}")
+        return set(self.plan(item_ids)[shard_id])
+
+
+def item_id(mode: str, brand: str, page_name: str, view: str = "cold"):
+    # id of the parametrized test (conftest.pytest_generate_tests)
+    return f"{mode}-{brand}-{page_name}" + ("" if view == "cold" else f"-{view}")
+
+
+# ------------------------------------------------------
+# Merge
+# ------------------------------------------------------
+def merge(paths):
+    """
+    Combines shard_results/shard_<id>.json files into one summary:
+    per-page outcome / scores / reports, totals and per-shard wall time.
+    A page reported by several shards (re-run job) keeps its latest result.
+    """
+    shards, pages = [], {}
+    for path in sorted(paths):
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        shards.append({k: data.get(k) for k in ("shard_id", "num_shards", "started_at", "finished_at", "wall_s")})
+        for item in data.get("items", []):
+            prev = pages.get(item["nodeid"])
+            if prev is None or item.get("finished_at", 0) >= prev.get("finished_at", 0):
+                pages[item["nodeid"]] = {**item, "shard_id": data.get("shard_id")}
+
+    counts = {}
+    for item in pages.values():
+        counts[item["outcome"]] = counts.get(item["outcome"], 0) + 1
+
+    walls = [s["wall_s"] for s in shards if s.get("wall_s") is not None]
+    return {
+        "shards": sorted(shards, key=lambda s: s.get("shard_id") or 0),
+        "total": len(pages),
+        "outcomes": counts,
+        "passed": counts.get("failed", 0) == 0 and counts.get("error", 0) == 0,
+        # how even the plan was: slowest shard vs the mean
+        "imbalance": round(max(walls) / (sum(walls) / len(walls)), 3) if walls and sum(walls) else None,
+        "pages": [pages[k] for k in sorted(pages)],
+    }
+
+
+def merged_durations(paths, base: dict = None):
+    """Durations of every shard layered over `base` – feeds the next plan."""
+    durations = dict(base or {})
+    for path in sorted(paths):
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        durations.update({i["nodeid"]: i["duration"] for i in data.get("items", []) if i.get("duration")})
+    return durations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Shard planning and merging for the Lighthouse suite")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    pl = sub.add_parser("plan", help="show the shard plan for the configured pages")
+    pl.add_argument("--num-shards", type=int, required=True)
+    pl.add_argument("--durations", default=".lighthouse_durations.json")
+    pl.add_argument("--lh-mode", action="append", choices=["desktop", "mobile"], default=None)
+
+    mg = sub.add_parser("merge", help="combine shard result files into one summary")
+    mg.add_argument("files", nargs="+", help="shard result files (globs are expanded)")
+    mg.add_argument("--out", default="lighthouse_summary.json")
+    mg.add_argument("--durations", default=None, help="also write merged durations to this file")
+    args = parser.parse_args(argv)
+
+    if args.cmd == "plan":
+        from utils.config_reader import ConfigReader
+
+        item_ids = [
+            item_id(mode, brand, page_name, view)
+            for mode in args.lh_mode or ["desktop", "mobile"]
+            for view in ConfigReader.load_config(f"config_{mode}.json").get("VIEWS", ["cold"])
+            for brand, _, page_name in ConfigReader.load_pages(mode)
+        ]
+        planner = ShardPlanner(args.num_shards, ShardPlanner.load_durations(args.durations))
+        shards = planner.plan(item_ids)
+        for i, (shard, load) in enumerate(zip(shards, planner.loads(shards))):
+            print(f"shard {i}: {len(shard)} pages, ~{load:.0f} s")
+            for test_id in shard:
+                print(f"    {test_id}")
+        return 0
+
+    paths = [p for pattern in args.files for p in (glob.glob(pattern) or [pattern])]
+    summary = merge(paths)
+    Path(args.out).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    if args.durations:
+        base = ShardPlanner.load_durations(args.durations)
+        Path(args.durations).write_text(json.dumps(merged_durations(paths, base), indent=2), encoding="utf-8")
+
+    print(f"{len(paths)} shards, {summary['total']} pages: "
+          + ", ".join(f"{k} {v}" for k, v in sorted(summary["outcomes"].items()))
+          + (f", imbalance x{summary['imbalance']}" if summary["imbalance"] else ""))
+    print(f"Saved → {args.out}")
+    return 0 if summary["passed"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
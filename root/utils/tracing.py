@@ -0,0 +1,193 @@
+# utils/tracing.py
+import os
+import json
+import time
+import importlib
+import threading
+import contextvars
+from pathlib import Path
+from contextlib import contextmanager
+
+from utils.history_db import percentile
+
+# Tags (brand, page, mode, run, worker …) inherited by every span opened
+# inside TRACER.tags() – contextvars follow asyncio tasks and to_thread()
+_TAGS = contextvars.ContextVar("trace_tags", default={})
+
+# Lighthouse's own timing entries (lhr.timing.entries) worth a span –
+# startTime is ms since the Lighthouse process started
+LHR_STAGES = {
+    "lh:runner:gather": "lh.gather",
+    "lh:gather:loadPage": "lh.load_page",
+    "lh:runner:audit": "lh.audit",
+    "lh:runner:generate": "lh.report",
+}
+
+
+class Tracer:
+    """
+    Wall-clock spans around every pipeline stage (Chrome launch, Lighthouse,
+    rename, parse, attach, save …), tagged with brand / page / mode / run.
+
+    Spans are kept in memory, exported as Chrome trace-event JSON (open in
+    chrome://tracing or Perfetto) and summarised per stage. Hooks receive
+    every finished span – e.g. to forward it to our own collector.
+
+    Off until configure() (TRACING.ENABLED) or a caller turns it on – spans
+    are kept for the whole process.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.spans = []
+        self.hooks = []
+        self._lock = threading.Lock()
+
+    def configure(self, cfg: dict):
+        t = cfg.get("TRACING", {})
+        self.enabled = t.get("ENABLED", False)
+        for target in t.get("HOOKS", []):
+            self.add_hook(self.load_hook(target))
+        return self
+
+    @staticmethod
+    def load_hook(target: str):
+        # "package.module:function"
+        module, _, attr = target.partition(":")
+        return getattr(importlib.import_module(module), attr)
+
+    def add_hook(self, hook):
+        """hook(span) is called for every finished span (dict, see record())."""
+        if hook not in self.hooks:
+            self.hooks.append(hook)
+
+    def remove_hook(self, hook):
+        if hook in self.hooks:
+            self.hooks.remove(hook)
+
+    def reset(self):
+        with self._lock:
+            self.spans = []
+
+    # ------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------
+    @contextmanager
+    def tags(self, **tags):
+        token = _TAGS.set({**_TAGS.get(), **{k: v for k, v in tags.items() if v is not None}})
+        try:
+            yield
+        finally:
+            _TAGS.reset(token)
+
+    @contextmanager
+    def span(self, name: str, **tags):
+        if not self.enabled:
+            yield None
+            return
+
+        # Epoch µs so traces of xdist workers line up when merged
+        start_us = time.time_ns() / 1000
+        t0 = time.perf_counter_ns()
+        try:
+            yield start_us
+        finally:
+            self.record(name, start_us, (time.perf_counter_ns() - t0) / 1000, {**_TAGS.get(), **tags})
+
+    def record(self, name: str, start_us: float, dur_us: float, tags: dict):
+        span = {
+            "name": name,
+            "ts": start_us,
+            "dur": dur_us,
+            "pid": os.getpid(),
+            "tid": tags.get("worker", -1) + 1,  # one lane per worker slot, lane 0 = test process
+            "tags": tags,
+        }
+        with self._lock:
+            self.spans.append(span)
+
+        for hook in self.hooks:
+            try:
+                hook(span)
+            except Exception:
+                pass  # a broken collector must not fail the run
+
+    def record_lhr_stages(self, start_us: float, entries, **tags):
+        """
+        Sub-spans from the report's own timing (lhr.timing.entries – page load,
+        audit …), placed under the run's "lighthouse" span that began at start_us.
+        """
+        if not self.enabled or start_us is None or not entries:
+            return
+
+        tags = {**_TAGS.get(), **{k: v for k, v in tags.items() if v is not None}}
+        for e in entries:
+            name = next((n for prefix, n in LHR_STAGES.items() if e.get("name", "").startswith(prefix)), None)
+            if name:
+                self.record(name, start_us + e["startTime"] * 1000, e["duration"] * 1000, dict(tags))
+
+    # ------------------------------------------------------
+    # Export
+    # ------------------------------------------------------
+    def chrome_trace(self):
+        with self._lock:
+            spans = list(self.spans)
+
+        events = [
+            {"name": s["name"], "cat": "lighthouse", "ph": "X", "ts": s["ts"], "dur": s["dur"],
+             "pid": s["pid"], "tid": s["tid"], "args": s["tags"]}
+            for s in spans
+        ]
+        lanes = {(s["pid"], s["tid"]) for s in spans}
+        events += [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+             "args": {"name": f"worker {tid - 1}" if tid else "tests"}}
+            for pid, tid in sorted(lanes)
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+        return path
+
+    def summary(self):
+        """{stage: {count, total_ms, mean_ms, p50_ms, p90_ms, max_ms}}, slowest total first."""
+        with self._lock:
+            spans = list(self.spans)
+
+        by_name = {}
+        for s in spans:
+            by_name.setdefault(s["name"], []).append(s["dur"] / 1000)
+
+        out = {
+            name: {
+                "count": len(ms),
+                "total_ms": round(sum(ms), 1),
+                "mean_ms": round(sum(ms) / len(ms), 1),
+                "p50_ms": round(percentile(ms, 50), 1),
+                "p90_ms": round(percentile(ms, 90), 1),
+                "max_ms": round(max(ms), 1),
+            }
+            for name, ms in by_name.items()
+        }
+        return dict(sorted(out.items(), key=lambda kv: -kv[1]["total_ms"]))
+
+    def summary_html(self):
+        columns = ("count", "total_ms", "mean_ms", "p50_ms", "p90_ms", "max_ms")
+        rows = "".join(
+            f"<tr><td>{name}</td>{''.join(f'<td>{stats[c]}</td>' for c in columns)}</tr>"
+            for name, stats in self.summary().items()
+        )
+        return f"""
+        <h3>⏱️ Pipeline stages (this session)</h3>
+        <table border='1' style='border-collapse:collapse;'>
+            <tr><th>Stage</th>{''.join(f'<th>{c}</th>' for c in columns)}</tr>
+            {rows}
+        </table>
+        <p>Spans overlap across workers – total_ms is busy time, not wall time.</p>
+        """
+
+
+TRACER = Tracer()